@@ -1,60 +1,114 @@
 """
 Analytics tools:
-- build_global_trace: map CSV trace addresses to global pages using SegmentationEngine
-- sweep: run offline FIFO, LRU, Optimal simulations over frames_min..frames_max and write analytics.csv
+- iter_global_trace: stream CSV trace addresses as global pages using SegmentationEngine
+- build_global_trace(_array): the same mapping, vectorized per chunk with seg_translate_batch
+- sweep: offline FIFO, LRU, Optimal fault counts over frames_min..frames_max, written to analytics.csv
+  (LRU: one O(n log n) pass; Optimal: one O(n * frames_max) pass; FIFO: one replay per
+  frame count; see Module_1_Paging_Engine/miss_ratio.py)
+- sweep_grid: traces x policies x frame counts on a process pool. Each global trace
+  is built once and saved as .npy; workers open it with mmap_mode="r" instead of
+  receiving it pickled, so they all share the file's pages, and the replays read it a
+  chunk at a time (see miss_ratio.CHUNK_SIZE) rather than copying it into a list.
+  Rows are appended to the CSV as tasks finish (completion order). Stack policies
+  (LRU, OPT) are one task per curve; every other policy is one full replay (task)
+  per frame count.
+  There is no allocator axis: global page ids come from the segmentation engine's page
+  registry, not from segment base addresses, so the allocator cannot change the
+  replays (only whether a segment fits). The one allocator used to build the traces
+  is recorded in the allocator column.
 """
 
 import csv
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
 import pandas as pd
 from Module_2_Segmentation_DemandPaging.segmentation_engine import SegmentationEngine
-from Module_1_Paging_Engine.paging_engine import PagingEngine
+from Module_1_Paging_Engine.miss_ratio import miss_ratio_curve, count_faults, STACK_POLICIES
+from Combined_Demo_Tool.trace_stream import (
+    iter_trace_rows, with_segments, iter_global_pages, iter_column_chunks, iter_global_page_batches,
+)
 import os
 
-def build_global_trace(trace_csv: str):
+def iter_global_trace(trace_csv: str) -> Iterator[int]:
+    """Stream global page ids for a trace; segments are created per pid on first sight."""
     se = SegmentationEngine(address_space_size=1<<20, allocator_algo="first_fit")
-    gtrace = []
-    # pre-scan pids to create segments
-    pids = set()
-    rows = []
-    with open(trace_csv, newline='') as csvfile:
-        r = csv.DictReader(csvfile)
-        for row in r:
-            row["pid"] = int(row["pid"])
-            row["segment"] = int(row["segment"])
-            row["segment_offset"] = int(row["segment_offset"])
-            rows.append(row)
-            pids.add(row["pid"])
-    for pid in sorted(pids):
-        se.create_segment(pid, seg_id=0, size_bytes=32*1024)
-    for row in rows:
-        trans = se.seg_translate(row["pid"], row["segment"], row["segment_offset"], mode="segmented-paging")
-        gtrace.append(trans["virtual_page"])
-    return gtrace
+    rows = with_segments(iter_trace_rows(trace_csv), se, size_bytes=32*1024)
+    return iter_global_pages(rows, se)
+
+def build_global_trace_array(trace_csv: str, allocator_algo: str = "first_fit") -> np.ndarray:
+    """Vectorized build: whole chunks go through SegmentationEngine.seg_translate_batch."""
+    se = SegmentationEngine(address_space_size=1<<20, allocator_algo=allocator_algo)
+    batches = list(iter_global_page_batches(iter_column_chunks(trace_csv), se, size_bytes=32*1024))
+    return np.concatenate(batches) if batches else np.zeros(0, dtype=np.int64)
+
+def build_global_trace(trace_csv: str) -> List[int]:
+    return build_global_trace_array(trace_csv).tolist()
 
 def sweep(trace_csv: str, frames_min=2, frames_max=8, out_csv="analytics.csv"):
     gtrace = build_global_trace(trace_csv)
+    # LRU and Optimal are stack algorithms: one pass yields faults for every frame count
+    # (O(n log n) for LRU, O(n * frames_max) for Optimal). FIFO is not (Belady's anomaly),
+    # so it is replayed once per frame count.
+    lru = miss_ratio_curve(gtrace, "LRU", max_frames=frames_max)
+    optimal = miss_ratio_curve(gtrace, "OPT", max_frames=frames_max)
+    fifo = {frames: count_faults(gtrace, frames, "FIFO") for frames in range(frames_min, frames_max+1)}
     rows = []
     for frames in range(frames_min, frames_max+1):
-        fifo_faults = PagingEngine.optimal_faults_for_trace(gtrace, frames_count=frames)  # here we reuse optimal function (intentionally)
-        # For demonstration: compute optimal exactly, compute FIFO and LRU by running simple simulation via PagingEngine
-        pe_fifo = PagingEngine(frames_count=frames, policy="FIFO")
-        pe_lru = PagingEngine(frames_count=frames, policy="LRU")
-        fifo_count = 0
-        lru_count = 0
-        for pg in gtrace:
-            if not pe_fifo.is_present(pg):
-                fifo_count += 1
-                pe_fifo.handle_page_load_request(pid=0, gpage=pg)
-            if not pe_lru.is_present(pg):
-                lru_count += 1
-                pe_lru.handle_page_load_request(pid=0, gpage=pg)
-        optimal_count = PagingEngine.optimal_faults_for_trace(gtrace, frames)
-        rows.append({"frames": frames, "fifo": fifo_count, "lru": lru_count, "optimal": optimal_count})
+        rows.append({"frames": frames, "fifo": fifo[frames], "lru": lru[frames], "optimal": optimal[frames]})
     df = pd.DataFrame(rows)
     df.to_csv(out_csv, index=False)
     print(f"Wrote {out_csv}")
 
+GRID_FIELDS = ["trace", "allocator", "policy", "frames", "accesses", "faults"]
+
+def _grid_task(npy_path: str, key: Tuple[str, str], policy: str, frames: Sequence[int]) -> List[Dict]:
+    # read-only memmap: every worker shares the page cache's copy of the trace
+    pages = np.load(npy_path, mmap_mode="r")
+    if policy in STACK_POLICIES:
+        curve = miss_ratio_curve(pages, policy, max_frames=max(frames))
+        faults = [curve[f] for f in frames]
+    else:
+        faults = [count_faults(pages, f, policy) for f in frames]
+    trace, allocator = key
+    return [{"trace": trace, "allocator": allocator, "policy": policy, "frames": f,
+             "accesses": len(pages), "faults": n} for f, n in zip(frames, faults)]
+
+def sweep_grid(traces: Sequence[str], policies: Sequence[str] = ("FIFO", "LRU", "OPT"),
+               frames: Sequence[int] = range(2, 9), allocator: str = "first_fit",
+               out_csv: str = "sweep.csv", workers: Optional[int] = None) -> int:
+    """Run the whole grid on a ProcessPoolExecutor(workers); returns the number of rows written."""
+    policies = [p.upper().replace("-", "") for p in policies]
+    frames = sorted(frames)
+    with tempfile.TemporaryDirectory(prefix="vm_sweep_") as tmp, open(out_csv, "w", newline="") as out:
+        writer = csv.DictWriter(out, fieldnames=GRID_FIELDS)
+        writer.writeheader()
+        tasks = []
+        for ti, trace in enumerate(traces):
+            npy_path = os.path.join(tmp, f"{ti}.npy")
+            np.save(npy_path, build_global_trace_array(trace, allocator_algo=allocator))
+            for policy in policies:
+                if policy in STACK_POLICIES:
+                    tasks.append((npy_path, (trace, allocator), policy, frames))
+                else:
+                    tasks.extend((npy_path, (trace, allocator), policy, [f]) for f in frames)
+        written = 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for fut in as_completed([pool.submit(_grid_task, *task) for task in tasks]):
+                rows = fut.result()
+                writer.writerows(rows)
+                out.flush()
+                written += len(rows)
+    print(f"Wrote {out_csv}")
+    return written
+
 if __name__ == "__main__":
-    trace = "Combined_Demo_Tool/traces/locality.csv" if len(sys.argv) < 2 else sys.argv[1]
-    sweep(trace)
+    if len(sys.argv) > 1 and sys.argv[1] == "grid":
+        # python -m Combined_Demo_Tool.analytics grid <trace.csv|trace.vmt>...
+        sweep_grid(sys.argv[2:] or ["Combined_Demo_Tool/traces/locality.csv"],
+                   policies=("FIFO", "LRU", "CLOCK", "ARC", "OPT"))
+    else:
+        trace = "Combined_Demo_Tool/traces/locality.csv" if len(sys.argv) < 2 else sys.argv[1]
+        sweep(trace)
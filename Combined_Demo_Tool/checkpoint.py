@@ -0,0 +1,84 @@
+"""
+Checkpoint / resume of a whole replay.
+
+A checkpoint is MAGIC followed by one pickle (highest protocol) of a state
+dict holding the live simulator objects - SegmentationEngine (segments,
+allocator free lists, page registry), PagingEngine (page table arrays,
+frames, replacer state, TLB) and the demand controller/prefetcher - plus
+the tick, the trace cursor and the run's counters. Pickling them in a
+single dump keeps shared references shared (the prefetcher and controller
+still point at the same PagingEngine after loading); the page table and
+frame tables are array-backed, so even multi-million-page states pickle as
+a few large buffers.
+
+The event log is part of the replay's output, so save_checkpoint also
+records the size of every file the event bus appends to (after a flush);
+restore_event_logs() cuts them back to that size, dropping the events
+emitted between the checkpoint and an interruption. Resuming therefore
+reproduces the uninterrupted events.log byte for byte. Binary logs
+(BinaryFileSink) are recorded as their record count plus intern tables:
+a sink still attached is rewound and keeps writing, a detached file is cut
+back and gets the checkpoint's trailer. Any other sink writing to a file
+(one with a `path`) cannot be restored, and saving raises ValueError.
+
+Files are written to a temporary name and renamed, so an interrupted
+checkpoint never replaces the previous good one. Checkpoints are pickles:
+only load files you wrote yourself.
+"""
+
+import os
+import pickle
+from typing import Any, Dict, Tuple
+from Module_1_Paging_Engine.event_bus import BUS, BufferedFileSink
+from Module_1_Paging_Engine.binary_events import BinaryFileSink, truncate_log
+from Module_1_Paging_Engine.clock import CLOCK
+
+MAGIC = b"VMSNAP01"
+
+def _event_log_sizes() -> Tuple[Dict[str, int], Dict[str, Dict[str, Any]]]:
+    """(JSON-lines log path -> size, binary log path -> {"count", "tables"}) for the BUS sinks."""
+    BUS.flush()
+    sizes = {}
+    binary = {}
+    for sink in BUS.sinks:
+        if isinstance(sink, BufferedFileSink):
+            sizes[sink.path] = os.path.getsize(sink.path) if os.path.exists(sink.path) else 0
+        elif isinstance(sink, BinaryFileSink):
+            binary[sink.writer.path] = {"count": sink.writer.count, "tables": sink.writer.tables()}
+        elif hasattr(sink, "path"):
+            raise ValueError(f"cannot checkpoint the event log of {type(sink).__name__} ({sink.path})")
+    return sizes, binary
+
+def save_checkpoint(path: str, state: Dict[str, Any]) -> None:
+    """Write state (plus the current tick and event-log sizes) to path."""
+    sizes, binary = _event_log_sizes()
+    snapshot = dict(state, tick=CLOCK.value, event_logs=sizes, binary_event_logs=binary)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+def load_checkpoint(path: str) -> Dict[str, Any]:
+    """Read a checkpoint; restores the tick clock and returns the state dict."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path}: not a simulator checkpoint")
+        state = pickle.load(f)
+    CLOCK.reset(state["tick"])
+    return state
+
+def restore_event_logs(state: Dict[str, Any]) -> None:
+    """Truncate event logs that grew past their checkpointed size."""
+    for path, size in state.get("event_logs", {}).items():
+        if os.path.exists(path) and os.path.getsize(path) > size:
+            with open(path, "r+b") as f:
+                f.truncate(size)
+    attached = {sink.writer.path: sink for sink in BUS.sinks if isinstance(sink, BinaryFileSink)}
+    for path, log in state.get("binary_event_logs", {}).items():
+        sink = attached.get(path)
+        if sink is not None:
+            # raises if the sink was reopened (and the file truncated) since the checkpoint
+            sink.writer.rewind(log["count"], log["tables"])
+        else:
+            truncate_log(path, log["count"], log["tables"])
@@ -0,0 +1,141 @@
+"""
+Incremental reader for events.log with running aggregates.
+
+EventTail remembers the byte offset it has consumed; each poll() reads only
+the bytes appended since (in bounded blocks), keeps an unterminated last line
+for the next poll, and folds every new event into:
+- recent: the last `recent` events
+- by_type / by_pid: event counts
+- buckets: per `bucket_ticks` ticks, access_request and page_fault counts,
+  so fault_rate_series() is the fault rate over time
+poll(max_bytes) bounds the work per call, so a UI can catch up with a huge
+log over several refreshes while staying responsive.
+If the file shrinks or is replaced (run_demo deletes it at start), the state
+is reset and the new file is read from the beginning. A recreated file can
+get the old inode back and a truncated one can regrow past the offset, so
+besides (st_dev, st_ino) each poll re-reads the file's first bytes and the
+bytes just before the offset and compares them with what was consumed
+(MARK_SIZE each). Unparseable lines are counted in bad_lines and skipped.
+"""
+
+import json
+import os
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+BLOCK_SIZE = 8 << 20
+MARK_SIZE = 64
+_DECODER = json.JSONDecoder()
+
+class EventTail:
+    def __init__(self, path: str, recent: int = 200, bucket_ticks: int = 100):
+        self.path = path
+        self.recent_size = recent
+        self.bucket_ticks = bucket_ticks
+        self.reset()
+
+    def reset(self) -> None:
+        self.offset = 0
+        self.size = 0
+        self.file_id: Optional[Tuple[int, int]] = None   # (st_dev, st_ino)
+        self.head = b""     # first bytes consumed
+        self.mark = b""     # last bytes consumed, ending at offset
+        self.partial = b""
+        self.total = 0
+        self.bad_lines = 0
+        self.recent: Deque[Dict[str, Any]] = deque(maxlen=self.recent_size)
+        self.by_type: Counter = Counter()
+        self.by_pid: Counter = Counter()
+        # bucket index -> [accesses, faults]
+        self.buckets: Dict[int, List[int]] = {}
+
+    def poll(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Consume what was appended since the last poll (at most about max_bytes of
+        it, see behind); returns the number of new events.
+        """
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            if self.offset:
+                self.reset()
+            return 0
+        with f:
+            st = os.fstat(f.fileno())
+            if not self._same_file(f, st):
+                self.reset()
+                self.file_id = (st.st_dev, st.st_ino)
+            self.size = st.st_size
+            budget = max_bytes if max_bytes is not None else st.st_size
+            added = 0
+            f.seek(self.offset)
+            while budget > 0:
+                block = f.read(min(BLOCK_SIZE, budget))
+                budget -= len(block)
+                if not block:
+                    break
+                self.offset += len(block)
+                if len(self.head) < MARK_SIZE:
+                    self.head = (self.head + block)[:MARK_SIZE]
+                self.mark = (self.mark + block)[-MARK_SIZE:]
+                complete, _, self.partial = (self.partial + block).rpartition(b"\n")
+                if complete:
+                    added += self._add_lines(complete.decode("utf-8", errors="replace").split("\n"))
+        return added
+
+    def _same_file(self, f, st: os.stat_result) -> bool:
+        """Whether f is still the file consumed so far, unchanged up to offset."""
+        if (st.st_dev, st.st_ino) != self.file_id or st.st_size < self.offset:
+            return False
+        if not self.offset:
+            return True
+        if f.read(len(self.head)) != self.head:
+            return False
+        f.seek(self.offset - len(self.mark))
+        return f.read(len(self.mark)) == self.mark
+
+    def _add_lines(self, lines: List[str]) -> int:
+        decode = _DECODER.decode
+        recent, by_type, by_pid, buckets = self.recent, self.by_type, self.by_pid, self.buckets
+        width = self.bucket_ticks
+        added = 0
+        for line in lines:
+            if not line or line.isspace():
+                continue
+            try:
+                ev = decode(line)
+            except ValueError:
+                self.bad_lines += 1
+                continue
+            if not isinstance(ev, dict):
+                self.bad_lines += 1
+                continue
+            added += 1
+            recent.append(ev)
+            etype = ev.get("type")
+            by_type[etype] += 1
+            pid = ev.get("pid")
+            if pid is not None:
+                by_pid[pid] += 1
+            if etype == "access_request" or etype == "page_fault":
+                t = ev.get("time")
+                if isinstance(t, int):
+                    bucket = buckets.get(t // width)
+                    if bucket is None:
+                        bucket = buckets[t // width] = [0, 0]
+                    bucket[etype == "page_fault"] += 1
+        self.total += added
+        return added
+
+    @property
+    def behind(self) -> int:
+        """Bytes known to be in the file but not consumed yet (as of the last poll)."""
+        return max(0, self.size - self.offset)
+
+    def fault_rate_series(self) -> List[Tuple[int, int, int, float]]:
+        """(bucket start tick, accesses, faults, faults / accesses) in tick order."""
+        series = []
+        for b in sorted(self.buckets):
+            accesses, faults = self.buckets[b]
+            series.append((b * self.bucket_ticks, accesses, faults, faults / accesses if accesses else 0.0))
+        return series
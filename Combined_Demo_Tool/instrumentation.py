@@ -0,0 +1,162 @@
+"""
+Hot-path instrumentation: per-stage call counters and perf_counter_ns timers.
+
+Stages:
+- seg_translate: SegmentationEngine.seg_translate
+- tlb_lookup: TLB.lookup
+- page_load: PagingEngine.handle_page_load_request
+- pick_victim: every replacer's pick_victim
+- emit_event: the shared event bus's emit (both modules' emit_event end there)
+
+Nothing is wrapped while disabled, so the disabled cost is zero: enable()
+swaps counting (and, with timers=True, timing) wrappers onto the classes
+and disable() puts the originals back. Timers are inclusive; page_load
+contains the pick_victim and emit_event time of the faults it handles.
+
+snapshot() / to_json() export {"enabled", "timers", "stages": {name:
+{"calls", "total_ns", "mean_ns"}}}. profile_replay() runs any callable
+(e.g. run_demo.run) under cProfile and tracemalloc.
+"""
+
+import cProfile
+import functools
+import io
+import json
+import pstats
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from Module_1_Paging_Engine.event_bus import BUS
+from Module_1_Paging_Engine.paging_engine import PagingEngine
+from Module_1_Paging_Engine.replacement_algorithms import REPLACERS
+from Module_1_Paging_Engine.tlb import TLB
+from Module_2_Segmentation_DemandPaging.segmentation_engine import SegmentationEngine
+
+STAGES = ("seg_translate", "tlb_lookup", "page_load", "pick_victim", "emit_event")
+
+def _targets() -> List[Tuple[str, Any, str]]:
+    """(stage, owner, attribute) for every patch point."""
+    targets = [
+        ("seg_translate", SegmentationEngine, "seg_translate"),
+        ("tlb_lookup", TLB, "lookup"),
+        ("page_load", PagingEngine, "handle_page_load_request"),
+        ("emit_event", BUS, "emit"),
+    ]
+    targets += [("pick_victim", cls, "pick_victim") for cls in REPLACERS.values()]
+    return targets
+
+class Instrumentation:
+    def __init__(self):
+        self.calls: Dict[str, int] = dict.fromkeys(STAGES, 0)
+        self.total_ns: Dict[str, int] = dict.fromkeys(STAGES, 0)
+        self.timers = False
+        # (owner, attribute, original or None when the attribute was not set on owner itself)
+        self._saved: List[Tuple[Any, str, Optional[Any]]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._saved)
+
+    def _wrap(self, stage: str, fn: Callable) -> Callable:
+        calls = self.calls
+        if not self.timers:
+            @functools.wraps(fn)
+            def counted(*args, **kwargs):
+                calls[stage] += 1
+                return fn(*args, **kwargs)
+            return counted
+        total_ns = self.total_ns
+        clock = time.perf_counter_ns
+
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                total_ns[stage] += clock() - start
+                calls[stage] += 1
+        return timed
+
+    def enable(self, timers: bool = True) -> "Instrumentation":
+        if self.enabled:
+            self.disable()
+        self.timers = timers
+        for stage, owner, attr in _targets():
+            own = attr in vars(owner)
+            self._saved.append((owner, attr, vars(owner)[attr] if own else None))
+            # getattr gives a plain function for classes and a bound method for BUS
+            setattr(owner, attr, self._wrap(stage, getattr(owner, attr)))
+        return self
+
+    def disable(self) -> None:
+        for owner, attr, original in reversed(self._saved):
+            if original is None:
+                delattr(owner, attr)
+            else:
+                setattr(owner, attr, original)
+        self._saved.clear()
+
+    def reset(self) -> None:
+        for stage in STAGES:
+            self.calls[stage] = 0
+            self.total_ns[stage] = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        stages = {}
+        for stage in STAGES:
+            n = self.calls[stage]
+            entry: Dict[str, Any] = {"calls": n}
+            if self.timers:
+                ns = self.total_ns[stage]
+                entry.update(total_ns=ns, mean_ns=ns / n if n else 0.0)
+            stages[stage] = entry
+        return {"enabled": self.enabled, "timers": self.timers, "stages": stages}
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def __enter__(self) -> "Instrumentation":
+        if not self.enabled:
+            self.enable(self.timers)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.disable()
+
+INSTRUMENTATION = Instrumentation()
+
+def enable(timers: bool = True) -> Instrumentation:
+    return INSTRUMENTATION.enable(timers)
+
+def disable() -> None:
+    INSTRUMENTATION.disable()
+
+def snapshot() -> Dict[str, Any]:
+    return INSTRUMENTATION.snapshot()
+
+def profile_replay(fn: Callable, *args, sort: str = "cumulative", limit: int = 25,
+                   trace_memory: bool = True, profile_out: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+    """
+    Call fn(*args, **kwargs) under cProfile (and tracemalloc when trace_memory).
+    Returns {"result", "profile": top `limit` pstats lines sorted by `sort`,
+    "memory": {"peak_kb", "top": largest allocation sites}}; profile_out saves the raw .prof.
+    """
+    prof = cProfile.Profile()
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        result = prof.runcall(fn, *args, **kwargs)
+        memory = None
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            top = tracemalloc.take_snapshot().statistics("lineno")[:limit]
+            memory = {"peak_kb": peak // 1024, "top": [str(s) for s in top]}
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    if profile_out:
+        prof.dump_stats(profile_out)
+    out = io.StringIO()
+    pstats.Stats(prof, stream=out).sort_stats(sort).print_stats(limit)
+    return {"result": result, "profile": out.getvalue(), "memory": memory}
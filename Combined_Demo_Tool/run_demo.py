@@ -1,65 +1,113 @@
 """
 Demo runner:
 - Reads CSV trace file with header: time,pid,mode,segment,segment_offset,access_type
-- Instantiates SegmentationEngine, PagingEngine (LRU default), DemandController
-- Pre-creates a default 32KB segment per pid discovered
+- Instantiates SegmentationEngine, PagingEngine (LRU default, 8-entry 2-way TLB), DemandController
+- Streams the trace and creates a default 32KB segment per pid on first sight
 - Emits access_request events, translates, and does demand paging where needed
 - Emits analytics_summary at end
+- With --async, pids are replayed concurrently through AsyncDemandController
+  so their simulated disk latencies overlap (event order then interleaves by pid)
+- With --prefetch, a ReadaheadPrefetcher loads sequential/strided pages ahead
+- With --checkpoint-every N, the full simulator state is saved to vm_checkpoint.bin every
+  N accesses; --resume-from <file> continues that replay, producing the same events.log
+  as an uninterrupted run (see checkpoint.py; not available with --async). Resuming
+  checks that the trace file has the checkpointed path and size
+- With --stats, prints per-stage call counts and timings (instrumentation.py) as JSON;
+  with --profile, prints the top cProfile entries and tracemalloc's peak
 """
 
-import csv
+import asyncio
 import sys
 from Module_2_Segmentation_DemandPaging.segmentation_engine import SegmentationEngine
 from Module_1_Paging_Engine.paging_engine import PagingEngine
-from Module_2_Segmentation_DemandPaging.demand_controller import DemandController
+from Module_1_Paging_Engine.tlb import TLB
+from Module_2_Segmentation_DemandPaging.demand_controller import DemandController, AsyncDemandController, replay_per_pid
+from Module_2_Segmentation_DemandPaging.prefetcher import ReadaheadPrefetcher
 from Module_2_Segmentation_DemandPaging import events as seg_events
 from Module_2_Segmentation_DemandPaging import utils as seg_utils
 from Module_1_Paging_Engine import utils as m1_utils
+from Module_1_Paging_Engine import event_bus
+from Module_1_Paging_Engine.clock import CLOCK
+from Combined_Demo_Tool.trace_stream import iter_trace_rows, with_segments
+from Combined_Demo_Tool.checkpoint import save_checkpoint, load_checkpoint, restore_event_logs
+from typing import Optional
 import os
 
-def run(trace_path: str):
-    # clear events.log and tick file for deterministic run
-    evt = os.path.join(os.getcwd(), "events.log")
-    tickf = os.path.join(os.getcwd(), "vm_tick.json")
-    for f in (evt, tickf):
-        if os.path.exists(f):
-            os.remove(f)
-
-    # read trace to discover PIDs
-    pids = set()
-    rows = []
-    with open(trace_path, newline='') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for r in reader:
-            r["pid"] = int(r["pid"])
-            r["segment"] = int(r["segment"])
-            r["segment_offset"] = int(r["segment_offset"])
-            rows.append(r)
-            pids.add(r["pid"])
+def _translated(rows, seg_engine):
+    """Emit access_request and translate each row; yields (pid, global_page, access_type)."""
+    for r in rows:
+        seg_events.emit_access_request(r["pid"], r["mode"], r["segment"], r["segment_offset"], r["access_type"])
+        trans = seg_engine.seg_translate(r["pid"], r["segment"], r["segment_offset"], mode="segmented-paging")
+        yield r["pid"], trans["virtual_page"], r["access_type"]
 
-    # instantiate engines
-    seg_engine = SegmentationEngine(address_space_size=1<<20, allocator_algo="first_fit")
-    paging = PagingEngine(frames_count=4, page_size=4096, policy="LRU")
-    dc = DemandController(paging, disk_latency_s=0.01)
+def run(trace_path: str, concurrent: bool = False, prefetch: bool = False,
+        checkpoint_every: int = 0, checkpoint_path: str = "vm_checkpoint.bin", resume_from: Optional[str] = None):
+    if concurrent and (checkpoint_every or resume_from):
+        raise ValueError("checkpoints are only supported for the sequential replay")
+    tickf = os.path.join(os.getcwd(), "vm_tick.json")
+    if resume_from:
+        # continue a checkpointed replay; the tick clock and event logs go back to the checkpoint
+        state = load_checkpoint(resume_from)
+        trace = (os.path.abspath(trace_path), os.path.getsize(trace_path))
+        if (state.get("trace_path"), state.get("trace_size")) != trace:
+            raise ValueError(f"{resume_from} was written for {state.get('trace_path')} "
+                             f"({state.get('trace_size')} bytes), not {trace[0]} ({trace[1]} bytes)")
+        restore_event_logs(state)
+        seg_engine, paging, dc = state["seg_engine"], state["paging"], state["controller"]
+        prefetcher = dc.prefetcher
+        cursor = state["cursor"]
+        total_accesses, total_page_faults = state["total_accesses"], state["total_page_faults"]
+    else:
+        # clear events.log and tick file for deterministic run
+        event_bus.BUS.flush()
+        evt = os.path.join(os.getcwd(), "events.log")
+        for f in (evt, tickf):
+            if os.path.exists(f):
+                os.remove(f)
+        CLOCK.reset()
 
-    # pre-create default 32KB segment per pid (seg_id 0)
-    for pid in sorted(pids):
-        seg_engine.create_segment(pid, seg_id=0, size_bytes=32*1024)
+        # instantiate engines
+        seg_engine = SegmentationEngine(address_space_size=1<<20, allocator_algo="first_fit")
+        paging = PagingEngine(frames_count=4, page_size=4096, policy="LRU",
+                              tlb=TLB(size=8, associativity=2))
+        prefetcher = ReadaheadPrefetcher(paging, seg_engine.registry) if prefetch else None
+        dc = None
+        cursor = 0
+        total_accesses = 0
+        total_page_faults = 0
 
-    total_accesses = 0
-    total_page_faults = 0
+    # rows are parsed lazily; a default 32KB segment (seg_id 0) is created per pid on first sight
+    rows = with_segments(iter_trace_rows(trace_path, start=cursor), seg_engine, size_bytes=32*1024)
 
-    for r in rows:
-        total_accesses += 1
-        seg_events.emit_access_request(r["pid"], r["mode"], r["segment"], r["segment_offset"], r["access_type"])
-        trans = seg_engine.seg_translate(r["pid"], r["segment"], r["segment_offset"], mode="segmented-paging")
-        # request page via demand controller
-        gpage = trans["virtual_page"]
-        res = dc.request_page(r["pid"], gpage, access_type=r["access_type"])
-        if res["status"] == "loaded":
-            total_page_faults += 1
+    trace_size = os.path.getsize(trace_path)
+    if concurrent:
+        adc = AsyncDemandController(paging, disk_latency_s=0.01, prefetcher=prefetcher)
+        counts = asyncio.run(replay_per_pid(adc, _translated(rows, seg_engine)))
+        total_accesses = counts["accesses"]
+        total_page_faults = counts["page_faults"]
+    else:
+        if dc is None:
+            dc = DemandController(paging, disk_latency_s=0.01, prefetcher=prefetcher)
+        for r in rows:
+            total_accesses += 1
+            seg_events.emit_access_request(r["pid"], r["mode"], r["segment"], r["segment_offset"], r["access_type"])
+            trans = seg_engine.seg_translate(r["pid"], r["segment"], r["segment_offset"], mode="segmented-paging")
+            # request page via demand controller
+            gpage = trans["virtual_page"]
+            res = dc.request_page(r["pid"], gpage, access_type=r["access_type"])
+            if res["status"] == "loaded":
+                total_page_faults += 1
+            if checkpoint_every and total_accesses % checkpoint_every == 0:
+                save_checkpoint(checkpoint_path, {
+                    "trace_path": os.path.abspath(trace_path), "trace_size": trace_size, "cursor": total_accesses,
+                    "total_accesses": total_accesses, "total_page_faults": total_page_faults,
+                    "seg_engine": seg_engine, "paging": paging, "controller": dc,
+                })
 
     # emit analytics summary
+    print(f"TLB: {paging.tlb.stats()}")
+    if prefetcher is not None:
+        print(f"Prefetch: {prefetcher.stats}")
     summary = {
         "type": "analytics_summary",
         "total_accesses": total_accesses,
@@ -67,10 +115,34 @@ def run(trace_path: str):
         "frames": paging.frames_count
     }
     m1_utils.emit_event(summary)
+    event_bus.BUS.flush()
+    CLOCK.checkpoint(tickf)
     print("Demo complete. Events written to events.log")
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python Combined_Demo_Tool/run_demo.py <trace.csv>")
+    flags = {"--async", "--prefetch", "--stats", "--profile"}
+    argv = sys.argv[1:]
+    opts = {"concurrent": "--async" in argv, "prefetch": "--prefetch" in argv}
+    # options with a value
+    for opt, key, conv in (("--checkpoint-every", "checkpoint_every", int), ("--resume-from", "resume_from", str)):
+        if opt in argv:
+            i = argv.index(opt)
+            opts[key] = conv(argv[i + 1])
+            del argv[i:i + 2]
+    args = [a for a in argv if a not in flags]
+    if len(args) < 1:
+        print("Usage: python Combined_Demo_Tool/run_demo.py <trace.csv|trace.vmt> [--async] [--prefetch] [--stats] [--profile]"
+              " [--checkpoint-every N] [--resume-from vm_checkpoint.bin]")
         sys.exit(1)
-    run(sys.argv[1])
+    if "--stats" in argv or "--profile" in argv:
+        from Combined_Demo_Tool import instrumentation
+        if "--profile" in argv:
+            report = instrumentation.profile_replay(run, args[0], **opts)
+            print(report["profile"])
+            print(f"tracemalloc peak: {report['memory']['peak_kb']} KiB")
+        else:
+            with instrumentation.enable(timers=True) as inst:
+                run(args[0], **opts)
+            print(inst.to_json())
+    else:
+        run(args[0], **opts)
@@ -0,0 +1,21 @@
+import csv
+from pathlib import Path
+from Combined_Demo_Tool.analytics import sweep_grid, build_global_trace
+from Module_1_Paging_Engine.miss_ratio import count_faults
+
+TRACES = Path(__file__).resolve().parents[1] / "traces"
+
+def test_sweep_grid_matches_serial_replay(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    traces = [str(TRACES / "locality.csv"), str(TRACES / "mixed_multi.csv")]
+    out = tmp_path / "grid.csv"
+    n = sweep_grid(traces, policies=("FIFO", "LRU", "CLOCK"), frames=[2, 3, 5],
+                   allocator="buddy", out_csv=str(out), workers=2)
+    with open(out, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert n == len(rows) == 2 * 3 * 3
+    for r in rows:
+        gtrace = build_global_trace(r["trace"])
+        assert int(r["accesses"]) == len(gtrace)
+        assert int(r["faults"]) == count_faults(gtrace, int(r["frames"]), r["policy"])
+    assert {r["allocator"] for r in rows} == {"buddy"}
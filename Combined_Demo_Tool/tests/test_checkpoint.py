@@ -0,0 +1,101 @@
+from pathlib import Path
+import pytest
+from Combined_Demo_Tool.run_demo import run
+from Combined_Demo_Tool.checkpoint import load_checkpoint, save_checkpoint, restore_event_logs
+from Module_1_Paging_Engine.event_bus import BUS, BufferedFileSink, EventSink
+from Module_1_Paging_Engine.binary_events import BinaryEventLog, BinaryFileSink
+
+TRACE = str(Path(__file__).resolve().parents[1] / "traces" / "mixed_multi.csv")
+
+def test_resume_reproduces_uninterrupted_events(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    log = tmp_path / "events.log"
+    saved = list(BUS.sinks)
+    BUS.set_sinks([BufferedFileSink(str(log))])
+    try:
+        run(TRACE, prefetch=True)
+        full = log.read_bytes()
+        # checkpointing does not disturb the replay
+        run(TRACE, prefetch=True, checkpoint_every=25, checkpoint_path="ck.bin")
+        assert log.read_bytes() == full
+        state = load_checkpoint("ck.bin")
+        assert state["cursor"] == 50 and state["controller"].paging_engine is state["paging"]
+        assert state["controller"].prefetcher is not None
+        # events written after the checkpoint (the run "crashed") are dropped on resume
+        with open(log, "a") as f:
+            f.write('{"type": "stale"}\n')
+        run(TRACE, resume_from="ck.bin")
+        assert log.read_bytes() == full
+    finally:
+        BUS.set_sinks(saved)
+
+def test_rejects_foreign_files(tmp_path):
+    bad = tmp_path / "x.bin"
+    bad.write_bytes(b"not a checkpoint")
+    with pytest.raises(ValueError):
+        load_checkpoint(str(bad))
+    save_checkpoint(str(tmp_path / "ok.bin"), {"cursor": 3})
+    assert load_checkpoint(str(tmp_path / "ok.bin"))["cursor"] == 3
+    with pytest.raises(ValueError):
+        run(TRACE, concurrent=True, resume_from=str(tmp_path / "ok.bin"))
+
+class _PathSink(EventSink):
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, event):
+        pass
+
+def _binary_run(path, **kwargs):
+    sink = BinaryFileSink(str(path))
+    BUS.set_sinks([sink])
+    run(TRACE, **kwargs)
+    BUS.set_sinks([])
+    sink.close()
+    return list(BinaryEventLog(str(path)))
+
+def test_resume_rewinds_binary_event_logs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    saved = list(BUS.sinks)
+    try:
+        full = _binary_run(tmp_path / "full.bin")
+        log = tmp_path / "events.bin"
+        sink = BinaryFileSink(str(log))
+        BUS.set_sinks([sink])
+        run(TRACE, checkpoint_every=25, checkpoint_path="ck.bin")
+        # the attached sink is rewound to the checkpoint and keeps writing
+        run(TRACE, resume_from="ck.bin")
+        BUS.set_sinks([])
+        sink.close()
+        assert list(BinaryEventLog(str(log))) == full
+        # a detached log is cut back to the checkpoint, with the checkpoint's tables
+        restore_event_logs(load_checkpoint("ck.bin"))
+        cut = list(BinaryEventLog(str(log)))
+        assert 0 < len(cut) < len(full) and cut == full[:len(cut)]
+        # a sink opened after the checkpoint truncated the file: the older events are gone
+        with pytest.raises(ValueError):
+            _binary_run(log, resume_from="ck.bin")
+        BUS.set_sinks([_PathSink(str(tmp_path / "other.log"))])
+        with pytest.raises(ValueError):
+            run(TRACE, checkpoint_every=25, checkpoint_path="ck2.bin")
+    finally:
+        BUS.set_sinks(saved)
+
+def test_resume_rejects_another_trace(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    saved = list(BUS.sinks)
+    BUS.set_sinks([BufferedFileSink(str(tmp_path / "events.log"))])
+    try:
+        run(TRACE, checkpoint_every=25, checkpoint_path="ck.bin")
+        other = tmp_path / "other.csv"
+        other.write_bytes(Path(TRACE).read_bytes())
+        with pytest.raises(ValueError):
+            run(str(other), resume_from="ck.bin")
+        # same path, different length
+        state = load_checkpoint("ck.bin")
+        state["trace_size"] += 1
+        save_checkpoint("ck.bin", state)
+        with pytest.raises(ValueError):
+            run(TRACE, resume_from="ck.bin")
+    finally:
+        BUS.set_sinks(saved)
@@ -0,0 +1,72 @@
+import json
+import os
+from Combined_Demo_Tool.event_tail import EventTail
+
+def _line(**ev):
+    return json.dumps(ev, sort_keys=True) + "\n"
+
+def test_tail_reads_only_new_bytes_and_keeps_partial_lines(tmp_path):
+    log = tmp_path / "events.log"
+    tail = EventTail(str(log), recent=3, bucket_ticks=10)
+    assert tail.poll() == 0 and tail.total == 0
+    with open(log, "w") as f:
+        f.write(_line(type="access_request", pid=1, time=1) + _line(type="page_fault", pid=1, page=4, time=2))
+        f.write('{"type": "access_req')
+    assert tail.poll() == 2 and tail.offset == os.path.getsize(log)
+    with open(log, "a") as f:
+        f.write('uest", "pid": 2, "time": 12}\n' + "not json\n" + _line(type="analytics_summary", time=13))
+    assert tail.poll() == 2 and tail.bad_lines == 1
+    assert tail.poll() == 0
+    assert tail.by_type == {"access_request": 2, "page_fault": 1, "analytics_summary": 1}
+    assert tail.by_pid == {1: 2, 2: 1}
+    assert [e["time"] for e in tail.recent] == [2, 12, 13]
+    assert tail.fault_rate_series() == [(0, 1, 1, 1.0), (10, 1, 0, 0.0)]
+
+def test_tail_restarts_on_truncate_or_replace(tmp_path):
+    log = tmp_path / "events.log"
+    log.write_text(_line(type="page_in", pid=1, time=1) * 5)
+    tail = EventTail(str(log))
+    assert tail.poll() == 5
+    log.write_text(_line(type="page_out", pid=3, time=1))
+    assert tail.poll() == 1 and tail.by_type == {"page_out": 1}
+    # deleted and recreated (as run_demo does): the new file is read from its start
+    os.remove(log)
+    assert tail.poll() == 0 and tail.total == 0
+    log.write_text(_line(type="page_in", pid=2, time=1) * 2)
+    assert tail.poll() == 2 and tail.by_pid == {2: 2}
+
+def test_poll_budget_catches_up_over_several_calls(tmp_path):
+    log = tmp_path / "events.log"
+    line = _line(type="access_request", pid=1, time=5)
+    log.write_text(line * 100)
+    tail = EventTail(str(log))
+    first = tail.poll(max_bytes=len(line) * 30 + 7)
+    assert first == 30 and tail.behind == len(line) * 70 - 7
+    while tail.behind:
+        tail.poll(max_bytes=len(line) * 30)
+    assert tail.total == 100 and tail.fault_rate_series() == [(0, 100, 0, 0.0)]
+
+def test_tail_detects_rewrite_behind_the_offset(tmp_path):
+    log = tmp_path / "events.log"
+    log.write_text(_line(type="page_in", pid=1, time=1) * 3)
+    tail = EventTail(str(log))
+    assert tail.poll() == 3
+    # recreated with the same inode and a larger size (ext4 hands freed inodes back out)
+    ino = os.stat(log).st_ino
+    with open(log, "w") as f:
+        f.write(_line(type="page_out", pid=2, time=7) * 4)
+    assert os.stat(log).st_ino == ino
+    assert tail.poll() == 4 and tail.by_type == {"page_out": 4}
+    # cut back to a checkpointed size and regrown past the offset with other events
+    keep = len(_line(type="page_out", pid=2, time=7))
+    with open(log, "r+b") as f:
+        f.truncate(keep)
+    with open(log, "a") as f:
+        f.write(_line(type="page_in", pid=5, time=9) * 5)
+    assert tail.poll() == 6 and tail.by_type == {"page_out": 1, "page_in": 5}
+    # regrown with the very same bytes (a resumed replay): nothing to redo
+    with open(log, "r+b") as f:
+        f.truncate(keep)
+    with open(log, "a") as f:
+        f.write(_line(type="page_in", pid=5, time=9) * 6)
+    assert tail.poll() == 1 and tail.total == 7
@@ -0,0 +1,48 @@
+import json
+from Combined_Demo_Tool.instrumentation import Instrumentation, profile_replay
+from Module_1_Paging_Engine.event_bus import BUS, RingBufferSink
+from Module_1_Paging_Engine.paging_engine import PagingEngine
+from Module_1_Paging_Engine.replacement_algorithms import LRUReplacer
+from Module_1_Paging_Engine.tlb import TLB
+from Module_2_Segmentation_DemandPaging.segmentation_engine import SegmentationEngine
+
+def _replay():
+    se = SegmentationEngine(address_space_size=1 << 20)
+    se.create_segment(1, 0, 4 * 4096)
+    pe = PagingEngine(frames_count=2, policy="LRU", tlb=TLB(size=4))
+    for off in (0, 4096, 0, 8192, 12288, 0):
+        pe.translate(1, se.seg_translate(1, 0, off)["virtual_page"])
+    return pe
+
+def test_counts_timers_and_restore(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    sink = BUS.add_sink(RingBufferSink())
+    originals = (PagingEngine.handle_page_load_request, LRUReplacer.pick_victim, TLB.lookup)
+    try:
+        inst = Instrumentation()
+        with inst.enable(timers=True):
+            assert inst.enabled and "emit" in vars(BUS)
+            _replay()
+        snap = json.loads(inst.to_json())
+    finally:
+        BUS.remove_sink(sink)
+    stages = snap["stages"]
+    assert (stages["seg_translate"]["calls"], stages["tlb_lookup"]["calls"]) == (6, 6)
+    # 0 1 0 2 3 0 on 2 LRU frames: only the second access to 0 hits (in the TLB); 3 victims
+    assert (stages["page_load"]["calls"], stages["pick_victim"]["calls"]) == (5, 3)
+    assert stages["emit_event"]["calls"] == len(sink.events)
+    assert stages["page_load"]["total_ns"] > 0 and not snap["enabled"]
+    assert (PagingEngine.handle_page_load_request, LRUReplacer.pick_victim, TLB.lookup) == originals
+    assert "emit" not in vars(BUS)
+    # counters only
+    inst.reset()
+    with inst.enable(timers=False):
+        _replay()
+    assert inst.snapshot()["stages"]["page_load"] == {"calls": 5}
+
+def test_profile_replay(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    report = profile_replay(_replay, limit=50)
+    assert isinstance(report["result"], PagingEngine)
+    assert "handle_page_load_request" in report["profile"]
+    assert report["memory"]["peak_kb"] >= 0 and report["memory"]["top"]
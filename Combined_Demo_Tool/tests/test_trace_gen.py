@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from Combined_Demo_Tool.trace_gen import generate_chunks, global_pages, parse_phases, write_csv, write_vmt
+from Combined_Demo_Tool.trace_stream import iter_trace_rows
+
+def _concat(chunks):
+    chunks = list(chunks)
+    return {k: np.concatenate([c[k] for c in chunks]) for k in chunks[0]}
+
+def test_seeded_and_chunk_independent_shape():
+    a = _concat(generate_chunks(5000, "zipf", seed=3, chunk_size=700))
+    b = _concat(generate_chunks(5000, "zipf", seed=3, chunk_size=700))
+    assert all(np.array_equal(a[k], b[k]) for k in a)
+    assert a["time"].tolist() == list(range(1, 5001))
+    assert set(a["pid"].tolist()) == {1, 2, 3, 4}
+    assert a["segment_offset"].max() < 8 * 4096
+    # Zipf concentrates on a hot page; about 30% writes by default
+    counts = np.bincount(a["segment_offset"] // 4096, minlength=8)
+    assert counts.max() > 2 * counts.min()
+    assert 0.25 < a["access_type"].mean() < 0.35
+
+def test_loop_sequential_and_phase_shift():
+    loop = _concat(generate_chunks(400, "loop", pids=1, segment_pages=8, loop_pages=3, write_ratio=0))
+    assert (loop["segment_offset"] // 4096).tolist()[:7] == [0, 1, 2, 0, 1, 2, 0]
+    assert loop["access_type"].sum() == 0
+    seq = _concat(generate_chunks(phases=parse_phases("sequential:16,loop:40"), pids=2, segment_pages=8,
+                                  loop_pages=2, seed=1))
+    pages = global_pages(seq, segment_pages=8)
+    first = pages[:16][seq["pid"][:16] == 1] % 8
+    assert all((b - a) % 8 == 1 for a, b in zip(first, first[1:]))
+    # the loop phase cycles over the same 2 (shifted) pages for every pid
+    later = {p % 8 for p in pages[16:].tolist()}
+    assert len(later) == 2
+    with pytest.raises(ValueError):
+        parse_phases("scan:10")
+
+def test_every_pid_walks_on_across_chunks():
+    # 7 pids, chunks of 50 rows: each pid's pages continue where its previous chunk stopped
+    seq = _concat(generate_chunks(1000, "sequential", pids=7, segment_pages=5, seed=4, chunk_size=50))
+    pages = seq["segment_offset"] // 4096
+    for pid in range(1, 8):
+        assert (pages[seq["pid"] == pid] == np.arange(np.count_nonzero(seq["pid"] == pid)) % 5).all()
+
+def test_csv_and_vmt_writers_agree(tmp_path):
+    csv_path, vmt_path = str(tmp_path / "t.csv"), str(tmp_path / "t.vmt")
+    phases = parse_phases("zipf:300,uniform:200")
+    assert write_csv(generate_chunks(phases=phases, seed=9, chunk_size=128), csv_path) == 500
+    assert write_vmt(generate_chunks(phases=phases, seed=9, chunk_size=128), vmt_path, 500) == 500
+    rows = list(iter_trace_rows(csv_path))
+    assert rows == list(iter_trace_rows(vmt_path))
+    assert rows[0]["mode"] == "segmented-paging" and {r["access_type"] for r in rows} == {"R", "W"}
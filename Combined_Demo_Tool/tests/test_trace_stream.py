@@ -0,0 +1,37 @@
+from pathlib import Path
+from Combined_Demo_Tool.trace_stream import iter_trace_chunks, iter_trace_rows, with_segments, iter_global_pages
+from Module_2_Segmentation_DemandPaging.segmentation_engine import SegmentationEngine
+
+TRACES = Path(__file__).resolve().parents[1] / "traces"
+
+def test_chunks_parse_lazily():
+    chunks = list(iter_trace_chunks(str(TRACES / "mixed_multi.csv"), chunk_size=16))
+    assert [len(c) for c in chunks] == [16, 16, 16, 12]
+    row = chunks[0][0]
+    assert row == {"time": 1, "pid": 1, "mode": "segmented-paging", "segment": 0, "segment_offset": 0, "access_type": "R"}
+
+def test_segments_created_on_first_sight(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    se = SegmentationEngine(address_space_size=1<<20)
+    rows = with_segments(iter_trace_rows(str(TRACES / "mixed_multi.csv")), se)
+    first = next(rows)
+    assert first["pid"] == 1 and list(se.segments) == [(1, 0)]
+    pages = list(iter_global_pages(rows, se))
+    assert len(pages) == 59
+    assert sorted(se.segments) == [(1, 0), (2, 0), (3, 0)]
+
+def test_columnar_trace_matches_csv(tmp_path):
+    from Combined_Demo_Tool.trace_columnar import convert_csv, load_columns
+    src = str(TRACES / "mixed_multi.csv")
+    dst = str(tmp_path / "mixed_multi.vmt")
+    assert convert_csv(src, dst, chunk_size=7) == 60
+    cols = load_columns(dst)
+    assert cols["pid"].dtype.itemsize == 4 and cols["segment_offset"][:2].tolist() == [0, 4096]
+    assert list(iter_trace_rows(dst, chunk_size=9)) == list(iter_trace_rows(src))
+
+def test_vectorized_global_trace_matches_streaming(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    from Combined_Demo_Tool.analytics import build_global_trace, iter_global_trace
+    for name in ("locality.csv", "sequential.csv", "mixed_multi.csv"):
+        path = str(TRACES / name)
+        assert build_global_trace(path) == list(iter_global_trace(path))
@@ -0,0 +1,150 @@
+"""
+Binary columnar trace format (.vmt) with a CSV converter and mmap loader.
+
+Layout:
+- 8-byte magic b"VMTRACE1", u32 header length, JSON header
+  {"rows", "columns": [{"name", "dtype", "offset"}], "modes", "access_types"}
+- one typed array per column, each starting on a 64-byte boundary
+
+mode and access_type are stored as uint8 codes into the header tables.
+load_columns() maps every column with np.memmap, so nothing is copied or
+parsed up front. Convert with:
+python -m Combined_Demo_Tool.trace_columnar <trace.csv> <trace.vmt>
+"""
+
+import csv
+import json
+import struct
+import sys
+from itertools import islice
+from typing import Any, Dict, Iterator, List
+import numpy as np
+
+MAGIC = b"VMTRACE1"
+ALIGN = 64
+COLUMNS = [
+    ("time", "<i8"),
+    ("pid", "<i4"),
+    ("mode", "u1"),
+    ("segment", "<i4"),
+    ("segment_offset", "<i8"),
+    ("access_type", "u1"),
+]
+CODED = ("mode", "access_type")
+
+def _align(n: int) -> int:
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+def is_columnar_trace(path: str) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+def _csv_chunks(csv_path: str, chunk_size: int) -> Iterator[List[List[str]]]:
+    with open(csv_path, newline='') as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader)
+        order = [header.index(name) for name, _ in COLUMNS]
+        while True:
+            chunk = list(islice(reader, chunk_size))
+            if not chunk:
+                return
+            yield [[row[i] for row in chunk] for i in order]
+
+def create_columns(out_path: str, rows: int, modes: List[str], access_types: List[str]) -> List[np.ndarray]:
+    """
+    Write the header of a `rows`-row trace and size the file; returns one
+    writable np.memmap per column (in COLUMNS order) for the caller to fill.
+    """
+    columns = []
+    offset = 0
+    for name, dtype in COLUMNS:
+        columns.append({"name": name, "dtype": dtype, "offset": offset})
+        offset = _align(offset + rows * np.dtype(dtype).itemsize)
+    header = {"rows": rows, "columns": columns, "modes": modes, "access_types": access_types}
+    blob = json.dumps(header).encode("utf-8")
+    data_start = _align(len(MAGIC) + 4 + len(blob))
+    with open(out_path, "wb") as f:
+        f.write(MAGIC + struct.pack("<I", len(blob)) + blob)
+        f.truncate(data_start + offset)
+    return [np.memmap(out_path, dtype=c["dtype"], mode="r+", offset=data_start + c["offset"], shape=(rows,))
+            for c in columns] if rows else []
+
+def convert_csv(csv_path: str, out_path: str, chunk_size: int = 1 << 16) -> int:
+    """
+    Convert a CSV trace in two streaming passes (count + intern, then fill);
+    memory stays bounded by chunk_size. Returns the number of rows.
+    """
+    rows = 0
+    tables: Dict[str, Dict[str, int]] = {name: {} for name in CODED}
+    coded_idx = [(i, tables[name]) for i, (name, _) in enumerate(COLUMNS) if name in CODED]
+    for cols in _csv_chunks(csv_path, chunk_size):
+        rows += len(cols[0])
+        for i, table in coded_idx:
+            for v in sorted(set(cols[i])):
+                table.setdefault(v, len(table))
+    if any(len(t) > 256 for t in tables.values()):
+        raise ValueError("too many distinct mode/access_type values for uint8 codes")
+
+    arrays = create_columns(out_path, rows, list(tables["mode"]), list(tables["access_type"]))
+    pos = 0
+    for cols in _csv_chunks(csv_path, chunk_size):
+        n = len(cols[0])
+        for (name, _), arr, values in zip(COLUMNS, arrays, cols):
+            if name in CODED:
+                table = tables[name]
+                values = [table[v] for v in values]
+            arr[pos:pos + n] = np.asarray(values, dtype=np.int64)
+        pos += n
+    for arr in arrays:
+        arr.flush()
+    return rows
+
+class TraceColumns:
+    """Zero-copy view of a .vmt file: columns[name] is a read-only np.memmap."""
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path}: not a columnar trace")
+            (hlen,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(hlen).decode("utf-8"))
+        self.path = path
+        self.rows: int = header["rows"]
+        self.modes: List[str] = header["modes"]
+        self.access_types: List[str] = header["access_types"]
+        data_start = _align(len(MAGIC) + 4 + hlen)
+        self.columns: Dict[str, np.ndarray] = {}
+        for c in header["columns"]:
+            if self.rows:
+                arr = np.memmap(path, dtype=c["dtype"], mode="r", offset=data_start + c["offset"], shape=(self.rows,))
+            else:
+                arr = np.zeros(0, dtype=c["dtype"])
+            self.columns[c["name"]] = arr
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def iter_chunks(self, chunk_size: int = 4096, start: int = 0) -> Iterator[List[Dict[str, Any]]]:
+        """Yield row dicts (from row `start` on) in the same shape as trace_stream's CSV reader."""
+        names = [name for name, _ in COLUMNS]
+        tables = {"mode": self.modes, "access_type": self.access_types}
+        for pos in range(start, self.rows, chunk_size):
+            cols = []
+            for name in names:
+                values = self.columns[name][pos:pos + chunk_size].tolist()
+                if name in tables:
+                    table = tables[name]
+                    values = [table[v] for v in values]
+                cols.append(values)
+            yield [dict(zip(names, row)) for row in zip(*cols)]
+
+def load_columns(path: str) -> TraceColumns:
+    return TraceColumns(path)
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python -m Combined_Demo_Tool.trace_columnar <trace.csv> <trace.vmt>")
+        sys.exit(1)
+    print(f"Wrote {convert_csv(sys.argv[1], sys.argv[2])} rows to {sys.argv[2]}")
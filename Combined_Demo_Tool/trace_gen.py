@@ -0,0 +1,153 @@
+"""
+Synthetic trace generator (CSV or .vmt) for workloads far larger than the sample traces.
+
+Rows use the usual time,pid,mode,segment,segment_offset,access_type schema:
+every pid touches its segment 0 of segment_pages pages (default 8 = the 32 KB
+segment run_demo and analytics create), pids are interleaved at random, and
+access_type is W with probability write_ratio. Workloads pick the page:
+- zipf: bounded Zipf(s) over the segment's pages (hot set = low ranks)
+- loop: each pid cycles over its first loop_pages pages
+- sequential: each pid walks its whole segment, wrapping at the end
+- uniform: any page
+A trace is a list of phases (workload, rows); every new phase moves the hot
+set/loop to a different part of the segment, so working sets shift.
+
+Rows are produced as NumPy column chunks (see generate_chunks) from a seeded
+Generator, so memory stays bounded by chunk_size and the same seed always
+gives the same trace. CLI:
+python -m Combined_Demo_Tool.trace_gen out.csv|out.vmt --rows 1000000 [--workload zipf]
+    [--phases zipf:500000,loop:500000] [--pids 4] [--segment-pages 8] [--write-ratio 0.3] [--seed 0]
+"""
+
+import argparse
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+from Combined_Demo_Tool.trace_columnar import COLUMNS, create_columns
+
+PAGE_SIZE = 4096
+MODES = ["segmented-paging"]
+ACCESS_TYPES = ["R", "W"]
+WORKLOADS = ("zipf", "loop", "sequential", "uniform")
+
+Phase = Tuple[str, int]
+
+def parse_phases(spec: str) -> List[Phase]:
+    """'zipf:1000,loop:500' -> [("zipf", 1000), ("loop", 500)]"""
+    phases = []
+    for part in spec.split(","):
+        workload, _, rows = part.partition(":")
+        if workload not in WORKLOADS or not rows.isdigit():
+            raise ValueError(f"bad phase {part!r}: expected <{'|'.join(WORKLOADS)}>:<rows>")
+        phases.append((workload, int(rows)))
+    return phases
+
+def generate_chunks(rows: int = 0, workload: str = "zipf", phases: Optional[Sequence[Phase]] = None,
+                    pids: int = 4, segment_pages: int = 8, write_ratio: float = 0.3, zipf_s: float = 1.1,
+                    loop_pages: Optional[int] = None, seed: int = 0,
+                    chunk_size: int = 1 << 16) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Yield column chunks keyed like trace_columnar.COLUMNS; mode and access_type
+    are uint8 codes into MODES / ACCESS_TYPES. phases overrides (workload, rows).
+    """
+    phases = list(phases) if phases else [(workload, rows)]
+    for w, _ in phases:
+        if w not in WORKLOADS:
+            raise ValueError(f"Unknown workload: {w!r} (expected one of {', '.join(WORKLOADS)})")
+    rng = np.random.default_rng(seed)
+    loop_pages = min(loop_pages or max(1, segment_pages // 2), segment_pages)
+    ranks = np.arange(1, segment_pages + 1, dtype=np.float64)
+    zipf_cdf = np.cumsum(ranks ** -zipf_s)
+    zipf_cdf /= zipf_cdf[-1]
+    # per-pid cursors for loop/sequential, carried across chunks and phases
+    cursor = np.zeros(pids, dtype=np.int64)
+    t = 1
+    for i, (w, phase_rows) in enumerate(phases):
+        # each phase relocates the working set
+        shift = int(rng.integers(segment_pages)) if i else 0
+        perm = rng.permutation(segment_pages) if w == "zipf" else None
+        for start in range(0, phase_rows, chunk_size):
+            n = min(chunk_size, phase_rows - start)
+            pid = rng.integers(pids, size=n)
+            if w == "zipf":
+                page = perm[np.searchsorted(zipf_cdf, rng.random(n))]
+            elif w == "uniform":
+                page = rng.integers(segment_pages, size=n)
+            else:
+                span = loop_pages if w == "loop" else segment_pages
+                # rank of each row among its pid's rows in this chunk: a stable sort
+                # groups rows by pid in order, then number each group from 0
+                order = np.argsort(pid, kind="stable")
+                counts = np.bincount(pid, minlength=pids)
+                rank = np.empty(n, dtype=np.int64)
+                rank[order] = np.arange(n) - np.repeat(np.cumsum(counts) - counts, counts)
+                page = (cursor[pid] + rank) % span
+                cursor += counts
+            page = (page + shift) % segment_pages
+            # word-aligned offset inside the page
+            offset = page * PAGE_SIZE + rng.integers(PAGE_SIZE // 8, size=n) * 8
+            yield {
+                "time": np.arange(t, t + n, dtype=np.int64),
+                "pid": pid + 1,
+                "mode": np.zeros(n, dtype=np.uint8),
+                "segment": np.zeros(n, dtype=np.int64),
+                "segment_offset": offset,
+                "access_type": (rng.random(n) < write_ratio).astype(np.uint8),
+            }
+            t += n
+
+def global_pages(chunk: Dict[str, np.ndarray], segment_pages: int = 8) -> np.ndarray:
+    """Dense page ids (pid-major) for engines that take global pages directly."""
+    return (chunk["pid"] - 1) * segment_pages + chunk["segment_offset"] // PAGE_SIZE
+
+def write_csv(chunks: Iterator[Dict[str, np.ndarray]], out_path: str) -> int:
+    rows = 0
+    with open(out_path, "w") as f:
+        f.write(",".join(name for name, _ in COLUMNS) + "\n")
+        for c in chunks:
+            n = len(c["time"])
+            access = np.asarray(ACCESS_TYPES, dtype=object)[c["access_type"]]
+            cells = chain.from_iterable(zip(c["time"].tolist(), c["pid"].tolist(),
+                                            c["segment"].tolist(), c["segment_offset"].tolist(), access.tolist()))
+            f.write(("%d,%d," + MODES[0] + ",%d,%d,%s\n") * n % tuple(cells))
+            rows += n
+    return rows
+
+def write_vmt(chunks: Iterator[Dict[str, np.ndarray]], out_path: str, rows: int) -> int:
+    """rows must equal the generated row count (it sizes the file up front)."""
+    arrays = create_columns(out_path, rows, MODES, ACCESS_TYPES)
+    pos = 0
+    for c in chunks:
+        n = len(c["time"])
+        for (name, _), arr in zip(COLUMNS, arrays):
+            arr[pos:pos + n] = c[name]
+        pos += n
+    for arr in arrays:
+        arr.flush()
+    return pos
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("out", help="output path; .vmt writes the binary columnar format, anything else CSV")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--workload", choices=WORKLOADS, default="zipf")
+    parser.add_argument("--phases", type=parse_phases, help="e.g. zipf:500000,loop:500000 (overrides --rows/--workload)")
+    parser.add_argument("--pids", type=int, default=4)
+    parser.add_argument("--segment-pages", type=int, default=8)
+    parser.add_argument("--loop-pages", type=int)
+    parser.add_argument("--zipf-s", type=float, default=1.1)
+    parser.add_argument("--write-ratio", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    phases = args.phases or [(args.workload, args.rows)]
+    chunks = generate_chunks(phases=phases, pids=args.pids, segment_pages=args.segment_pages,
+                             write_ratio=args.write_ratio, zipf_s=args.zipf_s, loop_pages=args.loop_pages,
+                             seed=args.seed)
+    if args.out.endswith(".vmt"):
+        rows = write_vmt(chunks, args.out, sum(r for _, r in phases))
+    else:
+        rows = write_csv(chunks, args.out)
+    print(f"Wrote {rows} rows to {args.out}")
+
+if __name__ == "__main__":
+    main()
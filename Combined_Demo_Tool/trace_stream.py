@@ -0,0 +1,99 @@
+"""
+Streaming trace pipeline shared by run_demo and analytics.
+
+Stages are generators, so a replay holds one chunk of rows at a time:
+- iter_trace_chunks / iter_trace_rows: parse the CSV (or columnar .vmt) lazily in chunks
+- with_segments: create each pid's default segment on first sight
+- iter_global_pages: translate rows into global page ids
+- iter_column_chunks / iter_global_page_batches: the same pipeline on NumPy
+  column chunks, translated with SegmentationEngine.seg_translate_batch
+
+CSV header: time,pid,mode,segment,segment_offset,access_type
+(any path accepted here may also be a .vmt file produced by trace_columnar)
+"""
+
+import csv
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List
+import numpy as np
+from Combined_Demo_Tool.trace_columnar import is_columnar_trace, load_columns
+
+INT_FIELDS = ("time", "pid", "segment", "segment_offset")
+DEFAULT_SEGMENT_SIZE = 32*1024
+
+Row = Dict[str, Any]
+
+def iter_trace_chunks(trace_path: str, chunk_size: int = 4096, start: int = 0) -> Iterator[List[Row]]:
+    """
+    Yield lists of up to chunk_size rows with time/pid/segment/segment_offset as ints,
+    beginning at data row `start` (skipped rows are not parsed).
+    Columnar .vmt traces (see trace_columnar.py) are detected by magic and read the same way.
+    """
+    if is_columnar_trace(trace_path):
+        yield from load_columns(trace_path).iter_chunks(chunk_size, start=start)
+        return
+    with open(trace_path, newline='') as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if header is None:
+            return
+        int_idx = [header.index(k) for k in INT_FIELDS]
+        if start:
+            next(islice(csvfile, start - 1, start), None)
+        while True:
+            raw = list(islice(reader, chunk_size))
+            if not raw:
+                return
+            chunk = []
+            for values in raw:
+                for i in int_idx:
+                    values[i] = int(values[i])
+                chunk.append(dict(zip(header, values)))
+            yield chunk
+
+def iter_trace_rows(trace_path: str, chunk_size: int = 4096, start: int = 0) -> Iterator[Row]:
+    for chunk in iter_trace_chunks(trace_path, chunk_size, start=start):
+        yield from chunk
+
+def with_segments(rows: Iterable[Row], seg_engine, size_bytes: int = DEFAULT_SEGMENT_SIZE) -> Iterator[Row]:
+    """Pass rows through, creating the default segment (seg_id 0) for a pid on first sight."""
+    segments = seg_engine.segments
+    for row in rows:
+        if (row["pid"], 0) not in segments:
+            seg_engine.create_segment(row["pid"], seg_id=0, size_bytes=size_bytes)
+        yield row
+
+def iter_global_pages(rows: Iterable[Row], seg_engine) -> Iterator[int]:
+    """Translate rows (segments must exist, see with_segments) into global page ids."""
+    for row in rows:
+        trans = seg_engine.seg_translate(row["pid"], row["segment"], row["segment_offset"], mode="segmented-paging")
+        yield trans["virtual_page"]
+
+def iter_column_chunks(trace_path: str, chunk_size: int = 1 << 16) -> Iterator[Dict[str, np.ndarray]]:
+    """Yield {"pid", "segment", "segment_offset"} int64 arrays; .vmt columns are sliced without parsing."""
+    if is_columnar_trace(trace_path):
+        cols = load_columns(trace_path)
+        for start in range(0, len(cols), chunk_size):
+            yield {k: cols[k][start:start + chunk_size] for k in INT_FIELDS[1:]}
+        return
+    for chunk in iter_trace_chunks(trace_path, chunk_size):
+        yield {k: np.fromiter((row[k] for row in chunk), dtype=np.int64, count=len(chunk)) for k in INT_FIELDS[1:]}
+
+def iter_global_page_batches(chunks: Iterable[Dict[str, np.ndarray]], seg_engine,
+                             size_bytes: int = DEFAULT_SEGMENT_SIZE) -> Iterator[np.ndarray]:
+    """
+    Vectorized with_segments + iter_global_pages: creates default segments for
+    new pids (in first-seen order) and yields one global-page array per chunk.
+    Raises like seg_translate if any access is out of bounds.
+    """
+    segments = seg_engine.segments
+    for chunk in chunks:
+        pids = chunk["pid"]
+        uniq, first = np.unique(pids, return_index=True)
+        for pid in uniq[np.argsort(first)].tolist():
+            if (pid, 0) not in segments:
+                seg_engine.create_segment(pid, seg_id=0, size_bytes=size_bytes)
+        trans = seg_engine.seg_translate_batch(pids, chunk["segment"], chunk["segment_offset"], mode="segmented-paging")
+        if not trans["valid"].all():
+            raise Exception("Offset out of bounds")
+        yield trans["virtual_page"]
@@ -1,35 +1,45 @@
 """
-Minimal Streamlit visualizer: shows last N events from events.log and a simple count table.
+Minimal Streamlit visualizer: shows last N events from events.log, event counts and the fault rate.
+
+The log is tailed incrementally (event_tail.EventTail kept in session state):
+a rerun only parses the lines appended since the previous one.
 
 Run with:
 streamlit run Combined_Demo_Tool/visualizer_streamlit.py
 """
 
 import streamlit as st
-import json
 import os
-from collections import Counter
+import pandas as pd
+from Combined_Demo_Tool.event_tail import EventTail
 
 EVENTS_LOG = os.path.join(os.getcwd(), "events.log")
 
 st.title("Virtual Memory Events Visualizer (minimal)")
-st.markdown("Shows last 50 events and a simple event-type count summary.")
+st.markdown("Shows last 50 events, event counts by type and pid, and the page fault rate over time.")
 
-def load_events(n=50):
-    if not os.path.exists(EVENTS_LOG):
-        return []
-    with open(EVENTS_LOG, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-    events = [json.loads(l) for l in lines]
-    return events[-n:]
+if "tail" not in st.session_state:
+    st.session_state.tail = EventTail(EVENTS_LOG, recent=200)
+tail = st.session_state.tail
+# parse at most 4 MB per rerun so a huge log is caught up over a few refreshes
+tail.poll(max_bytes=4 << 20)
 
-events = load_events(200)
-if not events:
+if not tail.total:
     st.info("No events.log found. Run demo first.")
 else:
+    st.button("Refresh")
+    st.write(f"{tail.total} events read ({tail.offset} bytes)")
+    if tail.behind:
+        st.warning(f"Still catching up: {tail.behind} bytes of events.log not read yet. Refresh to continue.")
     st.write("Last events (most recent first):")
-    for ev in reversed(events[-50:]):
+    for ev in list(reversed(tail.recent))[:50]:
         st.json(ev)
-    counts = Counter([e.get("type") for e in events])
     st.write("Event counts:")
-    st.table(dict(counts))
+    st.table(dict(tail.by_type))
+    st.write("Events per pid:")
+    st.table({str(pid): n for pid, n in sorted(tail.by_pid.items(), key=lambda kv: str(kv[0]))})
+    series = tail.fault_rate_series()
+    if series:
+        st.write(f"Fault rate per {tail.bucket_ticks} ticks:")
+        df = pd.DataFrame(series, columns=["tick", "accesses", "faults", "fault_rate"]).set_index("tick")
+        st.line_chart(df["fault_rate"])
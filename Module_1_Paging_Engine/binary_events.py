@@ -0,0 +1,310 @@
+"""
+Compact fixed-width binary event log with a memory-mapped NumPy reader.
+
+File layout (little endian):
+- 32-byte header: magic, version, record size, record count, trailer offset
+- `count` 48-byte records (RECORD_DTYPE)
+- JSON trailer with the intern tables (pids, strings, raw)
+
+Event types, pids and string fields (mode, reason, status, ...) are interned
+as small integer codes; integer fields go into four int64 slots according to
+EVENT_SCHEMAS. `flags` records which schema fields (and the pid) are present,
+so optional keys such as seg_translate's virtual_page/phys_addr round-trip
+exactly. Events that do not fit a schema are stored verbatim as JSON in the
+trailer's raw table under the RAW type code, so conversion is lossless.
+
+Convert with:
+python -m Module_1_Paging_Engine.binary_events to-bin events.log events.bin
+python -m Module_1_Paging_Engine.binary_events to-jsonl events.bin events.log
+"""
+
+import json
+import struct
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import numpy as np
+from .event_bus import EventSink
+
+MAGIC = b"VMEVLOG1"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQQ")
+RECORD = struct.Struct("<QBBHHHqqqq")
+RECORD_DTYPE = np.dtype([
+    ("time", "<u8"), ("type", "u1"), ("flags", "u1"), ("pid", "<u2"),
+    ("s0", "<u2"), ("s1", "<u2"),
+    ("a", "<i8"), ("b", "<i8"), ("c", "<i8"), ("d", "<i8"),
+])
+assert RECORD_DTYPE.itemsize == RECORD.size
+
+RAW = 255
+PID_FLAG = 0x80
+MAX_CODE = 0xFFFF
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+# type name -> ordered (key, slot); slots a-d hold ints, s0/s1 hold interned strings.
+# Two keys may share a slot when they never appear together (seg_translate).
+EVENT_SCHEMAS: Dict[str, List[Tuple[str, str]]] = {
+    "page_fault": [("page", "a")],
+    "page_in": [("global_page", "a"), ("frame", "b")],
+    "page_out": [("global_page", "a"), ("frame", "b")],
+    "page_load_request": [("global_page", "a"), ("reason", "s0")],
+    "demand_page_loaded": [("global_page", "a"), ("frame", "b")],
+    "tlb_hit": [("global_page", "a")],
+    "tlb_miss": [("global_page", "a")],
+    "access_request": [("mode", "s0"), ("segment", "a"), ("segment_offset", "b"), ("access_type", "s1")],
+    "segment_alloc": [("segment", "a"), ("base", "b"), ("limit", "c"), ("allocator", "s0")],
+    "seg_translate": [("segment", "a"), ("segment_offset", "b"), ("status", "s0"),
+                      ("virtual_page", "c"), ("page_offset", "d"), ("phys_addr", "c")],
+    "seg_fault": [("segment", "a"), ("segment_offset", "b")],
+    "analytics_summary": [("total_accesses", "a"), ("total_page_faults", "b"), ("frames", "c")],
+    "seg_translate_batch": [("mode", "s0"), ("count", "a"), ("invalid", "b")],
+    "prefetch_waste": [("global_page", "a"), ("segment", "b")],
+    "pff_quota_change": [("old_quota", "a"), ("new_quota", "b"), ("faults", "c"), ("window", "d")],
+    "process_suspend": [("quota", "a")],
+    "process_resume": [("quota", "a")],
+    "prefetch_load": [("page", "a")],
+}
+EVENT_TYPES: List[str] = list(EVENT_SCHEMAS)
+TYPE_CODES: Dict[str, int] = {name: code for code, name in enumerate(EVENT_TYPES)}
+_SLOTS = ("s0", "s1", "a", "b", "c", "d")
+
+def _is_int(v: Any) -> bool:
+    return type(v) is int and INT64_MIN <= v <= INT64_MAX
+
+def _finish(f, count: int, tables: Dict[str, List[Any]]) -> None:
+    """Write the trailer after `count` records and the header that points at it."""
+    table_offset = HEADER.size + count * RECORD.size
+    f.seek(table_offset)
+    f.truncate()
+    f.write(json.dumps(tables).encode("utf-8"))
+    f.seek(0)
+    f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, count, table_offset))
+
+def truncate_log(path: str, count: int, tables: Dict[str, List[Any]]) -> None:
+    """
+    Cut a (finished or unfinished) binary event log back to its first `count`
+    records and rewrite the trailer from `tables`.
+    """
+    with open(path, "r+b") as f:
+        if f.seek(0, 2) < HEADER.size + count * RECORD.size:
+            raise ValueError(f"{path}: fewer than {count} records")
+        _finish(f, count, tables)
+
+class BinaryEventWriter:
+    def __init__(self, path: str):
+        self.path = path
+        self.f = open(path, "wb")
+        self.f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, 0, 0))
+        self.count = 0
+        self.pids: List[int] = []
+        self.pid_codes: Dict[int, int] = {}
+        self.strings: List[str] = []
+        self.string_codes: Dict[str, int] = {}
+        self.raw: List[str] = []
+
+    def _intern_string(self, s: str) -> int:
+        code = self.string_codes.get(s)
+        if code is None:
+            code = len(self.strings)
+            self.strings.append(s)
+            self.string_codes[s] = code
+        return code
+
+    def _encode(self, event: Dict[str, Any]) -> Optional[bytes]:
+        schema = EVENT_SCHEMAS.get(event.get("type"))
+        t = event.get("time")
+        if schema is None or not _is_int(t) or t < 0:
+            return None
+        slots = dict.fromkeys(_SLOTS, 0)
+        flags = 0
+        used = 2  # "type" and "time"
+        pid_code = 0
+        if "pid" in event:
+            pid = event["pid"]
+            if not _is_int(pid):
+                return None
+            pid_code = self.pid_codes.get(pid)
+            if pid_code is None:
+                if len(self.pids) > MAX_CODE:
+                    return None
+                pid_code = self.pid_codes[pid] = len(self.pids)
+                self.pids.append(pid)
+            flags |= PID_FLAG
+            used += 1
+        filled = set()
+        for bit, (key, slot) in enumerate(schema):
+            if key not in event:
+                continue
+            v = event[key]
+            if slot in filled:
+                return None
+            if slot[0] == "s":
+                if not isinstance(v, str) or (v not in self.string_codes and len(self.strings) > MAX_CODE):
+                    return None
+                v = self._intern_string(v)
+            elif not _is_int(v):
+                return None
+            slots[slot] = v
+            filled.add(slot)
+            flags |= 1 << bit
+            used += 1
+        if used != len(event):
+            return None  # keys outside the schema
+        return RECORD.pack(t, TYPE_CODES[event["type"]], flags, pid_code,
+                           slots["s0"], slots["s1"], slots["a"], slots["b"], slots["c"], slots["d"])
+
+    def write(self, event: Dict[str, Any]) -> None:
+        rec = self._encode(event)
+        if rec is None:
+            # lossless fallback: keep the JSON text in the raw table
+            idx = len(self.raw)
+            self.raw.append(json.dumps(event, sort_keys=True))
+            t = event.get("time")
+            rec = RECORD.pack(t if _is_int(t) and t >= 0 else 0, RAW, 0, 0, 0, 0, idx, 0, 0, 0)
+        self.f.write(rec)
+        self.count += 1
+
+    def flush(self) -> None:
+        self.f.flush()
+
+    def tables(self) -> Dict[str, List[Any]]:
+        """Copies of the intern tables written so far (the trailer's content)."""
+        return {"pids": list(self.pids), "strings": list(self.strings), "raw": list(self.raw)}
+
+    def rewind(self, count: int, tables: Dict[str, List[Any]]) -> None:
+        """
+        Drop every record after the first `count` and go back to `tables`
+        (as returned by tables() when count records had been written).
+        """
+        if count > self.count:
+            raise ValueError(f"{self.path}: cannot rewind to {count} records, only {self.count} written")
+        self.f.flush()
+        self.f.truncate(HEADER.size + count * RECORD.size)
+        self.f.seek(0, 2)
+        self.count = count
+        self.pids = list(tables["pids"])
+        self.pid_codes = {pid: code for code, pid in enumerate(self.pids)}
+        self.strings = list(tables["strings"])
+        self.string_codes = {s: code for code, s in enumerate(self.strings)}
+        self.raw = list(tables["raw"])
+
+    def close(self) -> None:
+        if self.f.closed:
+            return
+        _finish(self.f, self.count, self.tables())
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class BinaryFileSink(EventSink):
+    """Event bus sink writing the binary format; the file is finalized on close()."""
+    def __init__(self, path: str):
+        self.writer = BinaryEventWriter(path)
+
+    def write(self, event: Dict[str, Any]) -> None:
+        self.writer.write(event)
+
+    def flush(self) -> None:
+        self.writer.flush()
+
+    def close(self) -> None:
+        self.writer.close()
+
+class BinaryEventLog:
+    """
+    Read-only view over a binary event log. `records` is a NumPy structured
+    array backed by mmap, so filtering and counting never parse events.
+    """
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            magic, version, rec_size, count, table_offset = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or rec_size != RECORD.size:
+                raise ValueError(f"{path}: not a binary event log")
+            f.seek(table_offset)
+            tables = json.loads(f.read().decode("utf-8"))
+        self.path = path
+        self.pids: List[int] = tables["pids"]
+        self.strings: List[str] = tables["strings"]
+        self.raw: List[str] = tables["raw"]
+        self.pid_codes = {pid: code for code, pid in enumerate(self.pids)}
+        if count:
+            self.records = np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER.size, shape=(count,))
+        else:
+            self.records = np.zeros(0, dtype=RECORD_DTYPE)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def mask(self, type: Optional[str] = None, pid: Optional[int] = None) -> np.ndarray:
+        """
+        Boolean mask of records matching an event type and/or pid.
+        Events stored as raw JSON only match type="raw".
+        """
+        m = np.ones(len(self.records), dtype=bool)
+        if type is not None:
+            code = RAW if type == "raw" else TYPE_CODES.get(type)
+            if code is None:
+                return np.zeros(len(self.records), dtype=bool)
+            m &= self.records["type"] == code
+        if pid is not None:
+            pid_code = self.pid_codes.get(pid)
+            if pid_code is None:
+                return np.zeros(len(self.records), dtype=bool)
+            m &= (self.records["pid"] == pid_code) & (self.records["flags"] & PID_FLAG != 0)
+        return m
+
+    def filter(self, type: Optional[str] = None, pid: Optional[int] = None) -> np.ndarray:
+        return self.records[self.mask(type, pid)]
+
+    def count_by_type(self) -> Dict[str, int]:
+        counts = np.bincount(self.records["type"], minlength=256)
+        out = {name: int(counts[code]) for code, name in enumerate(EVENT_TYPES) if counts[code]}
+        if counts[RAW]:
+            out["raw"] = int(counts[RAW])
+        return out
+
+    def decode(self, rec) -> Dict[str, Any]:
+        code = int(rec["type"])
+        if code == RAW:
+            return json.loads(self.raw[int(rec["a"])])
+        name = EVENT_TYPES[code]
+        flags = int(rec["flags"])
+        ev: Dict[str, Any] = {"type": name, "time": int(rec["time"])}
+        if flags & PID_FLAG:
+            ev["pid"] = self.pids[int(rec["pid"])]
+        for bit, (key, slot) in enumerate(EVENT_SCHEMAS[name]):
+            if flags & (1 << bit):
+                v = int(rec[slot])
+                ev[key] = self.strings[v] if slot[0] == "s" else v
+        return ev
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for rec in self.records:
+            yield self.decode(rec)
+
+def jsonl_to_binary(src: str, dst: str) -> int:
+    """Convert an events.log (JSON lines) to the binary format. Returns event count."""
+    with open(src, "r", encoding="utf-8") as f, BinaryEventWriter(dst) as w:
+        for line in f:
+            if line.strip():
+                w.write(json.loads(line))
+        return w.count
+
+def binary_to_jsonl(src: str, dst: str) -> int:
+    """Convert a binary event log back to sorted-key JSON lines. Returns event count."""
+    log = BinaryEventLog(src)
+    with open(dst, "w", encoding="utf-8") as f:
+        for ev in log:
+            f.write(json.dumps(ev, sort_keys=True) + "\n")
+    return len(log)
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4 or sys.argv[1] not in ("to-bin", "to-jsonl"):
+        print("Usage: python -m Module_1_Paging_Engine.binary_events {to-bin|to-jsonl} <src> <dst>")
+        sys.exit(1)
+    convert = jsonl_to_binary if sys.argv[1] == "to-bin" else binary_to_jsonl
+    print(f"Converted {convert(sys.argv[2], sys.argv[3])} events")
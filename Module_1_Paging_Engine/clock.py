@@ -0,0 +1,38 @@
+"""
+In-process monotonic tick clock shared by both modules' tick()/emit_event().
+
+Advancing the clock is a single integer increment. The counter is only
+written to disk (vm_tick.json, same {"tick": n} layout as before) when a
+caller asks for a checkpoint, and can be restored from one.
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Optional
+
+class TickClock:
+    def __init__(self, start: int = 0, path: Optional[str] = None):
+        self.value = start
+        self.path = path or os.path.join(os.getcwd(), "vm_tick.json")
+
+    def tick(self) -> int:
+        self.value += 1
+        return self.value
+
+    def reset(self, value: int = 0) -> None:
+        self.value = value
+
+    def checkpoint(self, path: Optional[str] = None) -> None:
+        """Persist the current tick (e.g. at the end of a run or before a snapshot)."""
+        with open(path or self.path, "w") as f:
+            json.dump({"tick": self.value, "saved": datetime.utcnow().isoformat()}, f)
+
+    def restore(self, path: Optional[str] = None) -> int:
+        """Continue from a checkpoint written by checkpoint(); returns the restored tick."""
+        with open(path or self.path) as f:
+            self.value = int(json.load(f)["tick"])
+        return self.value
+
+# the simulation's clock; both utils modules advance this same object
+CLOCK = TickClock()
@@ -0,0 +1,109 @@
+"""
+Shared event bus used by both modules' utils.emit_event().
+
+Events are fanned out to pluggable sinks:
+- BufferedFileSink: JSON-lines appended to events.log in batches
+- RingBufferSink: keeps the last N event dicts in memory
+- NullSink: drops everything
+- StdoutSink: one-line summary per event (off by default; set VM_EVENTS_STDOUT=1)
+
+The process-wide BUS is flushed at interpreter exit.
+"""
+
+import atexit
+import json
+import os
+import sys
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+Event = Dict[str, Any]
+
+class EventSink:
+    def write(self, event: Event) -> None:
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+class NullSink(EventSink):
+    def write(self, event: Event) -> None:
+        pass
+
+class BufferedFileSink(EventSink):
+    """
+    Appends events as sorted-key JSON lines, one open/write/close per batch.
+    The file is reopened on every flush, so deleting it between runs is safe.
+    """
+    def __init__(self, path: str, batch_size: int = 1024):
+        self.path = path
+        self.batch_size = batch_size
+        self.buffer: List[str] = []
+
+    def write(self, event: Event) -> None:
+        self.buffer.append(json.dumps(event, sort_keys=True))
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.buffer:
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(self.buffer) + "\n")
+        self.buffer.clear()
+
+class RingBufferSink(EventSink):
+    """Keeps the most recent `capacity` events (the dicts themselves)."""
+    def __init__(self, capacity: int = 10000):
+        self.events: Deque[Event] = deque(maxlen=capacity)
+
+    def write(self, event: Event) -> None:
+        self.events.append(event)
+
+class StdoutSink(EventSink):
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def write(self, event: Event) -> None:
+        print(f"[EVENT {event.get('time')}] {event.get('type', 'unknown')}", file=self.stream or sys.stdout)
+
+class EventBus:
+    def __init__(self, sinks: Optional[List[EventSink]] = None):
+        self.sinks: List[EventSink] = list(sinks or [])
+
+    def emit(self, event: Event) -> None:
+        for sink in self.sinks:
+            sink.write(event)
+
+    def add_sink(self, sink: EventSink) -> EventSink:
+        self.sinks.append(sink)
+        return sink
+
+    def remove_sink(self, sink: EventSink) -> None:
+        sink.flush()
+        self.sinks.remove(sink)
+
+    def set_sinks(self, sinks: List[EventSink]) -> None:
+        """Replace all sinks (flushing the old ones first)."""
+        self.flush()
+        self.sinks = list(sinks)
+
+    def flush(self) -> None:
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self) -> None:
+        for sink in self.sinks:
+            sink.close()
+
+def default_sinks() -> List[EventSink]:
+    sinks: List[EventSink] = [BufferedFileSink(os.path.join(os.getcwd(), "events.log"))]
+    if os.environ.get("VM_EVENTS_STDOUT", "") not in ("", "0"):
+        sinks.append(StdoutSink())
+    return sinks
+
+BUS = EventBus(default_sinks())
+atexit.register(BUS.close)
@@ -13,6 +13,12 @@ def emit_page_fault(pid: int, page: int) -> Dict[str, Any]:
     emit_event(ev)
     return ev
 
+def emit_prefetch_load(pid: int, page: int) -> Dict[str, Any]:
+    """a speculative load of a non-present page (counted apart from demand page_faults)"""
+    ev = {"type": "prefetch_load", "pid": pid, "page": page}
+    emit_event(ev)
+    return ev
+
 def emit_page_in(pid: int, global_page: int, frame: int) -> Dict[str, Any]:
     ev = {"type": "page_in", "pid": pid, "global_page": global_page, "frame": frame}
     emit_event(ev)
@@ -26,4 +32,21 @@ def emit_page_out(pid: int, global_page: int, frame: int) -> Dict[str, Any]:
 def emit_page_load_request(pid: int, global_page: int, reason: str) -> Dict[str, Any]:
     ev = {"type": "page_load_request", "pid": pid, "global_page": global_page, "reason": reason}
     emit_event(ev)
-    return ev
\ No newline at end of file
+    return ev
+
+def emit_pff_quota_change(pid: int, old_quota: int, new_quota: int, faults: int, window: int) -> Dict[str, Any]:
+    """fault rate for the window that triggered the change = faults / window"""
+    ev = {"type": "pff_quota_change", "pid": pid, "old_quota": old_quota, "new_quota": new_quota,
+          "faults": faults, "window": window}
+    emit_event(ev)
+    return ev
+
+def emit_process_suspend(pid: int, quota: int) -> Dict[str, Any]:
+    ev = {"type": "process_suspend", "pid": pid, "quota": quota}
+    emit_event(ev)
+    return ev
+
+def emit_process_resume(pid: int, quota: int) -> Dict[str, Any]:
+    ev = {"type": "process_resume", "pid": pid, "quota": quota}
+    emit_event(ev)
+    return ev
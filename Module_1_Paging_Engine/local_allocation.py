@@ -0,0 +1,247 @@
+"""
+Local (per-process) frame allocation with a page-fault-frequency controller.
+
+LocalFramePool is a drop-in for PhysicalMemory when PagingEngine is built with
+allocation="local":
+- every pid owns a frame quota and its own replacer of the engine's policy;
+  a fault evicts one of the pid's own pages once its quota is used up, so a
+  scanning process can no longer push out everyone else's working set
+- a pid's replacer only sees the frames it owns: _OwnedFrames numbers them
+  as dense local slots, so the replacer is sized by the quota (not
+  frames_count) and can never pick another pid's frame
+- every `window` accesses of a pid its fault rate (faults / window) is
+  checked: above `upper` the quota grows by `step`, below `lower` it shrinks
+  (never under min_quota) and the excess pages are evicted
+- the sum of quotas never exceeds frames_count; when a pid needs to grow and
+  no frames are uncommitted, the total working set exceeds memory and the
+  active pid with the highest fault rate in its last window (ties: larger
+  quota, then higher pid; possibly the requester itself) is suspended: all
+  its pages are swapped out and it is confined to min_quota. Suspended pids
+  are resumed in suspension order once their old quota fits again.
+
+Evictions that are not part of a fault (shrink, suspend) are reported through
+on_evict(pid, gpage, frame) so the owner can update its page table.
+Events: pff_quota_change (old/new quota plus the window's faults and length),
+process_suspend, process_resume.
+"""
+
+from array import array
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+from .replacement_algorithms import REPLACERS
+from . import events as ev
+
+EMPTY = -1
+
+class _OwnedFrames:
+    """
+    A pid's replacer over the frames it owns. Each owned frame gets a local
+    slot (slots of released frames are reused first), and the wrapped replacer
+    works on slots, so its state is O(quota) and its victims are always the
+    pid's own frames.
+    """
+    __slots__ = ("replacer", "slot_frames", "slot_of", "free_slots")
+
+    def __init__(self, replacer_cls, quota: int):
+        self.replacer = replacer_cls(quota)
+        self.slot_frames: List[int] = []      # slot -> global frame (EMPTY when free)
+        self.slot_of: Dict[int, int] = {}     # global frame -> slot
+        self.free_slots: List[int] = []
+
+    def _claim(self, frame: int) -> int:
+        if self.free_slots:
+            slot = self.free_slots.pop()
+            self.slot_frames[slot] = frame
+        else:
+            slot = len(self.slot_frames)
+            self.slot_frames.append(frame)
+        self.slot_of[frame] = slot
+        return slot
+
+    def add(self, frame: int, gpage: int):
+        self.replacer.add(self._claim(frame), gpage)
+
+    def pick_victim(self, incoming: Optional[int] = None) -> Tuple[int, int]:
+        slot, gpage = self.replacer.pick_victim(incoming)
+        # the frame leaves the pid or is re-added by replace(); either way the slot is free now
+        self.replacer.remove(slot)
+        frame = self.slot_frames[slot]
+        self.slot_frames[slot] = EMPTY
+        del self.slot_of[frame]
+        self.free_slots.append(slot)
+        return frame, gpage
+
+    def replace(self, frame: int, gpage: int):
+        # the slot pick_victim just freed is reused, so the clocks' hands stay put
+        self.replacer.replace(self._claim(frame), gpage)
+
+    def touch(self, frame: int, gpage: int):
+        self.replacer.touch(self.slot_of[frame], gpage)
+
+    def resize(self, quota: int):
+        self.replacer.resize(quota)
+
+class _PidState:
+    __slots__ = ("quota", "resident", "replacer", "accesses", "faults", "last_faults", "saved_quota")
+
+    def __init__(self, quota: int, replacer):
+        self.quota = quota
+        self.resident = 0
+        self.replacer = replacer
+        self.accesses = 0
+        self.faults = 0
+        self.last_faults = 0    # faults in the last completed window
+        self.saved_quota = 0    # quota to restore on resume; 0 while active
+
+class LocalFramePool:
+    def __init__(self, frames_count: int = 4, policy: str = "FIFO", initial_quota: Optional[int] = None,
+                 window: int = 32, upper: float = 0.25, lower: float = 0.05, step: int = 1, min_quota: int = 1,
+                 on_evict: Optional[Callable[[int, int, int], None]] = None):
+        replacer_cls = REPLACERS.get(policy.upper().replace("-", ""))
+        if replacer_cls is None:
+            raise ValueError(f"Unknown replacement policy: {policy!r} (expected one of {', '.join(REPLACERS)})")
+        self._replacer_cls = replacer_cls
+        self.frames_count = frames_count
+        self.initial_quota = initial_quota if initial_quota is not None else max(min_quota, frames_count // 4)
+        self.window = window
+        self.upper = upper
+        self.lower = lower
+        self.step = step
+        self.min_quota = min_quota
+        self.on_evict = on_evict
+        # frame -> global_page / owning pid, EMPTY when free
+        self.frames = array("q", [EMPTY]) * frames_count
+        self.owners = array("q", [EMPTY]) * frames_count
+        self.page_to_frame: Dict[int, int] = {}
+        self.free_list = list(range(frames_count - 1, -1, -1))
+        self.pids: Dict[int, _PidState] = {}
+        self.committed = 0
+        self.suspended: Deque[int] = deque()
+
+    @property
+    def uncommitted(self) -> int:
+        return self.frames_count - self.committed
+
+    def quota_of(self, pid: int) -> int:
+        st = self.pids.get(pid)
+        return st.quota if st is not None else 0
+
+    def _state(self, pid: int) -> _PidState:
+        st = self.pids.get(pid)
+        if st is None:
+            if self.uncommitted < self.min_quota:
+                self._suspend_one()
+            quota = max(self.min_quota, min(self.initial_quota, self.uncommitted))
+            st = self.pids[pid] = _PidState(quota, _OwnedFrames(self._replacer_cls, quota))
+            self.committed += quota
+        return st
+
+    def _release(self, pid: int, st: _PidState, incoming: Optional[int] = None) -> Tuple[int, int]:
+        """Evict one of pid's pages through its replacer; returns (frame, gpage)."""
+        frame, gpage = st.replacer.pick_victim(incoming)
+        st.resident -= 1
+        self.frames[frame] = EMPTY
+        self.owners[frame] = EMPTY
+        self.page_to_frame.pop(gpage, None)
+        return frame, gpage
+
+    def _evict_down_to(self, pid: int, st: _PidState, limit: int) -> None:
+        while st.resident > limit:
+            frame, gpage = self._release(pid, st)
+            self.free_list.append(frame)
+            if self.on_evict is not None:
+                self.on_evict(pid, gpage, frame)
+
+    def allocate_frame(self, gpage: int, pid: int = 0) -> Tuple[int, Optional[int]]:
+        """Frame for pid's page gpage: a free frame while under quota, else one of pid's own."""
+        st = self._state(pid)
+        if st.resident < st.quota and self.free_list:
+            frame = self.free_list.pop()
+            st.resident += 1
+            st.replacer.add(frame, gpage)
+            evicted = None
+        elif st.resident == 0:
+            # overcommitted (nobody could be suspended): borrow from the pid holding the most frames
+            _, owner = max((o.resident, p) for p, o in self.pids.items() if o.resident)
+            frame, evicted = self._release(owner, self.pids[owner])
+            st.resident += 1
+            st.replacer.add(frame, gpage)
+        else:
+            frame, evicted = self._release(pid, st, gpage)
+            st.resident += 1
+            st.replacer.replace(frame, gpage)
+        self.frames[frame] = gpage
+        self.owners[frame] = pid
+        self.page_to_frame[gpage] = frame
+        return frame, evicted
+
+    def frame_of(self, gpage: int) -> Optional[int]:
+        return self.page_to_frame.get(gpage)
+
+    def page_at(self, frame: int) -> Optional[int]:
+        gpage = self.frames[frame]
+        return None if gpage == EMPTY else gpage
+
+    def touch_frame(self, frame: int, gpage: int) -> None:
+        pid = self.owners[frame]
+        if pid != EMPTY:
+            self.pids[pid].replacer.touch(frame, gpage)
+
+    def record_access(self, pid: int, faulted: bool) -> None:
+        """Count an access for pid's fault-rate window and adjust its quota at the window end."""
+        st = self._state(pid)
+        st.accesses += 1
+        st.faults += faulted
+        if st.accesses < self.window:
+            return
+        faults, st.accesses, st.faults = st.faults, 0, 0
+        st.last_faults = faults
+        if st.saved_quota:
+            return  # suspended: stays at min_quota until resumed
+        rate = faults / self.window
+        if rate > self.upper:
+            if self.uncommitted < self.step and self._suspend_one() == pid:
+                return
+            grow = min(self.step, self.uncommitted)
+            if grow > 0:
+                self._set_quota(pid, st, st.quota + grow, faults)
+        elif rate < self.lower and st.quota > self.min_quota:
+            self._set_quota(pid, st, max(self.min_quota, st.quota - self.step), faults)
+            self._resume_waiting()
+
+    def _set_quota(self, pid: int, st: _PidState, quota: int, faults: int) -> None:
+        old = st.quota
+        self.committed += quota - old
+        st.quota = quota
+        self._evict_down_to(pid, st, quota)
+        st.replacer.resize(quota)
+        ev.emit_pff_quota_change(pid, old, quota, faults, self.window)
+
+    def _suspend_one(self) -> Optional[int]:
+        candidates = [(st.last_faults, st.quota, pid) for pid, st in self.pids.items()
+                      if not st.saved_quota and st.quota > self.min_quota]
+        if not candidates:
+            return None
+        _, _, pid = max(candidates)
+        st = self.pids[pid]
+        st.saved_quota = st.quota
+        self.committed -= st.quota - self.min_quota
+        st.quota = self.min_quota
+        # swap out: every resident page goes
+        self._evict_down_to(pid, st, 0)
+        st.replacer.resize(st.quota)
+        self.suspended.append(pid)
+        ev.emit_process_suspend(pid, st.saved_quota)
+        return pid
+
+    def _resume_waiting(self) -> None:
+        while self.suspended:
+            pid = self.suspended[0]
+            st = self.pids[pid]
+            if st.saved_quota - st.quota > self.uncommitted:
+                return
+            self.suspended.popleft()
+            self.committed += st.saved_quota - st.quota
+            st.quota, st.saved_quota = st.saved_quota, 0
+            st.replacer.resize(st.quota)
+            ev.emit_process_resume(pid, st.quota)
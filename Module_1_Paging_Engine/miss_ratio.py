@@ -0,0 +1,186 @@
+"""
+Miss-ratio curves (faults for every frame count 1..F) for n accesses.
+
+- LRU: one pass, Bennett-Kruskal stack distances over a Fenwick tree,
+  O(n log n) whatever F is.
+- OPT: one pass of Mattson's priority-stack algorithm with next-use priority.
+  An access reorders the stack above the page's depth, and the top k entries
+  are exactly OPT's k-frame memory, so only the top F entries are kept: the
+  pass costs O(n * F), not O(n log n).
+- any other policy (FIFO, CLOCK, ARC, CLOCK-Pro): not a stack algorithm
+  (Belady's anomaly), so there is no single pass; count_faults() replays the
+  trace once per frame count, F replays in all.
+
+Traces may be lists or NumPy arrays (e.g. a .npy opened with mmap_mode="r");
+arrays are converted to Python ints CHUNK_SIZE accesses at a time, so a
+memory-mapped trace is never copied whole into a list.
+
+No events are emitted; these are offline analytics helpers.
+"""
+
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, Sequence
+import numpy as np
+from .optimal import next_use_index
+from .physical_memory import PhysicalMemory
+
+STACK_POLICIES = ("LRU", "OPT")
+CHUNK_SIZE = 1 << 16
+
+
+def _iter_pages(trace_gpages: Sequence[int]) -> Iterator[int]:
+    if not isinstance(trace_gpages, np.ndarray):
+        return iter(trace_gpages)
+    return chain.from_iterable(trace_gpages[start:start + CHUNK_SIZE].tolist()
+                               for start in range(0, len(trace_gpages), CHUNK_SIZE))
+
+
+def _next_use(trace_gpages: Sequence[int]) -> List[int]:
+    """next_use_index, vectorized for arrays: a stable sort puts each page's accesses in order."""
+    if not isinstance(trace_gpages, np.ndarray):
+        return next_use_index(trace_gpages)
+    n = len(trace_gpages)
+    order = np.argsort(trace_gpages, kind="stable")
+    nxt = np.full(n, n, dtype=np.int64)
+    same = trace_gpages[order[1:]] == trace_gpages[order[:-1]]
+    nxt[order[:-1][same]] = order[1:][same]
+    return nxt.tolist()
+
+
+class _Fenwick:
+    def __init__(self, n: int):
+        self.n = n
+        self.tree = [0] * (n + 1)
+
+    def add(self, i: int, delta: int) -> None:
+        i += 1
+        tree = self.tree
+        n = self.n
+        while i <= n:
+            tree[i] += delta
+            i += i & -i
+
+    def prefix(self, i: int) -> int:
+        """Sum of positions [0, i)."""
+        s = 0
+        tree = self.tree
+        while i > 0:
+            s += tree[i]
+            i -= i & -i
+        return s
+
+
+def lru_stack_distances(trace_gpages: Sequence[int]) -> List[int]:
+    """
+    Histogram of LRU stack distances: hist[d] = number of accesses whose page
+    was at depth d (1 = most recently used). hist[0] counts cold misses.
+    """
+    n = len(trace_gpages)
+    bit = _Fenwick(n)
+    last: Dict[int, int] = {}
+    hist = [0] * (n + 1)
+    live = 0  # number of distinct pages seen so far (= markers in the tree)
+    for i, page in enumerate(_iter_pages(trace_gpages)):
+        j = last.get(page)
+        if j is None:
+            hist[0] += 1
+            live += 1
+        else:
+            # distinct pages touched after j = live markers at positions > j
+            hist[live - bit.prefix(j + 1) + 1] += 1
+            bit.add(j, -1)
+        bit.add(i, 1)
+        last[page] = i
+    return hist
+
+
+def opt_stack_distances(trace_gpages: Sequence[int], max_depth: Optional[int] = None) -> List[int]:
+    """
+    Histogram of OPT stack distances (same layout as lru_stack_distances).
+    Priority is the next use; pages never used again get n + i so the order
+    is total and the inclusion property holds. With max_depth, reuses deeper
+    than max_depth are not counted (they miss for every frame count up to it).
+    """
+    n = len(trace_gpages)
+    nxt = _next_use(trace_gpages)
+    limit = n if max_depth is None else max(1, max_depth)
+    hist = [0] * (n + 1)
+    stack: List[int] = []
+    on_stack = set()
+    prio: Dict[int, int] = {}
+    for i, page in enumerate(_iter_pages(trace_gpages)):
+        if page in on_stack:
+            depth = stack.index(page)
+            hist[depth + 1] += 1
+        else:
+            if page not in prio:
+                hist[0] += 1
+            # enters at the bottom; a full stack drops its last carry below
+            depth = len(stack)
+            stack.append(page)
+            on_stack.add(page)
+        prio[page] = nxt[i] if nxt[i] < n else n + i
+        if depth == 0:
+            continue
+        # push page to the top; the lowest-priority page seen so far sinks
+        carry = stack[0]
+        stack[0] = page
+        carry_prio = prio[carry]
+        for k in range(1, depth):
+            other = stack[k]
+            other_prio = prio[other]
+            if other_prio > carry_prio:
+                stack[k] = carry
+                carry = other
+                carry_prio = other_prio
+        stack[depth] = carry
+        if depth == limit:
+            stack.pop()
+            on_stack.discard(carry)
+    return hist
+
+
+def count_faults(trace_gpages: Sequence[int], frames_count: int, policy: str = "FIFO") -> int:
+    """
+    Replay a global-page trace through PhysicalMemory and count faults, without
+    building PTEs or emitting events.
+    """
+    physical = PhysicalMemory(frames_count=frames_count, policy=policy)
+    resident: Dict[int, int] = {}
+    faults = 0
+    for page in _iter_pages(trace_gpages):
+        frame = resident.get(page)
+        if frame is not None:
+            physical.touch_frame(frame, page)
+            continue
+        faults += 1
+        frame, evicted = physical.allocate_frame(page)
+        if evicted is not None:
+            del resident[evicted]
+        resident[page] = frame
+    return faults
+
+
+def miss_ratio_curve(trace_gpages: Sequence[int], policy: str = "LRU",
+                     max_frames: Optional[int] = None) -> Dict[int, int]:
+    """
+    Faults for every frame count 1..max_frames (default: number of distinct pages).
+    Returns {frames: faults}. Cost for n accesses and F = max_frames: LRU
+    O(n log n), OPT O(n * F), any other policy F full replays (count_faults).
+    """
+    policy = policy.upper()
+    if max_frames is None:
+        max_frames = max(1, len(set(_iter_pages(trace_gpages))))
+    if policy not in STACK_POLICIES:
+        return {f: count_faults(trace_gpages, f, policy) for f in range(1, max_frames + 1)}
+    if policy == "LRU":
+        hist = lru_stack_distances(trace_gpages)
+    else:
+        hist = opt_stack_distances(trace_gpages, max_depth=max_frames)
+    curve: Dict[int, int] = {}
+    faults = len(trace_gpages)
+    for f in range(1, max_frames + 1):
+        if f < len(hist):
+            faults -= hist[f]
+        curve[f] = faults
+    return curve
@@ -0,0 +1,82 @@
+"""
+Offline Belady optimal (OPT / MIN) replacement engine.
+
+A single backward pass builds a next-use index for every access; resident
+pages then sit in a max-priority heap keyed by their next use so each
+eviction is O(log frames). Stale heap entries (pages that were hit again
+or evicted) are skipped lazily and the heap is compacted when it grows past
+a small multiple of frames_count.
+
+Ties between pages that are never used again are broken by residency
+order (earliest loaded first), matching the original scan.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
+
+
+@dataclass
+class OptimalResult:
+    faults: int = 0
+    # evicted global pages, in eviction order
+    victims: List[int] = field(default_factory=list)
+    # per-access outcome: 1 = hit, 0 = miss
+    hits: bytearray = field(default_factory=bytearray)
+
+
+def next_use_index(trace_gpages: Sequence[int]) -> List[int]:
+    """
+    For every position i return the index of the next access to the same page,
+    or len(trace_gpages) if the page is never accessed again.
+    """
+    n = len(trace_gpages)
+    nxt = [n] * n
+    last: Dict[int, int] = {}
+    for i in range(n - 1, -1, -1):
+        page = trace_gpages[i]
+        nxt[i] = last.get(page, n)
+        last[page] = i
+    return nxt
+
+
+def simulate_optimal(trace_gpages: Sequence[int], frames_count: int) -> OptimalResult:
+    """
+    Belady's optimal simulation in O(n log frames).
+    Returns fault count, victim sequence and per-access hit/miss.
+    """
+    if frames_count < 1:
+        raise ValueError("frames_count must be >= 1")
+    nxt = next_use_index(trace_gpages)
+    result = OptimalResult(hits=bytearray(len(trace_gpages)))
+    hits = result.hits
+    victims = result.victims
+    # resident page -> (next_use, residency seq); heap holds (-next_use, seq, page)
+    resident: Dict[int, Tuple[int, int]] = {}
+    heap: List[Tuple[int, int, int]] = []
+    compact_at = 2 * frames_count + 64
+    seq = 0
+    faults = 0
+    for i, page in enumerate(trace_gpages):
+        key = resident.get(page)
+        if key is not None:
+            hits[i] = 1
+            key = (nxt[i], key[1])
+        else:
+            faults += 1
+            if len(resident) >= frames_count:
+                while True:
+                    neg_next, vseq, victim = heapq.heappop(heap)
+                    if resident.get(victim) == (-neg_next, vseq):
+                        break
+                del resident[victim]
+                victims.append(victim)
+            key = (nxt[i], seq)
+            seq += 1
+        resident[page] = key
+        heapq.heappush(heap, (-key[0], key[1], page))
+        if len(heap) > compact_at:
+            heap = [(-nu, s, p) for p, (nu, s) in resident.items()]
+            heapq.heapify(heap)
+    result.faults = faults
+    return result
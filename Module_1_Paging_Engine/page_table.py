@@ -0,0 +1,116 @@
+"""
+Struct-of-arrays page table indexed by global page id.
+
+Each page costs one flag byte (valid/present/dirty/referenced bits) and one
+int64 frame slot; both arrays grow geometrically in place. PTEView gives the
+old per-page attribute API (pte.present, pte.frame, ...) on top of the arrays
+for callers such as DemandController and the tests.
+"""
+
+from array import array
+from typing import Iterator, Optional
+
+VALID = 0x1        # entry exists (page has been touched)
+PRESENT = 0x2
+DIRTY = 0x4
+REFERENCED = 0x8
+NO_FRAME = -1
+
+class PTEView:
+    __slots__ = ("table", "gpage")
+
+    def __init__(self, table: "PageTable", gpage: int):
+        self.table = table
+        self.gpage = gpage
+
+    def _get(self, bit: int) -> bool:
+        return bool(self.table.flags[self.gpage] & bit)
+
+    def _set(self, bit: int, value: bool) -> None:
+        if value:
+            self.table.flags[self.gpage] |= bit
+        else:
+            self.table.flags[self.gpage] &= ~bit & 0xFF
+
+    @property
+    def present(self) -> bool:
+        return self._get(PRESENT)
+
+    @present.setter
+    def present(self, value: bool) -> None:
+        self._set(PRESENT, value)
+
+    @property
+    def dirty(self) -> bool:
+        return self._get(DIRTY)
+
+    @dirty.setter
+    def dirty(self, value: bool) -> None:
+        self._set(DIRTY, value)
+
+    @property
+    def referenced(self) -> bool:
+        return self._get(REFERENCED)
+
+    @referenced.setter
+    def referenced(self, value: bool) -> None:
+        self._set(REFERENCED, value)
+
+    @property
+    def frame(self) -> Optional[int]:
+        frame = self.table.frames[self.gpage]
+        return None if frame == NO_FRAME else frame
+
+    @frame.setter
+    def frame(self, value: Optional[int]) -> None:
+        self.table.frames[self.gpage] = NO_FRAME if value is None else value
+
+    def __repr__(self) -> str:
+        return (f"PTE(present={self.present}, frame={self.frame}, "
+                f"dirty={self.dirty}, referenced={self.referenced})")
+
+class PageTable:
+    def __init__(self, capacity: int = 64):
+        self.flags = bytearray(capacity)
+        self.frames = array("q", [NO_FRAME]) * capacity
+        self.count = 0
+
+    def reserve(self, gpage: int) -> None:
+        """Make sure gpage has a slot (growing geometrically) and mark it valid."""
+        if gpage >= len(self.flags):
+            grow = max(gpage + 1, 2 * len(self.flags)) - len(self.flags)
+            self.flags.extend(bytes(grow))
+            self.frames.extend(array("q", [NO_FRAME]) * grow)
+        if not self.flags[gpage] & VALID:
+            self.flags[gpage] = VALID
+            self.count += 1
+
+    def ensure(self, gpage: int) -> PTEView:
+        self.reserve(gpage)
+        return PTEView(self, gpage)
+
+    def is_present(self, gpage: int) -> bool:
+        return gpage < len(self.flags) and bool(self.flags[gpage] & PRESENT)
+
+    def __contains__(self, gpage: int) -> bool:
+        return 0 <= gpage < len(self.flags) and bool(self.flags[gpage] & VALID)
+
+    def __getitem__(self, gpage: int) -> PTEView:
+        if gpage not in self:
+            raise KeyError(gpage)
+        return PTEView(self, gpage)
+
+    def get(self, gpage: int, default=None) -> Optional[PTEView]:
+        return PTEView(self, gpage) if gpage in self else default
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[int]:
+        return (g for g in range(len(self.flags)) if self.flags[g] & VALID)
+
+    def keys(self) -> Iterator[int]:
+        return iter(self)
+
+    def items(self):
+        return ((g, PTEView(self, g)) for g in self)
@@ -1,117 +1,155 @@
 """
-Paging engine with PTE dataclass, PagingEngine class, and offline optimal calculator.
+Paging engine with array-backed page table, PagingEngine class, and offline optimal calculator.
 
-- PTE: present, frame, dirty, referenced
-- PagingEngine supports FIFO, LRU, CLOCK eviction policies via PhysicalMemory
+- PTE: present, frame, dirty, referenced (stored in page_table.PageTable, viewed via PTEView)
+- PagingEngine supports FIFO, LRU, CLOCK, ARC, CLOCK-Pro eviction policies via PhysicalMemory
+  (one global pool) or, with allocation="local", per-pid quotas via local_allocation.LocalFramePool
 - handle_page_load_request(...) performs synchronous load/evict and emits events via events.py
+- with tlb=TLB(...), translate(...) serves TLB hits without touching the page table and
+  every eviction shoots the victim's entries down
 """
 
-from dataclasses import dataclass
-from typing import Optional, Dict, Tuple, List
+from typing import Callable, Optional, Dict, Tuple, List
 from .physical_memory import PhysicalMemory
+from .tlb import TLB
+from .local_allocation import LocalFramePool
+from .optimal import simulate_optimal
+from .page_table import PageTable, PTEView, VALID, PRESENT, DIRTY, REFERENCED
 from . import events as ev
 from .utils import emit_event
 
-@dataclass
-class PTE:
-    present: bool = False
-    frame: Optional[int] = None
-    dirty: bool = False
-    referenced: bool = False
+# per-page view type; kept under the old name for callers that import PTE
+PTE = PTEView
 
 class PagingEngine:
-    def __init__(self, frames_count: int = 4, page_size: int = 4096, policy: str = "FIFO"):
+    def __init__(self, frames_count: int = 4, page_size: int = 4096, policy: str = "FIFO",
+                 allocation: str = "global", tlb: Optional[TLB] = None, **local_options):
         """
         frames_count: number of physical frames.
         page_size: bytes per page (unused for address math here, but kept for realism).
-        policy: "FIFO" | "LRU" | "CLOCK"
+        policy: "FIFO" | "LRU" | "CLOCK" | "ARC" | "CLOCKPRO" (ValueError otherwise)
+        allocation: "global" (one shared pool) | "local" (per-pid quotas with a PFF
+        controller; local_options go to LocalFramePool, e.g. window, upper, lower)
+        tlb: optional TLB consulted by translate() and the demand controllers
         """
         self.page_size = page_size
         self.frames_count = frames_count
         self.policy = policy.upper()
-        self.physical = PhysicalMemory(frames_count=frames_count, policy=self.policy)
-        # map global_page -> PTE
-        self.ptes: Dict[int, PTE] = {}
+        self.allocation = allocation
+        if allocation == "local":
+            self.physical = LocalFramePool(frames_count=frames_count, policy=self.policy,
+                                           on_evict=self._evicted, **local_options)
+        elif allocation == "global":
+            self.physical = PhysicalMemory(frames_count=frames_count, policy=self.policy)
+        else:
+            raise ValueError(f"Unknown allocation mode: {allocation!r}")
+        self.local = allocation == "local"
+        self.tlb = tlb
+        # global_page -> PTE, stored as parallel arrays
+        self.ptes = PageTable()
+        # called as listener(pid, evicted_gpage, frame) whenever a page is evicted
+        self.eviction_listeners: List[Callable[[int, int, int], None]] = []
 
     def ensure_pte(self, gpage: int) -> PTE:
-        if gpage not in self.ptes:
-            self.ptes[gpage] = PTE()
-        return self.ptes[gpage]
+        return self.ptes.ensure(gpage)
 
     def is_present(self, gpage: int) -> bool:
-        pte = self.ptes.get(gpage)
-        return bool(pte and pte.present)
+        return self.ptes.is_present(gpage)
 
-    def handle_page_load_request(self, pid: int, gpage: int, access_type: str = "R") -> Dict:
+    def handle_page_load_request(self, pid: int, gpage: int, access_type: str = "R",
+                                 prefetch: bool = False) -> Dict:
         """
         Synchronous handler for loading a page into memory.
         Emits page_fault/page_in/page_out as required.
-        Returns {"status": "loaded"|"ok", "frame": frame}
+        Returns {"status": "loaded"|"ok", "frame": frame}; eviction_listeners hear about victims.
+        prefetch=True marks a speculative load: it emits prefetch_load instead of
+        page_fault and is not counted in a local pid's fault rate.
         """
-        pte = self.ensure_pte(gpage)
-        if pte.present:
+        ptes = self.ptes
+        ptes.reserve(gpage)
+        flags = ptes.flags
+        write = access_type.upper() == "W"
+        if flags[gpage] & PRESENT:
+            frame = ptes.frames[gpage]
             # update replacement metadata
-            self.physical.touch_frame(pte.frame, gpage)
+            self.physical.touch_frame(frame, gpage)
             # mark referenced/dirty if write
-            pte.referenced = True
-            if access_type.upper() == "W":
-                pte.dirty = True
-            return {"status": "ok", "frame": pte.frame}
+            flags[gpage] |= REFERENCED | (DIRTY if write else 0)
+            if self.local:
+                self.physical.record_access(pid, False)
+            return {"status": "ok", "frame": frame}
 
         # page fault
-        ev.emit_page_fault(pid, gpage)
+        if prefetch:
+            ev.emit_prefetch_load(pid, gpage)
+        else:
+            ev.emit_page_fault(pid, gpage)
 
-        # allocate frame (may evict)
-        victim = self.physical.allocate_frame_for(gpage)
-        # if eviction happened, victim is (evicted_frame, evicted_global_page)
-        if victim is not None:
-            evicted_frame, evicted_page = victim
-            # mark victim pte not present
-            victim_pte = self.ptes.get(evicted_page)
-            if victim_pte:
-                if victim_pte.dirty:
-                    # write back
-                    ev.emit_page_out(pid, evicted_page, evicted_frame)
-                victim_pte.present = False
-                victim_pte.frame = None
-                victim_pte.referenced = False
+        # allocate frame (may evict); the frame comes back directly
+        if self.local:
+            frame, evicted_page = self.physical.allocate_frame(gpage, pid)
+        else:
+            frame, evicted_page = self.physical.allocate_frame(gpage)
+        if evicted_page is not None and evicted_page in ptes:
+            self._evicted(pid, evicted_page, frame)
 
         # assign frame to new page
-        frame = self.physical.set_frame_for(gpage)
-        pte.present = True
-        pte.frame = frame
-        pte.referenced = True
-        pte.dirty = (access_type.upper() == "W")
+        flags[gpage] = VALID | PRESENT | REFERENCED | (DIRTY if write else 0)
+        ptes.frames[gpage] = frame
         ev.emit_page_in(pid, gpage, frame)
+        if self.local and not prefetch:
+            self.physical.record_access(pid, True)
         return {"status": "loaded", "frame": frame}
 
+    def translate(self, pid: int, gpage: int, access_type: str = "R") -> Dict:
+        """
+        handle_page_load_request behind the TLB: a hit returns the cached frame
+        (only replacement/dirty state is updated, no PTE lookup); a miss walks
+        the page table, loading the page if needed, and fills the TLB.
+        """
+        tlb = self.tlb
+        if tlb is None:
+            return self.handle_page_load_request(pid, gpage, access_type=access_type)
+        frame = tlb.lookup(pid, gpage)
+        if frame is not None:
+            self.note_access(pid, gpage, frame, access_type)
+            return {"status": "ok", "frame": frame}
+        result = self.handle_page_load_request(pid, gpage, access_type=access_type)
+        tlb.insert(pid, gpage, result["frame"])
+        return result
+
+    def _evicted(self, pid: int, gpage: int, frame: int) -> None:
+        """Mark an evicted page not present, writing it back first if dirty."""
+        flags = self.ptes.flags
+        if flags[gpage] & DIRTY:
+            # write back
+            ev.emit_page_out(pid, gpage, frame)
+        flags[gpage] &= ~(PRESENT | REFERENCED) & 0xFF
+        self.ptes.frames[gpage] = -1
+        if self.tlb is not None:
+            self.tlb.shootdown(gpage)
+        for listener in self.eviction_listeners:
+            listener(pid, gpage, frame)
+
+    def note_access(self, pid: int, gpage: int, frame: int, access_type: str = "R",
+                    reference: bool = True) -> None:
+        """
+        Record a hit served without handle_page_load_request (a TLB hit, or
+        DemandController's present-page path). With reference the replacer sees
+        the use and a write marks the page dirty; local allocation always counts
+        the access in the pid's fault rate.
+        """
+        if reference:
+            self.physical.touch_frame(frame, gpage)
+            if access_type.upper() == "W":
+                self.ptes.flags[gpage] |= DIRTY
+        if self.local:
+            self.physical.record_access(pid, False)
+
     @staticmethod
     def optimal_faults_for_trace(trace_gpages: List[int], frames_count: int) -> int:
         """
         Offline Belady's optimal simulation. Returns number of page faults for given trace.
+        See optimal.simulate_optimal for the victim sequence and per-access hits.
         """
-        frames: Dict[int, None] = {}
-        faults = 0
-        for i, page in enumerate(trace_gpages):
-            if page in frames:
-                continue
-            faults += 1
-            if len(frames) < frames_count:
-                frames[page] = None
-            else:
-                # pick page with farthest next use (or never used again)
-                farthest_page = None
-                farthest_idx = -1
-                for p in list(frames.keys()):
-                    next_idx = next((j for j in range(i+1, len(trace_gpages)) if trace_gpages[j] == p), None)
-                    if next_idx is None:
-                        farthest_page = p
-                        break
-                    if next_idx > farthest_idx:
-                        farthest_idx = next_idx
-                        farthest_page = p
-                # evict farthest_page
-                if farthest_page is not None:
-                    del frames[farthest_page]
-                frames[page] = None
-        return faults
\ No newline at end of file
+        return simulate_optimal(trace_gpages, frames_count).faults
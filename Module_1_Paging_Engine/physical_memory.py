@@ -2,53 +2,87 @@
 Physical memory manager: frames array, free list, allocation and eviction logic.
 
 Uses replacement algorithms implemented in replacement_algorithms.py.
+frame -> page and page -> frame are kept as parallel int arrays (-1 = empty),
+and free frames are a stack, so allocation, eviction and lookup are O(1).
 """
 
-from typing import Optional, Tuple, Dict
-from .replacement_algorithms import FIFOReplacer, LRUReplacer, ClockReplacer
+from array import array
+from typing import Optional, Tuple
+from .replacement_algorithms import REPLACERS
+
+EMPTY = -1
 
 class PhysicalMemory:
     def __init__(self, frames_count: int = 4, policy: str = "FIFO"):
         self.frames_count = frames_count
-        # frame -> global_page or None
-        self.frames: Dict[int, Optional[int]] = {i: None for i in range(frames_count)}
-        self.free_list = list(range(frames_count))
-        policy = policy.upper()
-        if policy == "FIFO":
-            self.replacer = FIFOReplacer(frames_count)
-        elif policy == "LRU":
-            self.replacer = LRUReplacer(frames_count)
-        else:
-            self.replacer = ClockReplacer(frames_count)
+        # frame -> global_page or EMPTY
+        self.frames = array("q", [EMPTY]) * frames_count
+        # global_page -> frame or EMPTY; grown geometrically as pages appear
+        self.page_to_frame = array("q", [EMPTY]) * max(64, frames_count)
+        # stack of free frames, lowest frame on top so frames fill as 0, 1, 2, ...
+        self.free_list = list(range(frames_count - 1, -1, -1))
+        replacer_cls = REPLACERS.get(policy.upper().replace("-", ""))
+        if replacer_cls is None:
+            raise ValueError(f"Unknown replacement policy: {policy!r} (expected one of {', '.join(REPLACERS)})")
+        self.replacer = replacer_cls(frames_count)
 
-    def allocate_frame_for(self, gpage: int) -> Optional[Tuple[int, int]]:
+    def _map(self, frame: int, gpage: int) -> None:
+        if gpage >= len(self.page_to_frame):
+            grow = max(gpage + 1, 2 * len(self.page_to_frame)) - len(self.page_to_frame)
+            self.page_to_frame.extend(array("q", [EMPTY]) * grow)
+        self.frames[frame] = gpage
+        self.page_to_frame[gpage] = frame
+
+    def allocate_frame(self, gpage: int) -> Tuple[int, Optional[int]]:
         """
-        Allocate a frame for gpage. If free frame exists, return None (no eviction).
-        If eviction happens, return tuple (evicted_frame, evicted_global_page).
-        Also informs replacer of allocation.
+        Allocate a frame for gpage, evicting if no frame is free.
+        Returns (frame, evicted_global_page or None).
         """
         if self.free_list:
-            frame = self.free_list.pop(0)
-            self.frames[frame] = gpage
+            frame = self.free_list.pop()
+            self._map(frame, gpage)
             self.replacer.add(frame, gpage)
-            return None
+            return frame, None
         # need to evict
-        victim_frame, victim_page = self.replacer.pick_victim()
-        # record eviction
-        self.frames[victim_frame] = gpage
+        victim_frame, victim_page = self.replacer.pick_victim(gpage)
+        if victim_page is not None and self.page_to_frame[victim_page] == victim_frame:
+            self.page_to_frame[victim_page] = EMPTY
+        self._map(victim_frame, gpage)
         self.replacer.replace(victim_frame, gpage)
-        return (victim_frame, victim_page)
+        return victim_frame, victim_page
+
+    def allocate_frame_for(self, gpage: int) -> Optional[Tuple[int, int]]:
+        """
+        Allocate a frame for gpage. If free frame exists, return None (no eviction).
+        If eviction happens, return tuple (evicted_frame, evicted_global_page).
+        Kept for callers that pair it with set_frame_for; prefer allocate_frame.
+        """
+        frame, victim_page = self.allocate_frame(gpage)
+        if victim_page is None:
+            return None
+        return (frame, victim_page)
 
     def set_frame_for(self, gpage: int) -> int:
         """
         After allocate_frame_for called, set_frame_for returns the frame index
-        assigned to gpage (search frames).
+        assigned to gpage.
         """
-        for f, p in self.frames.items():
-            if p == gpage:
-                return f
-        # fallback; shouldn't happen
-        raise RuntimeError("Frame not found after allocation")
+        frame = self.frame_of(gpage)
+        if frame is None:
+            raise RuntimeError("Frame not found after allocation")
+        return frame
+
+    def frame_of(self, gpage: int) -> Optional[int]:
+        """Frame currently holding gpage, or None."""
+        if gpage >= len(self.page_to_frame):
+            return None
+        frame = self.page_to_frame[gpage]
+        return None if frame == EMPTY else frame
+
+    def page_at(self, frame: int) -> Optional[int]:
+        """Global page held by frame, or None if free."""
+        gpage = self.frames[frame]
+        return None if gpage == EMPTY else gpage
 
     def touch_frame(self, frame: int, gpage: int) -> None:
         """
@@ -60,7 +94,10 @@ class PhysicalMemory:
         """
         Free a frame (used by tests).
         """
-        self.frames[frame] = None
-        if frame not in self.free_list:
-            self.free_list.append(frame)
-        self.replacer.remove(frame)
\ No newline at end of file
+        gpage = self.frames[frame]
+        if gpage == EMPTY:
+            return
+        self.frames[frame] = EMPTY
+        self.page_to_frame[gpage] = EMPTY
+        self.free_list.append(frame)
+        self.replacer.remove(frame)
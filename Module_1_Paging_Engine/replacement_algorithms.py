@@ -1,99 +1,114 @@
 """
-Replacement algorithms: FIFO, LRU, Clock.
+Replacement algorithms: FIFO, LRU, Clock, ARC, CLOCK-Pro.
 
-Interfaces are minimal to be used by PhysicalMemory above.
+Interfaces are minimal to be used by PhysicalMemory above:
+add / pick_victim / replace / touch / remove, each O(1) (amortized for the clocks).
+pick_victim(incoming) is told which page is about to be loaded; only the
+adaptive policies (ARC, CLOCK-Pro) use it, to check their ghost entries.
+resize(frames_count) changes the number of frames a replacer manages (local
+allocation quotas); frames already added stay valid.
+REPLACERS maps policy names to classes.
 """
 
-from typing import Optional, Tuple, Dict, List
+from collections import OrderedDict, deque
+from typing import Optional, Tuple, Dict, List, Deque, Set
 
 class FIFOReplacer:
     def __init__(self, frames_count):
-        self.queue: List[int] = []
+        # (frame, stamp); entries whose stamp is no longer live were removed
+        self.queue: Deque[Tuple[int, int]] = deque()
         self.frame_to_page: Dict[int, Optional[int]] = {}
+        self._live: Dict[int, int] = {}
+        self._stamp = 0
 
-    def add(self, frame: int, gpage: int):
-        self.queue.append(frame)
+    def _enqueue(self, frame: int, gpage: int):
+        self._stamp += 1
+        self._live[frame] = self._stamp
+        self.queue.append((frame, self._stamp))
         self.frame_to_page[frame] = gpage
 
-    def pick_victim(self) -> Tuple[int, int]:
-        if not self.queue:
-            raise RuntimeError("No frames to evict")
-        victim = self.queue.pop(0)
-        page = self.frame_to_page.get(victim)
-        return victim, page
+    def add(self, frame: int, gpage: int):
+        self._enqueue(frame, gpage)
+
+    def pick_victim(self, incoming: Optional[int] = None) -> Tuple[int, int]:
+        while self.queue:
+            victim, stamp = self.queue.popleft()
+            if self._live.get(victim) == stamp:
+                del self._live[victim]
+                return victim, self.frame_to_page.get(victim)
+        raise RuntimeError("No frames to evict")
 
     def replace(self, frame: int, gpage: int):
         # append the new frame to queue
-        self.queue.append(frame)
-        self.frame_to_page[frame] = gpage
+        self._enqueue(frame, gpage)
 
     def touch(self, frame: int, gpage: int):
         # FIFO ignores touch
         pass
 
     def remove(self, frame: int):
-        if frame in self.queue:
-            self.queue.remove(frame)
+        # lazily dropped by pick_victim
+        self._live.pop(frame, None)
         self.frame_to_page.pop(frame, None)
 
+    def resize(self, frames_count: int):
+        pass
+
 class LRUReplacer:
     def __init__(self, frames_count):
-        self.order: List[int] = []
-        self.frame_to_page: Dict[int, Optional[int]] = {}
+        # frame -> global_page, least recently used first
+        self.order: "OrderedDict[int, Optional[int]]" = OrderedDict()
 
     def add(self, frame: int, gpage: int):
-        if frame in self.order:
-            self.order.remove(frame)
-        self.order.append(frame)
-        self.frame_to_page[frame] = gpage
+        self.order[frame] = gpage
+        self.order.move_to_end(frame)
 
-    def pick_victim(self) -> Tuple[int, int]:
+    def pick_victim(self, incoming: Optional[int] = None) -> Tuple[int, int]:
         if not self.order:
             raise RuntimeError("No frames to evict")
-        victim = self.order.pop(0)
-        return victim, self.frame_to_page.get(victim)
+        return self.order.popitem(last=False)
 
     def replace(self, frame: int, gpage: int):
-        # touched frame becomes most recently used
-        if frame in self.order:
-            self.order.remove(frame)
-        self.order.append(frame)
-        self.frame_to_page[frame] = gpage
+        # replaced frame becomes most recently used
+        self.add(frame, gpage)
 
     def touch(self, frame: int, gpage: int):
         if frame in self.order:
-            self.order.remove(frame)
-        self.order.append(frame)
+            self.order.move_to_end(frame)
 
     def remove(self, frame: int):
-        if frame in self.order:
-            self.order.remove(frame)
-        self.frame_to_page.pop(frame, None)
+        self.order.pop(frame, None)
+
+    def resize(self, frames_count: int):
+        pass
 
 class ClockReplacer:
     def __init__(self, frames_count):
         self.frames: List[Optional[int]] = [None] * frames_count
-        self.use_bits: Dict[int, int] = {}
+        self.use_bits = bytearray(frames_count)
         self.pointer = 0
 
     def add(self, frame: int, gpage: int):
         self.frames[frame] = gpage
         self.use_bits[frame] = 1
 
-    def pick_victim(self) -> Tuple[int, int]:
+    def pick_victim(self, incoming: Optional[int] = None) -> Tuple[int, int]:
+        # amortized O(1): every bit cleared here was set by an add/touch
         n = len(self.frames)
+        use_bits = self.use_bits
+        frames = self.frames
+        idx = self.pointer % n
         for _ in range(2*n):
-            idx = self.pointer % n
-            if self.use_bits.get(idx, 0) == 0:
-                victim = idx
-                self.pointer = (idx + 1) % n
-                return victim, self.frames[victim]
+            if use_bits[idx] == 0:
+                if frames[idx] is not None:   # removed frames are skipped
+                    self.pointer = (idx + 1) % n
+                    return idx, frames[idx]
             else:
-                self.use_bits[idx] = 0
-            self.pointer = (self.pointer + 1) % n
+                use_bits[idx] = 0
+            idx = (idx + 1) % n
         # fallback: choose pointer
-        victim = self.pointer % n
-        return victim, self.frames[victim]
+        self.pointer = idx
+        return idx, self.frames[idx]
 
     def replace(self, frame: int, gpage: int):
         self.frames[frame] = gpage
@@ -105,5 +120,277 @@ class ClockReplacer:
 
     def remove(self, frame: int):
         self.frames[frame] = None
-        self.use_bits.pop(frame, None)
-        
\ No newline at end of file
+        self.use_bits[frame] = 0
+
+    def resize(self, frames_count: int):
+        # grow only: slots past a smaller size may still hold pages
+        grow = frames_count - len(self.frames)
+        if grow > 0:
+            self.frames.extend([None] * grow)
+            self.use_bits.extend(bytes(grow))
+
+class ARCReplacer:
+    """
+    Adaptive Replacement Cache (Megiddo & Modha). Resident pages are in T1
+    (seen once recently) or T2 (seen at least twice); B1/B2 remember pages
+    recently evicted from each, by global page id only. A fault on a B1 ghost
+    grows the T1 target p, one on a B2 ghost shrinks it. |T1|+|B1| <= c and
+    |T1|+|T2|+|B1|+|B2| <= 2c, so ghost memory stays bounded by the frame count.
+    """
+    def __init__(self, frames_count):
+        self.capacity = frames_count
+        self.p = 0.0
+        # global_page -> frame (resident) or None (ghost), LRU first
+        self.t1: "OrderedDict[int, int]" = OrderedDict()
+        self.t2: "OrderedDict[int, int]" = OrderedDict()
+        self.b1: "OrderedDict[int, None]" = OrderedDict()
+        self.b2: "OrderedDict[int, None]" = OrderedDict()
+        self.frame_to_page: Dict[int, int] = {}
+
+    def _insert(self, frame: int, gpage: int):
+        self.frame_to_page[frame] = gpage
+        if gpage in self.b1:
+            del self.b1[gpage]
+            self.t2[gpage] = frame
+        elif gpage in self.b2:
+            del self.b2[gpage]
+            self.t2[gpage] = frame
+        else:
+            self.t1[gpage] = frame
+        # keep the directory bounded even when pick_victim was not told the incoming page
+        c = self.capacity
+        while len(self.t1) + len(self.b1) > c and self.b1:
+            self.b1.popitem(last=False)
+        while len(self.t1) + len(self.t2) + len(self.b1) + len(self.b2) > 2 * c and self.b2:
+            self.b2.popitem(last=False)
+
+    def add(self, frame: int, gpage: int):
+        self._insert(frame, gpage)
+
+    def pick_victim(self, incoming: Optional[int] = None) -> Tuple[int, int]:
+        t1, t2, b1, b2 = self.t1, self.t2, self.b1, self.b2
+        if not t1 and not t2:
+            raise RuntimeError("No frames to evict")
+        c = self.capacity
+        ghost = True
+        if incoming in b1:
+            self.p = min(float(c), self.p + max(len(b2) / len(b1), 1.0))
+        elif incoming in b2:
+            self.p = max(0.0, self.p - max(len(b1) / len(b2), 1.0))
+        elif incoming is not None:
+            # brand-new page: make room in the directory first
+            if len(t1) + len(b1) >= c:
+                if b1:
+                    b1.popitem(last=False)
+                else:
+                    ghost = False   # T1 alone fills the cache: its LRU page is dropped outright
+            elif len(t1) + len(t2) + len(b1) + len(b2) >= 2 * c and b2:
+                b2.popitem(last=False)
+        if t1 and (len(t1) > self.p or (incoming in b2 and len(t1) == self.p) or not t2):
+            gpage, frame = t1.popitem(last=False)
+            if ghost:
+                b1[gpage] = None
+        else:
+            gpage, frame = t2.popitem(last=False)
+            b2[gpage] = None
+        del self.frame_to_page[frame]
+        return frame, gpage
+
+    def replace(self, frame: int, gpage: int):
+        self._insert(frame, gpage)
+
+    def touch(self, frame: int, gpage: int):
+        if gpage in self.t1:
+            del self.t1[gpage]
+            self.t2[gpage] = frame
+        elif gpage in self.t2:
+            self.t2.move_to_end(gpage)
+
+    def remove(self, frame: int):
+        gpage = self.frame_to_page.pop(frame, None)
+        if gpage is not None:
+            self.t1.pop(gpage, None)
+            self.t2.pop(gpage, None)
+
+    def resize(self, frames_count: int):
+        # the directory bounds catch up on the next inserts
+        self.capacity = frames_count
+        self.p = min(self.p, float(frames_count))
+
+class ClockProReplacer:
+    """
+    CLOCK-Pro (Jiang, Chen & Zhang). Resident pages are hot or cold; a cold
+    page starts a test period when it is loaded or re-referenced, and stays
+    in the list as a non-resident ghost (by global page id) after eviction
+    until the period ends. A fault on a page still in its test period makes it
+    hot and grows the cold target; test periods that expire shrink it.
+    hand_hot (demotes hot pages, ends test periods) and hand_test (drops
+    ghosts) walk one circular list kept as prev/next dicts, which pickles
+    without recursion. hand_cold walks only the resident cold pages, kept in
+    clock order in `cold`, so eviction never scans past hot pages. At most
+    frames_count ghosts are kept.
+    """
+    def __init__(self, frames_count):
+        self.capacity = frames_count
+        self.cold_target = 1
+        self.next: Dict[int, int] = {}
+        self.prev: Dict[int, int] = {}
+        self.frame_of: Dict[int, int] = {}      # resident page -> frame
+        self.frame_to_page: Dict[int, int] = {}
+        self.cold: "OrderedDict[int, None]" = OrderedDict()   # hand_cold order
+        self.hot: Set[int] = set()
+        self.ref: Set[int] = set()
+        self.test: Set[int] = set()
+        self.hand_hot: Optional[int] = None
+        self.hand_test: Optional[int] = None
+
+    # circular list helpers; the list head is just behind hand_hot
+    def _link_head(self, gpage: int):
+        head = self.hand_hot
+        if head is None:
+            self.next[gpage] = self.prev[gpage] = gpage
+            self.hand_hot = self.hand_test = gpage
+            return
+        before = self.prev[head]
+        self.next[before] = gpage
+        self.prev[gpage] = before
+        self.next[gpage] = head
+        self.prev[head] = gpage
+
+    def _unlink(self, gpage: int):
+        nxt = self.next.pop(gpage)
+        prv = self.prev.pop(gpage)
+        if nxt == gpage:
+            self.hand_hot = self.hand_test = None
+            return
+        self.next[prv] = nxt
+        self.prev[nxt] = prv
+        if self.hand_hot == gpage:
+            self.hand_hot = nxt
+        if self.hand_test == gpage:
+            self.hand_test = nxt
+
+    def _end_test(self, gpage: int):
+        self.test.discard(gpage)
+        self.cold_target = max(1, self.cold_target - 1)
+
+    def _run_hand_hot(self):
+        """Demote one unreferenced hot page, ending test periods on the way."""
+        while True:
+            x = self.hand_hot
+            if x in self.hot:
+                self.hand_hot = self.next[x]
+                if x in self.ref:
+                    self.ref.discard(x)
+                else:
+                    self.hot.discard(x)
+                    self.cold[x] = None
+                    return
+            elif x not in self.frame_of:
+                self._end_test(x)
+                self._unlink(x)
+            else:
+                if x in self.test:
+                    self._end_test(x)
+                self.hand_hot = self.next[x]
+
+    def _run_hand_test(self):
+        """Drop one ghost, ending the test periods of cold pages it passes."""
+        while True:
+            x = self.hand_test
+            if x not in self.frame_of:
+                self._end_test(x)
+                self._unlink(x)
+                return
+            if x in self.test:
+                self._end_test(x)
+            self.hand_test = self.next[x]
+
+    def _balance_hot(self):
+        while self.hot and len(self.hot) > self.capacity - self.cold_target:
+            self._run_hand_hot()
+
+    def _insert(self, frame: int, gpage: int):
+        self.frame_to_page[frame] = gpage
+        self.frame_of[gpage] = frame
+        if gpage in self.next:
+            # ghost re-accessed within its test period: comes back hot
+            self._unlink(gpage)
+            self.test.discard(gpage)
+            self.cold_target = min(self.cold_target + 1, max(1, self.capacity - 1))
+            self._link_head(gpage)
+            self.hot.add(gpage)
+            self._balance_hot()
+        else:
+            self._link_head(gpage)
+            self.cold[gpage] = None
+            self.test.add(gpage)
+
+    def add(self, frame: int, gpage: int):
+        self._insert(frame, gpage)
+
+    def pick_victim(self, incoming: Optional[int] = None) -> Tuple[int, int]:
+        if not self.frame_of:
+            raise RuntimeError("No frames to evict")
+        cold = self.cold
+        while True:
+            if not cold:
+                # every resident page is hot: demote one so hand_cold has a candidate
+                self._run_hand_hot()
+            x = next(iter(cold))
+            if x in self.ref:
+                self.ref.discard(x)
+                if x in self.test:
+                    # re-referenced during its test period: promote
+                    del cold[x]
+                    self.test.discard(x)
+                    self.hot.add(x)
+                    self._balance_hot()
+                else:
+                    # start a new test period at the list head
+                    cold.move_to_end(x)
+                    self.test.add(x)
+                    self._unlink(x)
+                    self._link_head(x)
+                continue
+            del cold[x]
+            frame = self.frame_of.pop(x)
+            del self.frame_to_page[frame]
+            if x in self.test:
+                # keep as a ghost until its test period ends
+                while len(self.next) - len(self.frame_of) > self.capacity:
+                    self._run_hand_test()
+            else:
+                self._unlink(x)
+            return frame, x
+
+    def replace(self, frame: int, gpage: int):
+        self._insert(frame, gpage)
+
+    def touch(self, frame: int, gpage: int):
+        if gpage in self.frame_of:
+            self.ref.add(gpage)
+
+    def remove(self, frame: int):
+        gpage = self.frame_to_page.pop(frame, None)
+        if gpage is None:
+            return
+        del self.frame_of[gpage]
+        self.cold.pop(gpage, None)
+        self.hot.discard(gpage)
+        self.ref.discard(gpage)
+        self.test.discard(gpage)
+        self._unlink(gpage)
+
+    def resize(self, frames_count: int):
+        # surplus ghosts are dropped by the next evictions
+        self.capacity = frames_count
+        self.cold_target = min(self.cold_target, max(1, frames_count - 1))
+
+REPLACERS = {
+    "FIFO": FIFOReplacer,
+    "LRU": LRUReplacer,
+    "CLOCK": ClockReplacer,
+    "ARC": ARCReplacer,
+    "CLOCKPRO": ClockProReplacer,
+}
@@ -0,0 +1,39 @@
+import json
+from Module_1_Paging_Engine.binary_events import (
+    BinaryEventLog, BinaryFileSink, jsonl_to_binary, binary_to_jsonl, RECORD_DTYPE,
+)
+from Module_1_Paging_Engine.event_bus import EventBus
+
+EVENTS = [
+    {"type": "segment_alloc", "pid": 1, "segment": 0, "base": 0, "limit": 32768, "allocator": "first_fit", "time": 1},
+    {"type": "access_request", "pid": 1, "mode": "segmented-paging", "segment": 0, "segment_offset": 64, "access_type": "R", "time": 2},
+    {"type": "seg_translate", "pid": 1, "segment": 0, "segment_offset": 64, "status": "ok", "virtual_page": 1, "page_offset": 64, "time": 3},
+    {"type": "seg_translate", "pid": 2, "segment": 0, "segment_offset": 8, "status": "ok", "phys_addr": 4104, "time": 4},
+    {"type": "page_fault", "pid": 2, "page": 1, "time": 5},
+    {"type": "page_in", "pid": 2, "global_page": 1, "frame": 0, "time": 6},
+    {"type": "analytics_summary", "total_accesses": 1, "total_page_faults": 1, "frames": 4, "time": 7},
+    {"type": "custom", "note": "kept verbatim", "time": 8},
+]
+
+def test_jsonl_roundtrip(tmp_path):
+    src, binf, back = tmp_path / "events.log", tmp_path / "events.bin", tmp_path / "back.log"
+    lines = [json.dumps(e, sort_keys=True) for e in EVENTS]
+    src.write_text("\n".join(lines) + "\n")
+    assert jsonl_to_binary(str(src), str(binf)) == len(EVENTS)
+    assert binary_to_jsonl(str(binf), str(back)) == len(EVENTS)
+    assert back.read_text().splitlines() == lines
+
+def test_memmap_filter_and_counts(tmp_path):
+    path = str(tmp_path / "events.bin")
+    bus = EventBus([BinaryFileSink(path)])
+    for e in EVENTS:
+        bus.emit(dict(e))
+    bus.close()
+    log = BinaryEventLog(path)
+    assert log.records.dtype == RECORD_DTYPE and len(log) == len(EVENTS)
+    counts = log.count_by_type()
+    assert counts["seg_translate"] == 2 and counts["raw"] == 1
+    assert len(log.filter(pid=2)) == 3
+    faults = log.filter(type="page_fault", pid=2)
+    assert list(faults["a"]) == [1] and list(faults["time"]) == [5]
+    assert len(log.filter(type="tlb_hit")) == 0
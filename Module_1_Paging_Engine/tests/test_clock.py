@@ -0,0 +1,19 @@
+from Module_1_Paging_Engine.clock import TickClock, CLOCK
+from Module_1_Paging_Engine import utils as m1_utils
+from Module_2_Segmentation_DemandPaging import utils as m2_utils
+
+def test_modules_share_one_timeline():
+    start = CLOCK.value
+    assert m1_utils.tick() == start + 1
+    assert m2_utils.tick() == start + 2
+    assert m1_utils.tick() == start + 3
+
+def test_checkpoint_and_restore(tmp_path):
+    path = str(tmp_path / "vm_tick.json")
+    clock = TickClock(path=path)
+    for _ in range(5):
+        clock.tick()
+    clock.checkpoint()
+    resumed = TickClock(path=path)
+    assert resumed.restore() == 5
+    assert resumed.tick() == 6
@@ -0,0 +1,32 @@
+import json
+from Module_1_Paging_Engine.event_bus import EventBus, BufferedFileSink, RingBufferSink, NullSink, StdoutSink, BUS
+from Module_1_Paging_Engine import events as ev
+
+def test_buffered_file_sink_batches(tmp_path):
+    path = tmp_path / "events.log"
+    bus = EventBus([BufferedFileSink(str(path), batch_size=2), NullSink()])
+    bus.emit({"type": "a", "time": 1})
+    assert not path.exists()
+    bus.emit({"type": "b", "time": 2})
+    bus.emit({"type": "c", "time": 3})
+    assert len(path.read_text().splitlines()) == 2
+    bus.flush()
+    lines = path.read_text().splitlines()
+    assert [json.loads(l)["type"] for l in lines] == ["a", "b", "c"]
+    assert lines[0] == json.dumps({"type": "a", "time": 1}, sort_keys=True)
+
+def test_module_events_route_through_bus(capsys):
+    ring = BUS.add_sink(RingBufferSink(capacity=2))
+    try:
+        ev.emit_page_fault(1, 5)
+        ev.emit_page_in(1, 5, 0)
+        ev.emit_page_out(1, 5, 0)
+    finally:
+        BUS.remove_sink(ring)
+    assert [e["type"] for e in ring.events] == ["page_in", "page_out"]
+    # stdout sink is not installed by default
+    assert capsys.readouterr().out == ""
+
+def test_stdout_sink(capsys):
+    EventBus([StdoutSink()]).emit({"type": "page_fault", "time": 7})
+    assert capsys.readouterr().out == "[EVENT 7] page_fault\n"
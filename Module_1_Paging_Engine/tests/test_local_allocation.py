@@ -0,0 +1,85 @@
+import pytest
+from Module_1_Paging_Engine.paging_engine import PagingEngine
+from Module_1_Paging_Engine.event_bus import RingBufferSink, BUS
+
+def _replay(pe, steps, loop_pages):
+    """pid 1 cycles over loop_pages pages while pid 2 scans fresh pages."""
+    faults = {1: 0, 2: 0}
+    for i in range(steps):
+        for pid, g in ((1, 1 + i % loop_pages), (2, 10000 + i)):
+            faults[pid] += pe.handle_page_load_request(pid, g)["status"] == "loaded"
+    return faults
+
+def test_local_quota_isolates_scanner():
+    glob = PagingEngine(frames_count=8, policy="FIFO")
+    assert _replay(glob, 500, 5)[1] == 500      # the scan keeps flushing pid 1
+    local = PagingEngine(frames_count=8, policy="FIFO", allocation="local",
+                         initial_quota=5, window=10**9)
+    assert _replay(local, 500, 5) == {1: 5, 2: 500}
+    assert (local.physical.quota_of(1), local.physical.quota_of(2)) == (5, 3)
+
+def test_pff_grows_quota_and_suspends_scanner():
+    ring = BUS.add_sink(RingBufferSink(capacity=100000))
+    try:
+        pe = PagingEngine(frames_count=8, policy="FIFO", allocation="local", window=16)
+        faults = _replay(pe, 2000, 5)
+    finally:
+        BUS.remove_sink(ring)
+    pool = pe.physical
+    assert pool.committed <= 8
+    # PFF hovers pid 1 around its 5-page loop; the scanner ends confined to one frame
+    assert pool.quota_of(1) >= 4 and pool.quota_of(2) == 1
+    assert pool.pids[2].resident <= 1
+    assert faults[1] < 1000
+    types = [e["type"] for e in ring.events]
+    assert "process_suspend" in types
+    grow = next(e for e in ring.events if e["type"] == "pff_quota_change" and e["pid"] == 1)
+    assert grow["new_quota"] == grow["old_quota"] + 1 and grow["faults"] / grow["window"] > pool.upper
+    sus = next(e for e in ring.events if e["type"] == "process_suspend")
+    assert sus["pid"] == 2 and sus["quota"] > 1
+
+def test_unknown_allocation_mode():
+    with pytest.raises(ValueError):
+        PagingEngine(frames_count=4, allocation="shared")
+
+def _check_ownership(pe):
+    """Every frame holds the page the page table maps there, owned by that page's pid."""
+    pool = pe.physical
+    for frame in range(pool.frames_count):
+        gpage = pool.page_at(frame)
+        if gpage is None:
+            assert pool.owners[frame] == -1
+            continue
+        assert pool.frame_of(gpage) == frame
+        pid = pool.owners[frame]
+        assert pool.pids[pid].replacer.slot_of.get(frame) is not None
+    for pid, st in pool.pids.items():
+        owned = st.replacer.slot_of
+        assert len(owned) == st.resident <= max(st.quota, 1)
+        assert all(pool.owners[f] == pid for f in owned)
+
+@pytest.mark.parametrize("policy", ["CLOCK", "ARC", "CLOCKPRO", "LRU"])
+def test_local_replacer_only_evicts_own_frames(policy):
+    pe = PagingEngine(frames_count=8, policy=policy, allocation="local", initial_quota=2, window=10**9)
+    # pid 1 loops over 2 pages; pids 2-4 each cycle through 3 pages in their 2 frames
+    faults = 0
+    for i in range(300):
+        faults += pe.handle_page_load_request(1, 1 + i % 2)["status"] == "loaded"
+        for pid in (2, 3, 4):
+            pe.handle_page_load_request(pid, pid * 100 + i % 3)
+        _check_ownership(pe)
+    assert faults == 2      # nobody else's fault may take pid 1's frames
+    assert [pe.physical.pids[p].resident for p in (1, 2, 3, 4)] == [2, 2, 2, 2]
+
+@pytest.mark.parametrize("policy", ["CLOCK", "ARC", "CLOCKPRO"])
+def test_local_quota_changes_keep_replacers_consistent(policy):
+    pe = PagingEngine(frames_count=8, policy=policy, allocation="local", window=16)
+    for i in range(2000):
+        pe.handle_page_load_request(1, 1 + i % 5)
+        pe.handle_page_load_request(2, 10000 + i)
+        _check_ownership(pe)
+    pool = pe.physical
+    assert pool.committed <= 8
+    # pid 1's 5-page loop ends up (nearly) resident; its replacer stays quota-sized
+    assert pool.quota_of(1) >= 4
+    assert len(pool.pids[1].replacer.slot_frames) <= 8
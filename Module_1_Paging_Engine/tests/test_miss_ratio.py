@@ -0,0 +1,47 @@
+import random
+import numpy as np
+from Module_1_Paging_Engine import miss_ratio
+from Module_1_Paging_Engine.miss_ratio import miss_ratio_curve, count_faults, opt_stack_distances
+from Module_1_Paging_Engine.optimal import simulate_optimal
+
+def random_trace(seed, n=500, pages=24):
+    rng = random.Random(seed)
+    return [rng.randint(1, pages) for _ in range(n)]
+
+def test_lru_curve_matches_replay():
+    trace = random_trace(1)
+    curve = miss_ratio_curve(trace, "LRU", max_frames=30)
+    assert sorted(curve) == list(range(1, 31))
+    for frames in (1, 2, 5, 12, 24, 30):
+        assert curve[frames] == count_faults(trace, frames, "LRU")
+
+def test_opt_curve_matches_belady():
+    trace = random_trace(2)
+    curve = miss_ratio_curve(trace, "OPT")
+    for frames, faults in curve.items():
+        assert faults == simulate_optimal(trace, frames).faults
+
+def test_opt_depth_limit_keeps_the_top_of_the_stack_exact():
+    for seed in range(20):
+        trace = random_trace(seed, n=300, pages=5 + seed)
+        full = opt_stack_distances(trace)
+        for depth in (1, 2, 4, 9):
+            hist = opt_stack_distances(trace, max_depth=depth)
+            assert hist[:depth + 1] == full[:depth + 1] and not any(hist[depth + 1:])
+    trace = random_trace(4)
+    curve = miss_ratio_curve(trace, "OPT", max_frames=6)
+    assert curve == {f: simulate_optimal(trace, f).faults for f in range(1, 7)}
+
+def test_fifo_falls_back_to_replay():
+    trace = random_trace(3, n=200, pages=8)
+    curve = miss_ratio_curve(trace, "FIFO", max_frames=6)
+    assert curve == {f: count_faults(trace, f, "FIFO") for f in range(1, 7)}
+
+def test_arrays_are_read_in_chunks_with_the_same_results(tmp_path, monkeypatch):
+    monkeypatch.setattr(miss_ratio, "CHUNK_SIZE", 7)
+    trace = random_trace(4)
+    np.save(tmp_path / "t.npy", np.asarray(trace, dtype=np.int64))
+    pages = np.load(tmp_path / "t.npy", mmap_mode="r")
+    for policy in ("LRU", "OPT", "FIFO", "CLOCK"):
+        assert miss_ratio_curve(pages, policy, max_frames=10) == miss_ratio_curve(trace, policy, max_frames=10)
+    assert miss_ratio_curve(pages, "LRU") == miss_ratio_curve(trace, "LRU")
@@ -0,0 +1,61 @@
+import csv
+import random
+from pathlib import Path
+import pytest
+from Module_1_Paging_Engine.optimal import simulate_optimal
+from Module_1_Paging_Engine.paging_engine import PagingEngine
+
+TRACES = Path(__file__).resolve().parents[2] / "Combined_Demo_Tool" / "traces"
+
+def reference_optimal(trace, frames_count):
+    # original rescanning implementation, kept as an oracle
+    frames = {}
+    faults = 0
+    victims = []
+    for i, page in enumerate(trace):
+        if page in frames:
+            continue
+        faults += 1
+        if len(frames) < frames_count:
+            frames[page] = None
+            continue
+        farthest_page = None
+        farthest_idx = -1
+        for p in list(frames.keys()):
+            next_idx = next((j for j in range(i+1, len(trace)) if trace[j] == p), None)
+            if next_idx is None:
+                farthest_page = p
+                break
+            if next_idx > farthest_idx:
+                farthest_idx = next_idx
+                farthest_page = p
+        del frames[farthest_page]
+        victims.append(farthest_page)
+        frames[page] = None
+    return faults, victims
+
+def load_pages(path):
+    ids = {}
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            key = (row["pid"], row["segment"], int(row["segment_offset"]) // 4096)
+            ids.setdefault(key, len(ids) + 1)
+            yield ids[key]
+
+@pytest.mark.parametrize("name", ["locality.csv", "sequential.csv", "mixed_multi.csv"])
+def test_matches_reference_on_sample_traces(name):
+    trace = list(load_pages(TRACES / name))
+    for frames in range(1, 9):
+        faults, _ = reference_optimal(trace, frames)
+        assert PagingEngine.optimal_faults_for_trace(trace, frames) == faults
+
+def test_victims_and_hits_match_reference():
+    rng = random.Random(7)
+    trace = [rng.randint(1, 12) for _ in range(400)]
+    for frames in (1, 3, 5, 8):
+        faults, victims = reference_optimal(trace, frames)
+        res = simulate_optimal(trace, frames)
+        assert res.faults == faults
+        assert res.victims == victims
+        assert len(res.hits) == len(trace)
+        assert len(trace) - sum(res.hits) == faults
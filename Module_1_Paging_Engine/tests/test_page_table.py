@@ -0,0 +1,23 @@
+from Module_1_Paging_Engine.page_table import PageTable
+from Module_1_Paging_Engine.paging_engine import PagingEngine
+
+def test_view_api_and_growth():
+    pt = PageTable(capacity=4)
+    pte = pt.ensure(1000)
+    assert len(pt.flags) >= 1001 and 1000 in pt and 999 not in pt
+    assert not pte.present and pte.frame is None
+    pte.present, pte.frame, pte.dirty = True, 3, True
+    assert pt[1000].frame == 3 and pt.is_present(1000) and pt[1000].dirty
+    pte.dirty = False
+    assert not pt[1000].dirty and pt[1000].present
+    assert list(pt) == [1000] and len(pt) == 1
+    assert pt.get(5) is None
+
+def test_engine_keeps_pte_view(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pe = PagingEngine(frames_count=1, policy="LRU")
+    pe.handle_page_load_request(pid=1, gpage=7, access_type="W")
+    assert pe.ptes[7].present and pe.ptes[7].dirty and pe.ptes[7].frame == 0
+    pe.handle_page_load_request(pid=1, gpage=8, access_type="R")
+    assert not pe.ptes[7].present and pe.ptes[7].frame is None
+    assert pe.ensure_pte(8).referenced
@@ -0,0 +1,25 @@
+from Module_1_Paging_Engine.physical_memory import PhysicalMemory
+
+def test_allocate_returns_frame_and_victim():
+    pm = PhysicalMemory(frames_count=2, policy="FIFO")
+    assert pm.allocate_frame(10) == (0, None)
+    assert pm.allocate_frame(20) == (1, None)
+    # full: FIFO evicts page 10 from frame 0
+    assert pm.allocate_frame(1000) == (0, 10)
+    assert pm.frame_of(10) is None
+    assert pm.frame_of(1000) == 0
+    assert pm.page_at(0) == 1000
+    assert pm.set_frame_for(20) == 1
+
+def test_free_frame_is_reused_first():
+    pm = PhysicalMemory(frames_count=3, policy="LRU")
+    for page in (1, 2, 3):
+        pm.allocate_frame(page)
+    pm.free_frame(1)
+    assert pm.page_at(1) is None and pm.frame_of(2) is None
+    assert pm.allocate_frame(4) == (1, None)
+
+def test_unknown_policy_raises():
+    import pytest
+    with pytest.raises(ValueError):
+        PhysicalMemory(frames_count=2, policy="MRU")
@@ -1,5 +1,6 @@
 import pytest
-from Module_1_Paging_Engine.replacement_algorithms import FIFOReplacer, LRUReplacer, ClockReplacer
+from Module_1_Paging_Engine.replacement_algorithms import FIFOReplacer, LRUReplacer, ClockReplacer, ARCReplacer, ClockProReplacer
+from Module_1_Paging_Engine.physical_memory import PhysicalMemory
 
 def test_fifo_basic():
     r = FIFOReplacer(3)
@@ -20,4 +21,160 @@ def test_clock_cycles():
     r.add(0, 1); r.add(1, 2); r.add(2, 3)
     # repeatedly pick to ensure it returns a victim without error
     v,p = r.pick_victim()
-    assert isinstance(v, int)
\ No newline at end of file
+    assert isinstance(v, int)
+
+def _faults(policy, trace, frames):
+    pm = PhysicalMemory(frames_count=frames, policy=policy)
+    faults = 0
+    for g in trace:
+        f = pm.frame_of(g)
+        if f is None:
+            faults += 1
+            pm.allocate_frame(g)
+        else:
+            pm.touch_frame(f, g)
+    return faults, pm.replacer
+
+def test_arc_ghost_hit_adapts_and_promotes():
+    r = ARCReplacer(2)
+    r.add(0, 1); r.add(1, 2)
+    r.touch(1, 2)                          # page 2 moves to T2
+    assert r.pick_victim(3) == (0, 1)      # LRU of T1 goes to ghost list B1
+    r.replace(0, 3)
+    assert list(r.b1) == [1]
+    assert r.pick_victim(1) == (1, 2)      # B1 ghost hit raises the T1 target, so T2 gives up a page
+    assert r.p == 1.0
+    r.replace(1, 1)
+    assert 1 in r.t2 and 1 not in r.b1 and list(r.b2) == [2]
+
+@pytest.mark.parametrize("policy", ["ARC", "CLOCKPRO"])
+def test_adaptive_policies_resist_scans(policy):
+    # a small hot set mixed with a one-time scan: LRU lets the scan flush the hot pages
+    import random
+    rng = random.Random(0)
+    trace = [rng.randrange(4) if rng.random() < 0.6 else 10000 + i for i in range(2000)]
+    lru, _ = _faults("LRU", trace, 4)
+    got, r = _faults(policy, trace, 4)
+    assert got < lru
+    ghosts = len(r.b1) + len(r.b2) if policy == "ARC" else len(r.next) - len(r.frame_of)
+    assert ghosts <= 4
+
+def test_clockpro_state_stays_consistent():
+    import random
+    rng = random.Random(5)
+    pm = PhysicalMemory(frames_count=8, policy="CLOCK-Pro")
+    r = pm.replacer
+    assert isinstance(r, ClockProReplacer)
+    for _ in range(3000):
+        g = rng.randrange(40) if rng.random() < 0.7 else rng.randrange(40, 4000)
+        f = pm.frame_of(g)
+        if f is None:
+            pm.allocate_frame(g)
+        else:
+            pm.touch_frame(f, g)
+        resident = {pm.page_at(i) for i in range(8)} - {None}
+        assert set(r.frame_of) == resident == set(r.cold) | r.hot
+        assert len(r.next) - len(r.frame_of) <= 8
+
+# The list-based FIFO/LRU/Clock replacers the current ones replaced, kept as a reference.
+class _ListFIFO:
+    def __init__(self, frames_count):
+        self.queue = []
+        self.frame_to_page = {}
+
+    def add(self, frame, gpage):
+        self.queue.append(frame)
+        self.frame_to_page[frame] = gpage
+
+    def pick_victim(self):
+        victim = self.queue.pop(0)
+        return victim, self.frame_to_page.get(victim)
+
+    replace = add
+
+    def touch(self, frame, gpage):
+        pass
+
+    def remove(self, frame):
+        if frame in self.queue:
+            self.queue.remove(frame)
+        self.frame_to_page.pop(frame, None)
+
+class _ListLRU(_ListFIFO):
+    def add(self, frame, gpage):
+        if frame in self.queue:
+            self.queue.remove(frame)
+        self.queue.append(frame)
+        self.frame_to_page[frame] = gpage
+
+    replace = add
+
+    def touch(self, frame, gpage):
+        if frame in self.queue:
+            self.queue.remove(frame)
+        self.queue.append(frame)
+
+class _ListClock:
+    def __init__(self, frames_count):
+        self.frames = [None] * frames_count
+        self.use_bits = {}
+        self.pointer = 0
+
+    def add(self, frame, gpage):
+        self.frames[frame] = gpage
+        self.use_bits[frame] = 1
+
+    def pick_victim(self):
+        n = len(self.frames)
+        for _ in range(2*n):
+            idx = self.pointer % n
+            if self.use_bits.get(idx, 0) == 0:
+                self.pointer = (idx + 1) % n
+                return idx, self.frames[idx]
+            self.use_bits[idx] = 0
+            self.pointer = (self.pointer + 1) % n
+        victim = self.pointer % n
+        return victim, self.frames[victim]
+
+    def replace(self, frame, gpage):
+        self.frames[frame] = gpage
+        self.use_bits[frame] = 1
+        self.pointer = (frame + 1) % len(self.frames)
+
+    def touch(self, frame, gpage):
+        self.use_bits[frame] = 1
+
+    def remove(self, frame):
+        self.frames[frame] = None
+        self.use_bits.pop(frame, None)
+
+@pytest.mark.parametrize("new_cls, old_cls", [(FIFOReplacer, _ListFIFO), (LRUReplacer, _ListLRU),
+                                              (ClockReplacer, _ListClock)])
+@pytest.mark.parametrize("seed", range(5))
+def test_replacers_match_the_list_based_versions(new_cls, old_cls, seed):
+    import random
+    rng = random.Random(seed)
+    frames = rng.randrange(1, 9)
+    new, old = new_cls(frames), old_cls(frames)
+    page_at = {}                  # resident frame -> page
+    free = list(range(frames))
+    for page in range(3000):
+        op = rng.random()
+        if page_at and op < 0.4:
+            frame = rng.choice(sorted(page_at))
+            new.touch(frame, page_at[frame]); old.touch(frame, page_at[frame])
+        elif page_at and op < 0.45:
+            frame = rng.choice(sorted(page_at))
+            del page_at[frame]
+            new.remove(frame); old.remove(frame)
+            free.append(frame)
+        elif free:
+            frame = free.pop(rng.randrange(len(free)))
+            page_at[frame] = page
+            new.add(frame, page); old.add(frame, page)
+        else:
+            # victims are only picked with every frame resident, as PhysicalMemory does
+            victim = new.pick_victim(page)
+            assert victim == old.pick_victim() and victim[1] == page_at[victim[0]]
+            page_at[victim[0]] = page
+            new.replace(victim[0], page); old.replace(victim[0], page)
@@ -13,4 +13,36 @@ def test_tlb_insert_lookup(tmp_path, monkeypatch):
     tlb.insert(pid=1, gpage=6, frame=1)
     # insert third to evict LRU (5)
     tlb.insert(pid=1, gpage=7, frame=2)
-    assert tlb.lookup(pid=1, gpage=5) is None
\ No newline at end of file
+    assert tlb.lookup(pid=1, gpage=5) is None
+
+def test_tlb_sets_asids_and_shootdown(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    tlb = TLB(size=4, associativity=2)
+    assert tlb.num_sets == 2
+    # pages 0, 2, 4 share set 0; 4 evicts the LRU entry (2, since 0 was just used)
+    tlb.insert(1, 0, 10); tlb.insert(1, 2, 11)
+    assert tlb.lookup(1, 0) == 10
+    tlb.insert(1, 4, 12)
+    assert tlb.lookup(1, 2) is None and tlb.lookup(1, 4) == 12
+    # set 1 is untouched; the same page under another ASID is a separate entry
+    tlb.insert(1, 1, 13); tlb.insert(2, 1, 14)
+    assert tlb.lookup(2, 1) == 14 and tlb.lookup(3, 1) is None
+    assert tlb.shootdown(1) == 2 and tlb.lookup(1, 1) is None
+    assert tlb.flush_asid(1) == 2 and len(tlb) == 0
+    assert (tlb.hits, tlb.misses, tlb.shootdowns) == (3, 3, 2) and tlb.hit_rate == 0.5
+    with pytest.raises(ValueError):
+        TLB(size=6, associativity=4)
+
+def test_engine_translate_uses_tlb_and_shoots_down(tmp_path, monkeypatch):
+    from Module_1_Paging_Engine.paging_engine import PagingEngine
+    monkeypatch.chdir(tmp_path)
+    tlb = TLB(size=4, associativity=2)
+    pe = PagingEngine(frames_count=2, policy="LRU", tlb=tlb)
+    assert pe.translate(1, 0)["status"] == "loaded"
+    assert pe.translate(1, 1)["status"] == "loaded"
+    frame = pe.translate(1, 0, access_type="W")["frame"]
+    assert tlb.hits == 1 and pe.ptes[0].dirty and pe.ptes[0].frame == frame
+    # page 1 is LRU: loading page 2 evicts it and its TLB entry goes too
+    pe.translate(1, 2)
+    assert not pe.is_present(1) and tlb.lookup(1, 1) is None
+    assert pe.translate(1, 1)["status"] == "loaded"
@@ -1,40 +1,93 @@
 """
-Small associative TLB implementation with event emissions for tlb_hit / tlb_miss.
+Set-associative TLB with ASID tags, event emissions for tlb_hit / tlb_miss, and shootdown.
 
-The TLB maps virtual page -> frame (global_page -> frame).
-On lookup, emits 'tlb_hit' or 'tlb_miss'.
+The TLB maps (asid, global_page) -> frame; the pid is used as the ASID.
+size entries are split into size // associativity sets (associativity=None
+means fully associative); a page always lives in set gpage % sets. Each set
+is an OrderedDict in LRU order, so lookup, insert and replacement are O(1)
+and shootdown(gpage) only scans one set. flush_asid(pid) drops a whole
+address space.
+On lookup, emits 'tlb_hit' or 'tlb_miss'; hits/misses/shootdowns are counted.
 """
 
-from typing import Dict, Optional, Tuple
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from .utils import emit_event
 
 class TLB:
-    def __init__(self, size: int = 8):
-        
+    def __init__(self, size: int = 8, associativity: Optional[int] = None):
+        if associativity is None:
+            associativity = size
+        if size < 1 or associativity < 1 or size % associativity:
+            raise ValueError("TLB size must be a positive multiple of associativity")
         self.size = size
-        self.store: Dict[int, int] = {}  # gpage -> frame
-        self.order: List[int] = []
+        self.associativity = associativity
+        self.num_sets = size // associativity
+        # one LRU-ordered map per set: (asid, gpage) -> frame
+        self.sets: List["OrderedDict[Tuple[int, int], int]"] = [OrderedDict() for _ in range(self.num_sets)]
+        self.hits = 0
+        self.misses = 0
+        self.shootdowns = 0
+
+    def _set(self, gpage: int) -> "OrderedDict[Tuple[int, int], int]":
+        return self.sets[gpage % self.num_sets]
 
     def lookup(self, pid: int, gpage: int) -> Optional[int]:
-        if gpage in self.store:
+        entries = self._set(gpage)
+        key = (pid, gpage)
+        frame = entries.get(key)
+        if frame is not None:
+            self.hits += 1
             ev = {"type": "tlb_hit", "pid": pid, "global_page": gpage}
             emit_event(ev)
-            # update LRU-like order
-            if gpage in self.order:
-                self.order.remove(gpage)
-                self.order.append(gpage)
-            return self.store[gpage]
-        else:
-            ev = {"type": "tlb_miss", "pid": pid, "global_page": gpage}
-            emit_event(ev)
-            return None
+            entries.move_to_end(key)
+            return frame
+        self.misses += 1
+        ev = {"type": "tlb_miss", "pid": pid, "global_page": gpage}
+        emit_event(ev)
+        return None
 
     def insert(self, pid: int, gpage: int, frame: int):
-        if gpage in self.store:
-            self.order.remove(gpage)
-        elif len(self.store) >= self.size:
-            # evict least recently used
-            victim = self.order.pop(0)
-            del self.store[victim]
-        self.store[gpage] = frame
-        self.order.append(gpage)
\ No newline at end of file
+        entries = self._set(gpage)
+        key = (pid, gpage)
+        if key in entries:
+            entries.move_to_end(key)
+        elif len(entries) >= self.associativity:
+            # evict least recently used entry of this set
+            entries.popitem(last=False)
+        entries[key] = frame
+
+    def shootdown(self, gpage: int) -> int:
+        """Invalidate gpage under every ASID; returns the number of entries dropped."""
+        entries = self._set(gpage)
+        stale = [key for key in entries if key[1] == gpage]
+        for key in stale:
+            del entries[key]
+        self.shootdowns += len(stale)
+        return len(stale)
+
+    def flush_asid(self, pid: int) -> int:
+        """Drop every entry tagged with pid (e.g. when the process is swapped out)."""
+        dropped = 0
+        for entries in self.sets:
+            stale = [key for key in entries if key[0] == pid]
+            for key in stale:
+                del entries[key]
+            dropped += len(stale)
+        return dropped
+
+    def flush(self):
+        for entries in self.sets:
+            entries.clear()
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self.sets)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {"hits": self.hits, "misses": self.misses, "shootdowns": self.shootdowns,
+                "hit_rate": self.hit_rate}
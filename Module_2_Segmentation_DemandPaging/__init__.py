@@ -8,4 +8,5 @@ __all__ = [
     "global_page_registry",
     "segmentation_engine",
     "demand_controller",
+    "prefetcher",
 ]
@@ -1,88 +1,428 @@
 """
-SimpleAllocator: deterministic first_fit, best_fit, worst_fit and free/merge.
+SimpleAllocator: deterministic first_fit, best_fit, worst_fit, next_fit and free/merge.
+BuddyAllocator / SegregatedFitAllocator: power-of-two allocators with allocate/free_block.
 
 The allocator manages an address space (0 .. space_size-1) and tracks allocated blocks.
 Blocks are represented as (base, size). Merging occurs on free.
+
+Free space is indexed twice, each in a treap (O(log n) expected per operation):
+- by address, augmented with the largest block size in each subtree, for
+  first/next fit and neighbour coalescing on free
+- by (size, base), for best and worst fit
+Placement decisions are the same as scanning the address-sorted free list.
 """
 
-from typing import List, Tuple, Optional
+import heapq
+import random
+from typing import Dict, List, Tuple, Optional, Any
+
+class _Node:
+    __slots__ = ("key", "val", "prio", "left", "right", "maxval")
+
+    def __init__(self, key, val, prio):
+        self.key = key
+        self.val = val
+        self.prio = prio
+        self.left = None
+        self.right = None
+        self.maxval = val
+
+def _update(t: _Node) -> None:
+    m = t.val
+    if t.left is not None and t.left.maxval > m:
+        m = t.left.maxval
+    if t.right is not None and t.right.maxval > m:
+        m = t.right.maxval
+    t.maxval = m
+
+def _split(t: Optional[_Node], key) -> Tuple[Optional[_Node], Optional[_Node]]:
+    """Split into (keys < key, keys >= key)."""
+    if t is None:
+        return None, None
+    if t.key < key:
+        t.right, r = _split(t.right, key)
+        _update(t)
+        return t, r
+    l, t.left = _split(t.left, key)
+    _update(t)
+    return l, t
+
+def _merge(a: Optional[_Node], b: Optional[_Node]) -> Optional[_Node]:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.prio > b.prio:
+        a.right = _merge(a.right, b)
+        _update(a)
+        return a
+    b.left = _merge(a, b.left)
+    _update(b)
+    return b
+
+def _insert(t: Optional[_Node], node: _Node) -> _Node:
+    if t is None:
+        return node
+    if node.prio > t.prio:
+        node.left, node.right = _split(t, node.key)
+        _update(node)
+        return node
+    if node.key < t.key:
+        t.left = _insert(t.left, node)
+    else:
+        t.right = _insert(t.right, node)
+    _update(t)
+    return t
+
+def _delete(t: Optional[_Node], key) -> Optional[_Node]:
+    if t is None:
+        raise KeyError(key)
+    if t.key == key:
+        return _merge(t.left, t.right)
+    if key < t.key:
+        t.left = _delete(t.left, key)
+    else:
+        t.right = _delete(t.right, key)
+    _update(t)
+    return t
+
+def _first_fit(t: Optional[_Node], need, lo) -> Optional[_Node]:
+    """Leftmost node with key >= lo and val >= need."""
+    if t is None or t.maxval < need:
+        return None
+    if t.key >= lo:
+        found = _first_fit(t.left, need, lo)
+        if found is not None:
+            return found
+        if t.val >= need:
+            return t
+    return _first_fit(t.right, need, lo)
+
+class _Treap:
+    """Ordered map with subtree-max augmentation on values."""
+    def __init__(self, seed: int = 0):
+        self.root: Optional[_Node] = None
+        self.size = 0
+        self._rng = random.Random(seed)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def insert(self, key, val) -> None:
+        self.root = _insert(self.root, _Node(key, val, self._rng.random()))
+        self.size += 1
+
+    def delete(self, key) -> None:
+        self.root = _delete(self.root, key)
+        self.size -= 1
+
+    def ceiling(self, key) -> Optional[_Node]:
+        """Smallest node with node.key >= key."""
+        t, best = self.root, None
+        while t is not None:
+            if t.key >= key:
+                best, t = t, t.left
+            else:
+                t = t.right
+        return best
+
+    def floor(self, key) -> Optional[_Node]:
+        """Largest node with node.key <= key."""
+        t, best = self.root, None
+        while t is not None:
+            if t.key <= key:
+                best, t = t, t.right
+            else:
+                t = t.left
+        return best
+
+    def max_node(self) -> Optional[_Node]:
+        t = self.root
+        while t is not None and t.right is not None:
+            t = t.right
+        return t
+
+    def first_fit(self, need, lo) -> Optional[_Node]:
+        return _first_fit(self.root, need, lo)
+
+    def items(self) -> List[Tuple[Any, Any]]:
+        out, stack, t = [], [], self.root
+        while stack or t is not None:
+            while t is not None:
+                stack.append(t)
+                t = t.left
+            t = stack.pop()
+            out.append((t.key, t.val))
+            t = t.right
+        return out
+
+def fragmentation_report(requested: int, reserved: int, free_bytes: int, largest_free: int) -> Dict[str, float]:
+    """
+    internal: share of reserved bytes not asked for (rounding waste)
+    external: 1 - largest_free / free_bytes (free space unusable for one big request)
+    """
+    return {
+        "requested_bytes": requested,
+        "reserved_bytes": reserved,
+        "free_bytes": free_bytes,
+        "largest_free": largest_free,
+        "internal": (reserved - requested) / reserved if reserved else 0.0,
+        "external": 1 - largest_free / free_bytes if free_bytes else 0.0,
+    }
 
 class SimpleAllocator:
     def __init__(self, space_size: int):
         self.space_size = space_size
-        # maintain free list as list of (base, size) sorted by base
-        self.free: List[Tuple[int, int]] = [(0, space_size)]
+        # free blocks indexed by base (val = size) and by (size, base)
+        self.by_addr = _Treap(seed=1)
+        self.by_size = _Treap(seed=2)
+        self._add_free(0, space_size)
         # allocated map: base -> size
         self.allocated = {}
+        # next_fit roving pointer: address where the last next_fit search stopped
+        self.rover = 0
 
-    def _merge_free(self):
-        self.free.sort()
-        merged = []
-        for base, size in self.free:
-            if not merged:
-                merged.append((base, size))
-            else:
-                last_base, last_size = merged[-1]
-                if last_base + last_size == base:
-                    merged[-1] = (last_base, last_size + size)
-                else:
-                    merged.append((base, size))
-        self.free = merged
+    @property
+    def free(self) -> List[Tuple[int, int]]:
+        """Free list as (base, size) sorted by base."""
+        return self.by_addr.items()
+
+    def _add_free(self, base: int, size: int) -> None:
+        self.by_addr.insert(base, size)
+        self.by_size.insert((size, base), 0)
+
+    def _remove_free(self, base: int, size: int) -> None:
+        self.by_addr.delete(base)
+        self.by_size.delete((size, base))
+
+    def _take(self, base: int, sz: int, size: int) -> int:
+        # allocate `size` at the start of free block (base, sz), keeping the remainder free
+        self._remove_free(base, sz)
+        if sz != size:
+            self._add_free(base + size, sz - size)
+        self.allocated[base] = size
+        return base
 
     def first_fit(self, size: int) -> Optional[int]:
-        for i, (base, sz) in enumerate(self.free):
-            if sz >= size:
-                alloc_base = base
-                self.allocated[alloc_base] = size
-                # shrink or remove
-                if sz == size:
-                    self.free.pop(i)
-                else:
-                    self.free[i] = (base + size, sz - size)
-                return alloc_base
-        return None
+        node = self.by_addr.first_fit(size, -1)
+        if node is None:
+            return None
+        return self._take(node.key, node.val, size)
 
     def best_fit(self, size: int) -> Optional[int]:
-        best_i = None
-        best_sz = None
-        for i, (base, sz) in enumerate(self.free):
-            if sz >= size:
-                if best_sz is None or sz < best_sz:
-                    best_sz = sz
-                    best_i = i
-        if best_i is None:
+        node = self.by_size.ceiling((size, -1))
+        if node is None:
             return None
-        base, sz = self.free[best_i]
-        alloc_base = base
-        self.allocated[alloc_base] = size
-        if sz == size:
-            self.free.pop(best_i)
-        else:
-            self.free[best_i] = (base + size, sz - size)
-        return alloc_base
+        sz, base = node.key
+        return self._take(base, sz, size)
 
     def worst_fit(self, size: int) -> Optional[int]:
-        worst_i = None
-        worst_sz = -1
-        for i, (base, sz) in enumerate(self.free):
-            if sz >= size and sz > worst_sz:
-                worst_sz = sz
-                worst_i = i
-        if worst_i is None:
+        largest = self.by_size.max_node()
+        if largest is None or largest.key[0] < size:
             return None
-        base, sz = self.free[worst_i]
-        alloc_base = base
-        self.allocated[alloc_base] = size
-        if sz == size:
-            self.free.pop(worst_i)
-        else:
-            self.free[worst_i] = (base + size, sz - size)
-        return alloc_base
+        # lowest base among the largest blocks
+        sz, base = self.by_size.ceiling((largest.key[0], -1)).key
+        return self._take(base, sz, size)
+
+    def next_fit(self, size: int) -> Optional[int]:
+        """First fit starting at the roving pointer, wrapping around to address 0."""
+        node = self.by_addr.first_fit(size, self.rover)
+        if node is None:
+            node = self.by_addr.first_fit(size, -1)
+        if node is None:
+            return None
+        base = self._take(node.key, node.val, size)
+        self.rover = base + size
+        return base
 
     def free_block(self, base: int) -> bool:
         size = self.allocated.pop(base, None)
         if size is None:
             return False
-        self.free.append((base, size))
-        self._merge_free()
+        # coalesce with address neighbours
+        prev = self.by_addr.floor(base - 1)
+        if prev is not None and prev.key + prev.val == base:
+            pbase, psize = prev.key, prev.val
+            self._remove_free(pbase, psize)
+            base, size = pbase, psize + size
+        nxt = self.by_addr.ceiling(base + size)
+        if nxt is not None and nxt.key == base + size:
+            nbase, nsize = nxt.key, nxt.val
+            self._remove_free(nbase, nsize)
+            size += nsize
+        self._add_free(base, size)
+        return True
+
+    def fragmentation(self) -> Dict[str, float]:
+        used = sum(self.allocated.values())
+        largest = self.by_size.max_node()
+        return fragmentation_report(used, used, self.space_size - used, largest.key[0] if largest else 0)
+
+class BuddyAllocator:
+    """
+    Binary buddy allocator. Requests are rounded up to a power of two (at least
+    min_block); free blocks of each order sit in a set plus a lazy min-heap so
+    the lowest address is handed out first. Allocate and free are O(log space).
+    A space that is not a power of two is covered by its largest aligned blocks.
+    """
+    def __init__(self, space_size: int, min_block: int = 1):
+        self.space_size = space_size
+        self.min_order = max(0, (min_block - 1).bit_length())
+        self.max_order = max(space_size.bit_length() - 1, self.min_order)
+        self.free_sets: List[set] = [set() for _ in range(self.max_order + 1)]
+        self._heaps: List[List[int]] = [[] for _ in range(self.max_order + 1)]
+        # allocated map: base -> (requested size, order)
+        self.allocated: Dict[int, Tuple[int, int]] = {}
+        self.requested = 0
+        self.reserved = 0
+        base = 0
+        while space_size - base >= 1 << self.min_order:
+            order = (space_size - base).bit_length() - 1
+            self._push(base, order)
+            base += 1 << order
+
+    def _push(self, base: int, order: int) -> None:
+        self.free_sets[order].add(base)
+        heap = self._heaps[order]
+        heapq.heappush(heap, base)
+        if len(heap) > 2 * len(self.free_sets[order]) + 64:
+            self._heaps[order] = sorted(self.free_sets[order])
+
+    def _pop_lowest(self, order: int) -> int:
+        free, heap = self.free_sets[order], self._heaps[order]
+        while True:
+            base = heapq.heappop(heap)
+            if base in free:
+                free.remove(base)
+                return base
+
+    def order_for(self, size: int) -> int:
+        return max(self.min_order, (size - 1).bit_length())
+
+    def allocate(self, size: int) -> Optional[int]:
+        order = self.order_for(size)
+        j = order
+        while j <= self.max_order and not self.free_sets[j]:
+            j += 1
+        if j > self.max_order:
+            return None
+        base = self._pop_lowest(j)
+        # split down, returning the upper halves to the free lists
+        while j > order:
+            j -= 1
+            self._push(base + (1 << j), j)
+        self.allocated[base] = (size, order)
+        self.requested += size
+        self.reserved += 1 << order
+        return base
+
+    def free_block(self, base: int) -> bool:
+        entry = self.allocated.pop(base, None)
+        if entry is None:
+            return False
+        size, order = entry
+        self.requested -= size
+        self.reserved -= 1 << order
+        while order < self.max_order:
+            buddy = base ^ (1 << order)
+            if buddy not in self.free_sets[order]:
+                break
+            self.free_sets[order].remove(buddy)
+            base = min(base, buddy)
+            order += 1
+        self._push(base, order)
         return True
+
+    def fragmentation(self) -> Dict[str, float]:
+        free_bytes = sum(len(f) << k for k, f in enumerate(self.free_sets))
+        largest = next((1 << k for k in range(self.max_order, -1, -1) if self.free_sets[k]), 0)
+        return fragmentation_report(self.requested, self.reserved, free_bytes, largest)
+
+class SegregatedFitAllocator:
+    """
+    Segregated fit with power-of-two size classes: class c holds free blocks of
+    size in [2^c, 2^(c+1)). A request is rounded up to 2^c and served from the
+    lowest address in the smallest non-empty class >= c (found in O(1) from a
+    bitmask); the rest of the block is split off into its own class. Free
+    blocks are also indexed by start and end address so free_block coalesces
+    both neighbours in O(1). Allocate and free are O(log n) for the heaps.
+    """
+    def __init__(self, space_size: int, min_block: int = 1):
+        self.space_size = space_size
+        self.min_order = max(0, (min_block - 1).bit_length())
+        nclasses = max(space_size.bit_length(), 1)
+        self._heaps: List[List[int]] = [[] for _ in range(nclasses)]
+        self._counts = [0] * nclasses
+        self._nonempty = 0      # bit c set when class c has a free block
+        self.free_by_start: Dict[int, int] = {}
+        self.free_by_end: Dict[int, int] = {}
+        # allocated map: base -> (requested size, reserved size)
+        self.allocated: Dict[int, Tuple[int, int]] = {}
+        self.requested = 0
+        self.reserved = 0
+        if space_size > 0:
+            self._add_free(0, space_size)
+
+    def _add_free(self, base: int, size: int) -> None:
+        c = size.bit_length() - 1
+        self.free_by_start[base] = size
+        self.free_by_end[base + size] = base
+        heap = self._heaps[c]
+        heapq.heappush(heap, base)
+        self._counts[c] += 1
+        self._nonempty |= 1 << c
+        if len(heap) > 2 * self._counts[c] + 64:
+            self._heaps[c] = sorted(b for b in heap if self._live(b, c))
+
+    def _remove_free(self, base: int) -> int:
+        size = self.free_by_start.pop(base)
+        del self.free_by_end[base + size]
+        c = size.bit_length() - 1
+        self._counts[c] -= 1
+        if not self._counts[c]:
+            self._nonempty &= ~(1 << c)
+        return size
+
+    def _live(self, base: int, c: int) -> bool:
+        size = self.free_by_start.get(base)
+        return size is not None and size.bit_length() - 1 == c
+
+    def allocate(self, size: int) -> Optional[int]:
+        c = max(self.min_order, (size - 1).bit_length())
+        mask = self._nonempty >> c
+        if not mask:
+            return None
+        j = c + (mask & -mask).bit_length() - 1
+        heap = self._heaps[j]
+        base = heapq.heappop(heap)
+        while not self._live(base, j):
+            base = heapq.heappop(heap)
+        sz = self._remove_free(base)
+        block = 1 << c
+        if sz > block:
+            self._add_free(base + block, sz - block)
+        self.allocated[base] = (size, block)
+        self.requested += size
+        self.reserved += block
+        return base
+
+    def free_block(self, base: int) -> bool:
+        entry = self.allocated.pop(base, None)
+        if entry is None:
+            return False
+        size, block = entry
+        self.requested -= size
+        self.reserved -= block
+        prev = self.free_by_end.get(base)
+        if prev is not None:
+            block += self._remove_free(prev)
+            base = prev
+        if base + block in self.free_by_start:
+            block += self._remove_free(base + block)
+        self._add_free(base, block)
+        return True
+
+    def fragmentation(self) -> Dict[str, float]:
+        free_bytes = sum(self.free_by_start.values())
+        largest = max(self.free_by_start.values(), default=0)
+        return fragmentation_report(self.requested, self.reserved, free_bytes, largest)
@@ -2,27 +2,75 @@
 DemandController ties segmentation-level requests to the PagingEngine.
 It avoids duplicate concurrent page loads by tracking pending requests.
 A small sleep simulates disk latency; default 0.02s (deterministic in tests can be set to 0).
+
+AsyncDemandController is the asyncio variant: `await request_page(...)` sleeps
+with asyncio.sleep, so faults from different tasks overlap their latency, and
+keeps one shared future per in-flight global page so concurrent requesters of
+the same page wait on a single load. replay_per_pid runs one task per pid.
+
+Both controllers take an optional prefetcher (see prefetcher.py) that is told
+about every served access and may load further pages speculatively. Each
+read-ahead batch costs one disk latency: DemandController sleeps it after the
+access that triggered it, AsyncDemandController completes the batch in the
+background, and a request for one of its pages waits until the batch is done.
+When the engine has a TLB, a TLB hit is served before any page-table lookup
+(and without a page_load_request event); misses fill the TLB.
+Hits (TLB or page table) are recorded with PagingEngine.note_access, the same
+bookkeeping as PagingEngine.translate's TLB hit, but with reference=False: the
+controllers have always served a present page without touching the replacer
+or the dirty bit (only loads do), and their replays' fault counts and events
+are kept as they were. translate() is the path where hits count as references.
 """
 
+import asyncio
 import time
-from typing import Dict, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from Module_1_Paging_Engine.paging_engine import PagingEngine
+from Module_1_Paging_Engine.tlb import TLB
 from . import events as ev
+from .prefetcher import ReadaheadPrefetcher
+
+def _tlb_hit(controller, tlb: TLB, pid: int, global_page: int) -> Optional[int]:
+    """Frame from the TLB, recorded as a served hit; None on a TLB miss."""
+    frame = tlb.lookup(pid, global_page)
+    if frame is not None:
+        controller.paging_engine.note_access(pid, global_page, frame, reference=False)
+        if controller.prefetcher is not None:
+            controller._prefetch(pid, global_page, faulted=False)
+    return frame
 
 class DemandController:
-    def __init__(self, paging_engine: PagingEngine, disk_latency_s: float = 0.02):
+    def __init__(self, paging_engine: PagingEngine, disk_latency_s: float = 0.02,
+                 prefetcher: Optional[ReadaheadPrefetcher] = None):
         self.paging_engine = paging_engine
         self.disk_latency_s = disk_latency_s
+        self.prefetcher = prefetcher
         # presence cache: (pid, global_page) -> True
         self.presence: Dict[tuple, bool] = {}
         self.pending: Set[tuple] = set()
 
+    def _prefetch(self, pid: int, global_page: int, faulted: bool) -> None:
+        """Tell the prefetcher about a served access; its read-ahead costs one disk latency."""
+        if self.prefetcher.on_access(pid, global_page, faulted=faulted) and self.disk_latency_s > 0:
+            time.sleep(self.disk_latency_s)
+
     def request_page(self, pid: int, global_page: int, access_type: str = "R"):
         key = (pid, global_page)
+        tlb = self.paging_engine.tlb
+        if tlb is not None:
+            frame = _tlb_hit(self, tlb, pid, global_page)
+            if frame is not None:
+                return {"status": "ok", "frame": frame}
         ev.emit_page_load_request(pid, global_page, reason="demand")
         # if presence known and present, return
         if self.paging_engine.is_present(global_page):
-            return {"status": "ok", "frame": self.paging_engine.ptes[global_page].frame}
+            frame = self.paging_engine.ptes[global_page].frame
+            self.paging_engine.note_access(pid, global_page, frame, reference=False)
+            if tlb is not None:
+                tlb.insert(pid, global_page, frame)
+            if self.prefetcher is not None:
+                self._prefetch(pid, global_page, faulted=False)
+            return {"status": "ok", "frame": frame}
         # avoid duplicate loads
         if key in self.pending:
             # simple busy-wait for deterministic small number of loops (no background threads)
@@ -42,4 +90,123 @@ class DemandController:
         ev.emit_demand_page_loaded(pid, global_page, frame)
         self.presence[key] = True
         self.pending.discard(key)
+        if tlb is not None:
+            tlb.insert(pid, global_page, frame)
+        if self.prefetcher is not None:
+            self._prefetch(pid, global_page, faulted=True)
         return {"status": "loaded", "frame": frame}
+
+class AsyncDemandController:
+    def __init__(self, paging_engine: PagingEngine, disk_latency_s: float = 0.02,
+                 prefetcher: Optional[ReadaheadPrefetcher] = None):
+        self.paging_engine = paging_engine
+        self.disk_latency_s = disk_latency_s
+        self.prefetcher = prefetcher
+        # presence cache: (pid, global_page) -> True
+        self.presence: Dict[tuple, bool] = {}
+        # global_page -> future resolved with the frame once the load finishes
+        self.inflight: Dict[int, asyncio.Future] = {}
+        # global_page -> future resolved when its read-ahead batch has been read
+        self.prefetching: Dict[int, asyncio.Future] = {}
+
+    def _prefetch(self, pid: int, global_page: int, faulted: bool) -> None:
+        """Tell the prefetcher about a served access; its read-ahead completes disk_latency_s later."""
+        issued = self.prefetcher.on_access(pid, global_page, faulted=faulted)
+        if not issued or self.disk_latency_s <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        batch = loop.create_future()
+        for g in issued:
+            self.prefetching[g] = batch
+        loop.call_later(self.disk_latency_s, self._prefetched, issued, batch)
+
+    def _prefetched(self, issued: List[int], batch: asyncio.Future) -> None:
+        for g in issued:
+            if self.prefetching.get(g) is batch:
+                del self.prefetching[g]
+        batch.set_result(None)
+
+    async def request_page(self, pid: int, global_page: int, access_type: str = "R"):
+        tlb = self.paging_engine.tlb
+        if tlb is not None:
+            frame = _tlb_hit(self, tlb, pid, global_page)
+            if frame is not None:
+                return {"status": "ok", "frame": frame}
+        ev.emit_page_load_request(pid, global_page, reason="demand")
+        batch = self.prefetching.get(global_page)
+        if batch is not None:
+            # the page is being read ahead: wait for that read
+            await asyncio.shield(batch)
+        if self.paging_engine.is_present(global_page):
+            frame = self.paging_engine.ptes[global_page].frame
+            self.paging_engine.note_access(pid, global_page, frame, reference=False)
+            if tlb is not None:
+                tlb.insert(pid, global_page, frame)
+            if self.prefetcher is not None:
+                self._prefetch(pid, global_page, faulted=False)
+            return {"status": "ok", "frame": frame}
+        fut = self.inflight.get(global_page)
+        if fut is not None:
+            # someone is already loading this page: wait for that load instead of issuing another
+            frame = await asyncio.shield(fut)
+            return {"status": "ok", "frame": frame}
+        fut = asyncio.get_running_loop().create_future()
+        self.inflight[global_page] = fut
+        try:
+            if self.disk_latency_s > 0:
+                await asyncio.sleep(self.disk_latency_s)
+            result = self.paging_engine.handle_page_load_request(pid, global_page, access_type=access_type)
+        except BaseException as exc:
+            fut.set_exception(exc)
+            fut.exception()  # mark retrieved; waiters (if any) still get it raised
+            raise
+        finally:
+            del self.inflight[global_page]
+        frame = result.get("frame")
+        ev.emit_demand_page_loaded(pid, global_page, frame)
+        self.presence[(pid, global_page)] = True
+        if tlb is not None:
+            tlb.insert(pid, global_page, frame)
+        fut.set_result(frame)
+        if self.prefetcher is not None:
+            self._prefetch(pid, global_page, faulted=True)
+        return {"status": "loaded", "frame": frame}
+
+async def replay_per_pid(controller: AsyncDemandController,
+                         accesses: Iterable[Tuple[int, int, str]],
+                         queue_size: int = 256) -> Dict[str, int]:
+    """
+    Replay (pid, global_page, access_type) tuples with one worker task per pid.
+    Each pid's accesses stay in order; different pids overlap their faults, so
+    the wall time tracks the slowest pid rather than the sum over all pids.
+    Input is consumed lazily through bounded per-pid queues.
+    """
+    queues: Dict[int, asyncio.Queue] = {}
+    workers = []
+    counts = {"accesses": 0, "page_faults": 0}
+
+    async def worker(queue: asyncio.Queue) -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            pid, gpage, access_type = item
+            res = await controller.request_page(pid, gpage, access_type=access_type)
+            counts["accesses"] += 1
+            if res["status"] == "loaded":
+                counts["page_faults"] += 1
+
+    try:
+        for pid, gpage, access_type in accesses:
+            queue = queues.get(pid)
+            if queue is None:
+                queue = queues[pid] = asyncio.Queue(maxsize=queue_size)
+                workers.append(asyncio.create_task(worker(queue)))
+            await queue.put((pid, gpage, access_type))
+        for queue in queues.values():
+            await queue.put(None)
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+    return counts
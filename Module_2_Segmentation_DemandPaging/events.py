@@ -51,6 +51,11 @@ def emit_seg_fault(pid:int, segment:int, segment_offset:int):
     emit_event(ev)
     return ev
 
+def emit_seg_translate_batch(mode:str, count:int, invalid:int):
+    ev = {"type": "seg_translate_batch", "mode": mode, "count": count, "invalid": invalid}
+    emit_event(ev)
+    return ev
+
 def emit_page_load_request(pid:int, global_page:int, reason:str):
     ev = {"type": "page_load_request", "pid": pid, "global_page": global_page, "reason": reason}
     emit_event(ev)
@@ -60,3 +65,8 @@ def emit_demand_page_loaded(pid:int, global_page:int, frame:int):
     ev = {"type": "demand_page_loaded", "pid": pid, "global_page": global_page, "frame": frame}
     emit_event(ev)
     return ev
+
+def emit_prefetch_waste(pid:int, global_page:int, segment:int):
+    ev = {"type": "prefetch_waste", "pid": pid, "global_page": global_page, "segment": segment}
+    emit_event(ev)
+    return ev
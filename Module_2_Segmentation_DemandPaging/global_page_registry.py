@@ -2,22 +2,100 @@
 Global page registry maps (pid, seg_id, page_in_seg) -> unique global page id.
 
 Global page ids start at 1 and increment deterministically.
+
+Ids are handed out as contiguous extents per segment, so a segment created
+in one go is a single (first_page, base_id, count) entry and a lookup is
+base_id + page_in_seg - first_page. Reserving a whole segment and looking up
+an address are O(1) regardless of segment size; numbering is identical to
+reserving every page one by one in order.
 """
 
-from typing import Tuple, Dict
+from bisect import bisect_right
+from typing import Tuple, Dict, List, Optional
+
+# [first_page_in_seg, base_id, count]
+Extent = List[int]
 
 class GlobalPageRegistry:
     def __init__(self):
-        self.map: Dict[Tuple[int,int,int], int] = {}
+        # (pid, seg_id) -> extents sorted by first_page_in_seg
+        self.extents: Dict[Tuple[int,int], List[Extent]] = {}
+        # every extent in base_id order (ids only grow), for reverse lookups
+        self._bases: List[int] = []
+        self._owners: List[Tuple[Tuple[int,int], Extent]] = []
         self._next = 1
 
+    def _find(self, extents: List[Extent], page_in_seg: int) -> Optional[Extent]:
+        if len(extents) == 1:
+            ext = extents[0]
+        else:
+            i = bisect_right(extents, [page_in_seg, float("inf")]) - 1
+            if i < 0:
+                return None
+            ext = extents[i]
+        if ext[0] <= page_in_seg < ext[0] + ext[2]:
+            return ext
+        return None
+
+    def _append(self, key: Tuple[int,int], first_page: int, count: int) -> None:
+        extents = self.extents.setdefault(key, [])
+        i = bisect_right(extents, [first_page, float("inf")])
+        prev = extents[i-1] if i else None
+        if prev is not None and prev[0] + prev[2] == first_page and prev[1] + prev[2] == self._next:
+            # contiguous in both page and id space: just widen the extent
+            prev[2] += count
+        else:
+            ext = [first_page, self._next, count]
+            extents.insert(i, ext)
+            self._bases.append(self._next)
+            self._owners.append((key, ext))
+        self._next += count
+
     def reserve(self, pid: int, seg_id: int, page_in_seg: int) -> int:
-        key = (pid, seg_id, page_in_seg)
-        if key not in self.map:
-            self.map[key] = self._next
-            self._next += 1
-        return self.map[key]
+        found = self.lookup(pid, seg_id, page_in_seg)
+        if found is not None:
+            return found
+        self._append((pid, seg_id), page_in_seg, 1)
+        return self._next - 1
+
+    def reserve_range(self, pid: int, seg_id: int, page_count: int) -> None:
+        """Reserve pages 0..page_count-1, filling gaps in page order (same ids as calling reserve per page)."""
+        key = (pid, seg_id)
+        page = 0
+        for ext in list(self.extents.get(key, [])):
+            if page >= page_count:
+                break
+            if ext[0] > page:
+                self._append(key, page, min(ext[0], page_count) - page)
+            page = max(page, ext[0] + ext[2])
+        if page < page_count:
+            self._append(key, page, page_count - page)
 
     def lookup(self, pid: int, seg_id: int, page_in_seg: int) -> int:
-        key = (pid, seg_id, page_in_seg)
-        return self.map.get(key, None)
+        extents = self.extents.get((pid, seg_id))
+        if not extents:
+            return None
+        ext = self._find(extents, page_in_seg)
+        if ext is None:
+            return None
+        return ext[1] + page_in_seg - ext[0]
+
+    def segment_base(self, pid: int, seg_id: int) -> Optional[int]:
+        """Id of page 0 when the segment is a single extent starting at page 0, else None."""
+        extents = self.extents.get((pid, seg_id))
+        if extents and len(extents) == 1 and extents[0][0] == 0:
+            return extents[0][1]
+        return None
+
+    def resolve(self, gpage: int) -> Optional[Tuple[int, int, int]]:
+        """Reverse lookup: global page id -> (pid, seg_id, page_in_seg)."""
+        i = bisect_right(self._bases, gpage) - 1
+        if i < 0:
+            return None
+        key, ext = self._owners[i]
+        if gpage >= ext[1] + ext[2]:
+            return None
+        return key[0], key[1], ext[0] + gpage - ext[1]
+
+    def __len__(self) -> int:
+        return self._next - 1
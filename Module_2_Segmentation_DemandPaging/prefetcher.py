@@ -0,0 +1,106 @@
+"""
+ReadaheadPrefetcher: sequential/stride read-ahead stage for the DemandController.
+
+Streams are tracked per (pid, segment) on page-in-segment numbers:
+- a delta of +1 (sequential) is trusted at once; any other stride must repeat
+  once before it is followed
+- read-ahead is issued on a demand fault or on the first use of a prefetched
+  page (like Linux's PG_readahead marker), for `window` pages along the stride
+- the window doubles on each prefetch hit (up to max_window) and halves when
+  a prefetched page is evicted unused; a broken stride resets it
+
+Speculative loads go through handle_page_load_request(prefetch=True) after
+a page_load_request event with reason "prefetch", so they show up as
+prefetch_load events rather than demand page_faults. They stop at the
+segment end and are capped at frames_count - 1 (with local allocation, at
+the pid's quota - 1) so the demanded page is never pushed out. on_access
+returns the pages it loaded; the demand controllers charge the disk latency
+for them (one read per batch).
+stats counts issued, hits (prefetched page later used) and wasted
+(prefetched page evicted before any use, reported as a prefetch_waste event).
+"""
+
+from typing import Dict, List, Tuple
+from Module_1_Paging_Engine.paging_engine import PagingEngine
+from .global_page_registry import GlobalPageRegistry
+from . import events as ev
+
+class _Stream:
+    __slots__ = ("last_page", "stride", "confirmed", "window")
+
+    def __init__(self, page: int, window: int):
+        self.last_page = page
+        self.stride = 0
+        self.confirmed = False
+        self.window = window
+
+class ReadaheadPrefetcher:
+    def __init__(self, paging_engine: PagingEngine, registry: GlobalPageRegistry,
+                 min_window: int = 1, max_window: int = 8):
+        self.paging_engine = paging_engine
+        self.registry = registry
+        self.min_window = min_window
+        self.max_window = max_window
+        self.streams: Dict[Tuple[int, int], _Stream] = {}
+        # prefetched but not yet used: global_page -> (pid, seg_id)
+        self.prefetched: Dict[int, Tuple[int, int]] = {}
+        self.stats = {"issued": 0, "hits": 0, "wasted": 0}
+        paging_engine.eviction_listeners.append(self._on_evict)
+
+    def on_access(self, pid: int, global_page: int, faulted: bool) -> List[int]:
+        """Observe a served access; returns the global pages prefetched because of it."""
+        loc = self.registry.resolve(global_page)
+        if loc is None:
+            return []
+        _, seg_id, page = loc
+        key = (pid, seg_id)
+        hit = self.prefetched.pop(global_page, None) is not None
+        stream = self.streams.get(key)
+        if stream is None:
+            self.streams[key] = _Stream(page, self.min_window)
+            return []
+        if hit:
+            self.stats["hits"] += 1
+            stream.window = min(self.max_window, stream.window * 2)
+        delta = page - stream.last_page
+        if delta == 0:
+            return []
+        stream.last_page = page
+        if delta == stream.stride:
+            stream.confirmed = True
+        else:
+            stream.stride = delta
+            stream.confirmed = delta == 1
+            stream.window = self.min_window
+        if not stream.confirmed or not (faulted or hit):
+            return []
+        return self._read_ahead(pid, seg_id, page, stream)
+
+    def _read_ahead(self, pid: int, seg_id: int, page: int, stream: _Stream) -> List[int]:
+        issued = []
+        engine = self.paging_engine
+        frames = engine.physical.quota_of(pid) if engine.local else engine.frames_count
+        budget = min(stream.window, frames - 1)
+        for k in range(1, budget + 1):
+            target = page + k * stream.stride
+            gpage = self.registry.lookup(pid, seg_id, target) if target >= 0 else None
+            if gpage is None:
+                break
+            if engine.is_present(gpage):
+                continue
+            ev.emit_page_load_request(pid, gpage, reason="prefetch")
+            engine.handle_page_load_request(pid, gpage, access_type="R", prefetch=True)
+            self.prefetched[gpage] = (pid, seg_id)
+            self.stats["issued"] += 1
+            issued.append(gpage)
+        return issued
+
+    def _on_evict(self, _pid: int, gpage: int, _frame: int) -> None:
+        owner = self.prefetched.pop(gpage, None)
+        if owner is None:
+            return
+        self.stats["wasted"] += 1
+        stream = self.streams.get(owner)
+        if stream is not None:
+            stream.window = max(self.min_window, stream.window // 2)
+        ev.emit_prefetch_waste(owner[0], gpage, owner[1])
@@ -1,21 +1,40 @@
 """
-SegmentationEngine supports create_segment and seg_translate.
+SegmentationEngine supports create_segment, seg_translate and the vectorized
+seg_translate_batch.
 
 Modes:
 - 'pure-seg': returns physical address (base + offset) for simplicity
 - 'segmented-paging': returns virtual_page and page_offset and uses global page registry
 """
 
-from typing import Tuple
-from .allocator import SimpleAllocator
+from typing import Dict, Tuple
+import numpy as np
+from .allocator import SimpleAllocator, BuddyAllocator, SegregatedFitAllocator
 from .global_page_registry import GlobalPageRegistry
 from . import events as ev
 
 PAGE_SIZE = 4096
 
+def _unique_pairs(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """np.unique over (a, b) pairs; packs them into one int64 key when the ranges allow."""
+    if len(a) == 0:
+        return np.zeros((0, 2), dtype=np.int64), np.zeros(0, dtype=np.int64)
+    a_min, b_min = int(a.min()), int(b.min())
+    a_span, b_span = int(a.max()) - a_min + 1, int(b.max()) - b_min + 1
+    if a_span * b_span >= 1 << 62:
+        pairs, inv = np.unique(np.stack([a, b], axis=1), axis=0, return_inverse=True)
+        return pairs, inv.reshape(-1)
+    keys, inv = np.unique((a - a_min) * b_span + (b - b_min), return_inverse=True)
+    return np.stack([keys // b_span + a_min, keys % b_span + b_min], axis=1), inv.reshape(-1)
+
 class SegmentationEngine:
     def __init__(self, address_space_size=1<<20, allocator_algo="first_fit"):
-        self.allocator = SimpleAllocator(address_space_size)
+        if allocator_algo == "buddy":
+            self.allocator = BuddyAllocator(address_space_size, min_block=PAGE_SIZE)
+        elif allocator_algo == "segregated_fit":
+            self.allocator = SegregatedFitAllocator(address_space_size, min_block=PAGE_SIZE)
+        else:
+            self.allocator = SimpleAllocator(address_space_size)
         self.registry = GlobalPageRegistry()
         # segments: (pid, seg_id) -> (base, size_bytes)
         self.segments = {}
@@ -28,6 +47,10 @@ class SegmentationEngine:
             base = self.allocator.first_fit(size)
         elif self.allocator_algo == "best_fit":
             base = self.allocator.best_fit(size)
+        elif self.allocator_algo == "next_fit":
+            base = self.allocator.next_fit(size)
+        elif self.allocator_algo in ("buddy", "segregated_fit"):
+            base = self.allocator.allocate(size)
         else:
             base = self.allocator.worst_fit(size)
         if base is None:
@@ -35,10 +58,8 @@ class SegmentationEngine:
         limit = size
         self.segments[(pid, seg_id)] = (base, limit)
         ev.emit_segment_alloc(pid, seg_id, base, limit, self.allocator_algo)
-        # register pages in this segment deterministically
-        page_count = limit // PAGE_SIZE
-        for page_in_seg in range(page_count):
-            self.registry.reserve(pid, seg_id, page_in_seg)
+        # register pages in this segment deterministically (one contiguous id range)
+        self.registry.reserve_range(pid, seg_id, limit // PAGE_SIZE)
         return {"base": base, "limit": limit}
 
     def seg_translate(self, pid: int, seg_id: int, offset: int, mode="segmented-paging"):
@@ -63,3 +84,48 @@ class SegmentationEngine:
         else:
             ev.emit_seg_fault(pid, seg_id, offset)
             raise Exception("Unknown translation mode")
+
+    def seg_translate_batch(self, pids, seg_ids, offsets, mode="segmented-paging") -> Dict[str, np.ndarray]:
+        """
+        Vectorized seg_translate over NumPy arrays (or sequences) of equal length.
+        Out-of-range accesses and unknown segments are reported in the boolean
+        "valid" mask instead of raising; their outputs are -1.
+        Returns {"valid", "virtual_page", "page_offset"} for 'segmented-paging'
+        and {"valid", "phys_addr"} for 'pure-seg'. Emits one seg_translate_batch event.
+        """
+        if mode not in ("pure-seg", "segmented-paging"):
+            raise Exception("Unknown translation mode")
+        pids = np.asarray(pids, dtype=np.int64)
+        seg_ids = np.asarray(seg_ids, dtype=np.int64)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        n = len(offsets)
+        # resolve each distinct (pid, seg_id) once
+        pairs, inv = _unique_pairs(pids, seg_ids)
+        seg_base = np.zeros(len(pairs), dtype=np.int64)
+        seg_limit = np.zeros(len(pairs), dtype=np.int64)
+        # global page of page 0 per segment; -1 when ids are split over several extents
+        id_base = np.full(len(pairs), -1, dtype=np.int64)
+        for i, (pid, seg_id) in enumerate(pairs.tolist()):
+            entry = self.segments.get((pid, seg_id))
+            if entry is None:
+                continue  # limit 0 -> every offset is invalid
+            seg_base[i], seg_limit[i] = entry
+            base_id = self.registry.segment_base(pid, seg_id)
+            if base_id is not None:
+                id_base[i] = base_id
+        valid = (offsets >= 0) & (offsets < seg_limit[inv])
+        invalid = int(n - np.count_nonzero(valid))
+        out: Dict[str, np.ndarray] = {"valid": valid}
+        if mode == "pure-seg":
+            out["phys_addr"] = np.where(valid, seg_base[inv] + offsets, -1)
+        else:
+            page_in_seg = offsets // PAGE_SIZE
+            vpages = np.where(valid, id_base[inv] + page_in_seg, -1)
+            # rare: segments re-created larger than first reserved, resolve row by row
+            split = valid & (id_base[inv] < 0)
+            for j in np.flatnonzero(split).tolist():
+                vpages[j] = self.registry.lookup(int(pids[j]), int(seg_ids[j]), int(page_in_seg[j]))
+            out["virtual_page"] = vpages
+            out["page_offset"] = np.where(valid, offsets % PAGE_SIZE, -1)
+        ev.emit_seg_translate_batch(mode, n, invalid)
+        return out
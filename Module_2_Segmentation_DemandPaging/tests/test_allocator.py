@@ -1,4 +1,4 @@
-from Module_2_Segmentation_DemandPaging.allocator import SimpleAllocator
+from Module_2_Segmentation_DemandPaging.allocator import SimpleAllocator, BuddyAllocator, SegregatedFitAllocator
 
 def test_simple_alloc_free():
     a = SimpleAllocator(1024)
@@ -19,3 +19,134 @@ def test_best_worst_fit():
     a.free_block(0)
     b = a.best_fit(50)
     assert b is not None
+
+class _ListAllocator:
+    """Reference: the original linear-scan free list."""
+    def __init__(self, space_size):
+        self.free = [(0, space_size)]
+        self.allocated = {}
+
+    def _place(self, i, size):
+        base, sz = self.free[i]
+        if sz == size:
+            self.free.pop(i)
+        else:
+            self.free[i] = (base + size, sz - size)
+        self.allocated[base] = size
+        return base
+
+    def first_fit(self, size):
+        for i, (_, sz) in enumerate(self.free):
+            if sz >= size:
+                return self._place(i, size)
+        return None
+
+    def best_fit(self, size):
+        fits = [(sz, i) for i, (_, sz) in enumerate(self.free) if sz >= size]
+        return self._place(min(fits)[1], size) if fits else None
+
+    def worst_fit(self, size):
+        fits = [(-sz, i) for i, (_, sz) in enumerate(self.free) if sz >= size]
+        return self._place(min(fits)[1], size) if fits else None
+
+    def free_block(self, base):
+        size = self.allocated.pop(base, None)
+        if size is None:
+            return False
+        self.free = sorted(self.free + [(base, size)])
+        merged = []
+        for b, s in self.free:
+            if merged and merged[-1][0] + merged[-1][1] == b:
+                merged[-1] = (merged[-1][0], merged[-1][1] + s)
+            else:
+                merged.append((b, s))
+        self.free = merged
+        return True
+
+def test_indexed_matches_linear_scan():
+    import random
+    for algo in ("first_fit", "best_fit", "worst_fit"):
+        rng = random.Random(7)
+        a, ref = SimpleAllocator(1 << 16), _ListAllocator(1 << 16)
+        live = []
+        for _ in range(3000):
+            if live and rng.random() < 0.45:
+                base = live.pop(rng.randrange(len(live)))
+                assert a.free_block(base) == ref.free_block(base)
+            else:
+                size = rng.randint(1, 2048)
+                got = getattr(a, algo)(size)
+                assert got == getattr(ref, algo)(size)
+                if got is not None:
+                    live.append(got)
+            assert a.free == ref.free
+        assert not a.free_block(-5)
+
+def test_next_fit_roves_and_wraps():
+    a = SimpleAllocator(400)
+    assert [a.next_fit(100) for _ in range(3)] == [0, 100, 200]
+    a.free_block(0)
+    # continues after the last placement before wrapping to the hole at 0
+    assert a.next_fit(50) == 300
+    assert a.next_fit(50) == 350
+    assert a.next_fit(100) == 0
+    assert a.next_fit(10) is None
+
+def test_buddy_split_and_coalesce():
+    a = BuddyAllocator(1024, min_block=64)
+    assert a.allocate(100) == 0      # rounded to 128
+    assert a.allocate(64) == 128
+    assert a.allocate(200) == 256    # 256-byte block
+    frag = a.fragmentation()
+    assert frag["reserved_bytes"] == 128 + 64 + 256
+    assert frag["internal"] == (448 - 364) / 448
+    for base in (128, 0, 256):
+        assert a.free_block(base)
+    assert a.free_sets[10] == {0}
+    assert a.fragmentation()["external"] == 0.0
+    assert not a.free_block(0)
+
+def test_buddy_non_power_of_two_space():
+    a = BuddyAllocator(3 * 4096, min_block=4096)
+    assert a.allocate(8192) == 0
+    assert a.allocate(4096) == 8192
+    assert a.allocate(1) is None
+
+def _churn_invariants(alloc, space):
+    import random
+    rng = random.Random(3)
+    live = {}
+    for _ in range(2000):
+        if live and rng.random() < 0.5:
+            base = rng.choice(sorted(live))
+            del live[base]
+            assert alloc.free_block(base)
+        else:
+            size = rng.randint(1, 3000)
+            base = alloc.allocate(size)
+            if base is not None:
+                live[base] = size
+        spans = sorted((b, b + s) for b, s in live.items())
+        assert all(e <= b2 for (_, e), (b2, _) in zip(spans, spans[1:]))
+        assert spans == [] or spans[-1][1] <= space
+    for base in list(live):
+        alloc.free_block(base)
+    frag = alloc.fragmentation()
+    assert frag["free_bytes"] == frag["largest_free"]
+    assert frag["reserved_bytes"] == 0
+
+def test_buddy_and_segregated_churn():
+    _churn_invariants(BuddyAllocator(1 << 16, min_block=64), 1 << 16)
+    _churn_invariants(SegregatedFitAllocator(1 << 16, min_block=64), 1 << 16)
+
+def test_segregated_fit_classes():
+    a = SegregatedFitAllocator(1000)
+    assert a.allocate(100) == 0      # 128-byte block, remainder 872 in class 9
+    assert a.allocate(300) == 128    # 512-byte block
+    assert a.free_by_start == {640: 360}
+    assert a.allocate(400) is None   # needs a 512 block
+    a.free_block(0)
+    assert a.allocate(64) == 0       # lowest address in the smallest fitting class
+    a.free_block(0)
+    a.free_block(128)
+    assert a.free_by_start == {0: 1000}
@@ -1,5 +1,6 @@
 from Module_1_Paging_Engine.paging_engine import PagingEngine
-from Module_2_Segmentation_DemandPaging.demand_controller import DemandController
+from Module_2_Segmentation_DemandPaging.demand_controller import DemandController, AsyncDemandController, replay_per_pid
+import asyncio
 import pytest
 import time
 
@@ -12,3 +13,45 @@ def test_request_page(tmp_path, monkeypatch):
     # requesting same page should return ok and not raise
     res2 = dc.request_page(pid=1, global_page=1, access_type="R")
     assert res2["status"] in ("loaded", "ok")
+
+def test_async_request_page_coalesces_inflight_loads(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pe = PagingEngine(frames_count=2, page_size=4096, policy="LRU")
+    dc = AsyncDemandController(pe, disk_latency_s=0.01)
+    loads = []
+    real = pe.handle_page_load_request
+    monkeypatch.setattr(pe, "handle_page_load_request", lambda *a, **k: loads.append(a) or real(*a, **k))
+
+    async def go():
+        return await asyncio.gather(*(dc.request_page(pid, 7) for pid in (1, 2, 3)))
+    results = asyncio.run(go())
+    assert [r["status"] for r in results] == ["loaded", "ok", "ok"]
+    assert len({r["frame"] for r in results}) == 1
+    assert len(loads) == 1
+    assert dc.inflight == {}
+
+def test_replay_per_pid_overlaps_latency(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pe = PagingEngine(frames_count=16, page_size=4096, policy="LRU")
+    dc = AsyncDemandController(pe, disk_latency_s=0.05)
+    # 4 pids x 2 distinct pages, interleaved: sequential replay would take 8 * 0.05s
+    accesses = [(pid, pid * 10 + i, "R") for i in range(2) for pid in range(1, 5)]
+    start = time.perf_counter()
+    counts = asyncio.run(replay_per_pid(dc, accesses))
+    assert counts == {"accesses": 8, "page_faults": 8}
+    assert time.perf_counter() - start < 0.25
+
+def test_tlb_hits_and_page_table_hits_are_bookkept_alike(tmp_path, monkeypatch):
+    from Module_1_Paging_Engine.tlb import TLB
+    import random
+    monkeypatch.chdir(tmp_path)
+    rng = random.Random(3)
+    trace = [(rng.randrange(6), "W" if rng.random() < 0.3 else "R") for _ in range(400)]
+    outcomes = []
+    for tlb in (None, TLB(size=8, associativity=2)):
+        pe = PagingEngine(frames_count=4, page_size=4096, policy="LRU", tlb=tlb)
+        dc = DemandController(pe, disk_latency_s=0)
+        statuses = [dc.request_page(1, g, access_type=a)["status"] for g, a in trace]
+        outcomes.append((statuses, [pe.ptes[g].dirty for g in range(6)]))
+    # serving a hit from the TLB changes neither the replacement order nor the dirty bits
+    assert outcomes[0] == outcomes[1]
@@ -0,0 +1,101 @@
+import asyncio
+from Module_1_Paging_Engine.event_bus import BUS, RingBufferSink
+from Module_1_Paging_Engine.paging_engine import PagingEngine
+from Module_2_Segmentation_DemandPaging.segmentation_engine import SegmentationEngine, PAGE_SIZE
+from Module_2_Segmentation_DemandPaging import demand_controller
+from Module_2_Segmentation_DemandPaging.demand_controller import DemandController, AsyncDemandController
+from Module_2_Segmentation_DemandPaging.prefetcher import ReadaheadPrefetcher
+
+def _setup(frames, pages=64):
+    se = SegmentationEngine(address_space_size=PAGE_SIZE*pages*2)
+    se.create_segment(pid=1, seg_id=0, size_bytes=PAGE_SIZE*pages)
+    pe = PagingEngine(frames_count=frames, page_size=PAGE_SIZE, policy="LRU")
+    pf = ReadaheadPrefetcher(pe, se.registry, max_window=8)
+    return se, pe, pf, DemandController(pe, disk_latency_s=0, prefetcher=pf)
+
+def _scan(se, dc, pages):
+    faults = 0
+    for page in pages:
+        g = se.seg_translate(1, 0, page * PAGE_SIZE, mode="segmented-paging")["virtual_page"]
+        faults += dc.request_page(1, g)["status"] == "loaded"
+    return faults
+
+def test_sequential_and_strided_readahead(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    se, pe, pf, dc = _setup(frames=16)
+    # the first two pages fault before the stream is detected
+    assert _scan(se, dc, range(64)) == 2
+    assert pf.stats == {"issued": 62, "hits": 62, "wasted": 0}
+    assert pf.streams[(1, 0)].window == 8
+    se, pe, pf, dc = _setup(frames=16)
+    # stride 3 has to repeat once before it is followed
+    assert _scan(se, dc, range(0, 64, 3)) == 3
+    assert pf.stats["hits"] == pf.stats["issued"] == 19
+
+def test_unused_prefetch_eviction_counts_as_waste(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    se, pe, pf, dc = _setup(frames=4)
+    _scan(se, dc, [0, 1])             # sequential: page 2 prefetched
+    assert pf.stats["issued"] == 1
+    _scan(se, dc, [40, 50, 60, 30])   # random jumps push page 2 out unused
+    assert pf.stats["wasted"] == 1
+    assert pf.prefetched == {}
+    assert pf.streams[(1, 0)].window == 1
+
+def test_prefetch_loads_are_not_demand_faults(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    se, pe, pf, dc = _setup(frames=16)
+    sink = RingBufferSink()
+    monkeypatch.setattr(BUS, "sinks", [sink])
+    _scan(se, dc, range(16))
+    types = [e["type"] for e in sink.events]
+    assert types.count("page_fault") == 2
+    assert types.count("prefetch_load") == pf.stats["issued"] > 0
+
+def test_readahead_is_charged_disk_latency(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    se, pe, pf, dc = _setup(frames=16)
+    dc.disk_latency_s = 0.01
+    sleeps = []
+    monkeypatch.setattr(demand_controller.time, "sleep", sleeps.append)
+    batches = []
+    on_access = pf.on_access
+    monkeypatch.setattr(pf, "on_access", lambda *a, **k: batches.append(on_access(*a, **k)) or batches[-1])
+    faults = _scan(se, dc, range(16))
+    # one sleep per demand fault and one per non-empty read-ahead batch
+    assert len(sleeps) == faults + sum(1 for b in batches if b) > faults
+
+def test_async_request_waits_for_the_readahead_in_flight(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    se, pe, pf, _ = _setup(frames=16)
+    adc = AsyncDemandController(pe, disk_latency_s=0.05, prefetcher=pf)
+    g = [se.seg_translate(1, 0, page * PAGE_SIZE, mode="segmented-paging")["virtual_page"] for page in range(3)]
+
+    async def go():
+        loop = asyncio.get_running_loop()
+        await adc.request_page(1, g[0])
+        await adc.request_page(1, g[1])   # detects the stream, reads page 2 ahead
+        assert pe.is_present(g[2]) and g[2] in adc.prefetching
+        start = loop.time()
+        res = await adc.request_page(1, g[2])
+        return res, loop.time() - start
+    res, waited = asyncio.run(go())
+    assert res["status"] == "ok" and waited >= 0.04
+    # the hit read further ahead (window 2)
+    assert g[2] not in adc.prefetching and len(adc.prefetching) == 2 and pf.stats["hits"] == 1
+
+def test_local_readahead_stays_within_the_quota(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    se = SegmentationEngine(address_space_size=PAGE_SIZE*128)
+    se.create_segment(pid=1, seg_id=0, size_bytes=PAGE_SIZE*64)
+    # 16 frames but a fixed quota of 2 (the window never closes, so PFF cannot grow it)
+    pe = PagingEngine(frames_count=16, page_size=PAGE_SIZE, policy="LRU", allocation="local",
+                      initial_quota=2, window=10**6)
+    pf = ReadaheadPrefetcher(pe, se.registry, max_window=8)
+    dc = DemandController(pe, disk_latency_s=0, prefetcher=pf)
+    for page in range(32):
+        g = se.seg_translate(1, 0, page * PAGE_SIZE, mode="segmented-paging")["virtual_page"]
+        dc.request_page(1, g)
+        assert pe.is_present(g)
+    assert pe.physical.quota_of(1) == 2
+    assert pf.stats["issued"] == pf.stats["hits"] + 1 and pf.stats["wasted"] == 0
@@ -1,4 +1,7 @@
+import random
+import pytest
 from Module_2_Segmentation_DemandPaging.segmentation_engine import SegmentationEngine, PAGE_SIZE
+from Module_2_Segmentation_DemandPaging.global_page_registry import GlobalPageRegistry
 
 def test_create_and_translate(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
@@ -13,3 +16,78 @@ def test_create_and_translate(tmp_path, monkeypatch):
         assert False
     except Exception:
         assert True
+
+def test_translate_batch_matches_scalar(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    se = SegmentationEngine(address_space_size=PAGE_SIZE*16, allocator_algo="first_fit")
+    se.create_segment(pid=1, seg_id=0, size_bytes=PAGE_SIZE*2)
+    se.create_segment(pid=2, seg_id=0, size_bytes=PAGE_SIZE*3)
+    pids, segs, offs = [1, 2, 2, 1, 3, 1], [0, 0, 0, 0, 0, 0], [10, PAGE_SIZE*2 + 5, PAGE_SIZE*3, PAGE_SIZE, 0, -1]
+    r = se.seg_translate_batch(pids, segs, offs)
+    assert r["valid"].tolist() == [True, True, False, True, False, False]
+    for i in (0, 1, 3):
+        s = se.seg_translate(pids[i], segs[i], offs[i])
+        assert r["virtual_page"][i] == s["virtual_page"] and r["page_offset"][i] == s["page_offset"]
+    assert r["virtual_page"][2] == -1
+    p = se.seg_translate_batch(pids, segs, offs, mode="pure-seg")
+    assert p["phys_addr"][1] == se.seg_translate(2, 0, PAGE_SIZE*2 + 5, mode="pure-seg")["phys_addr"]
+
+def test_registry_ranges_are_lazy_and_deterministic(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    se = SegmentationEngine(address_space_size=1<<32, allocator_algo="first_fit")
+    se.create_segment(pid=1, seg_id=0, size_bytes=PAGE_SIZE*2)
+    se.create_segment(pid=2, seg_id=0, size_bytes=1<<30)  # 262144 pages, one extent
+    reg = se.registry
+    assert [reg.lookup(1, 0, k) for k in range(2)] == [1, 2]
+    assert reg.lookup(2, 0, 0) == 3 and reg.lookup(2, 0, 262143) == 262146
+    assert reg.resolve(262146) == (2, 0, 262143)
+    assert se.seg_translate(2, 0, (1<<30) - 1)["virtual_page"] == 262146
+    # pages beyond the first reservation get fresh ids, as per-page reserve did
+    assert reg.reserve(1, 0, 2) == 262147
+    assert reg.resolve(262147) == (1, 0, 2)
+
+class _DictRegistry:
+    """The per-page dict registry the extent-based one replaced, as a reference."""
+    def __init__(self):
+        self.map = {}
+        self._next = 1
+
+    def reserve(self, pid, seg_id, page_in_seg):
+        key = (pid, seg_id, page_in_seg)
+        if key not in self.map:
+            self.map[key] = self._next
+            self._next += 1
+        return self.map[key]
+
+@pytest.mark.parametrize("seed", range(5))
+def test_registry_matches_per_page_dict(seed):
+    rng = random.Random(seed)
+    reg, ref = GlobalPageRegistry(), _DictRegistry()
+    for _ in range(300):
+        pid, seg_id = rng.randrange(3), rng.randrange(2)
+        if rng.random() < 0.2:
+            count = rng.randrange(1, 40)
+            reg.reserve_range(pid, seg_id, count)
+            for page in range(count):
+                ref.reserve(pid, seg_id, page)
+        else:
+            page = rng.randrange(60)
+            assert reg.reserve(pid, seg_id, page) == ref.reserve(pid, seg_id, page)
+    assert len(reg) == len(ref.map)
+    for (pid, seg_id, page), gpage in ref.map.items():
+        assert reg.lookup(pid, seg_id, page) == gpage
+        assert reg.resolve(gpage) == (pid, seg_id, page)
+    for pid in range(4):
+        for seg_id in range(3):
+            for page in range(70):
+                if (pid, seg_id, page) not in ref.map:
+                    assert reg.lookup(pid, seg_id, page) is None
+    assert reg.resolve(0) is None and reg.resolve(len(ref.map) + 1) is None
+
+def test_power_of_two_allocator_modes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for algo in ("buddy", "segregated_fit"):
+        se = SegmentationEngine(address_space_size=PAGE_SIZE*16, allocator_algo=algo)
+        assert se.create_segment(pid=1, seg_id=0, size_bytes=PAGE_SIZE*3) == {"base": 0, "limit": PAGE_SIZE*3}
+        assert se.create_segment(pid=2, seg_id=0, size_bytes=PAGE_SIZE)["base"] == PAGE_SIZE*4
+        assert se.allocator.fragmentation()["internal"] == 0.2
@@ -0,0 +1,66 @@
+"""
+Microbenchmark: allocator alloc/free churn for each placement policy.
+
+Keeps a pool of live blocks and runs a random mix of allocations and frees
+(100k operations by default) so the free list fragments into many holes.
+Reports mean ns/op and the internal/external fragmentation at the end.
+
+Run from the repository root:
+python -m benchmarks.bench_allocator [--ops 100000] [--live 2000] [--space-bits 30]
+"""
+
+import argparse
+import random
+import time
+from Module_2_Segmentation_DemandPaging.allocator import SimpleAllocator, BuddyAllocator, SegregatedFitAllocator
+
+# policy -> (allocator class, allocation method)
+POLICIES = {
+    "first_fit": (SimpleAllocator, "first_fit"),
+    "next_fit": (SimpleAllocator, "next_fit"),
+    "best_fit": (SimpleAllocator, "best_fit"),
+    "worst_fit": (SimpleAllocator, "worst_fit"),
+    "buddy": (BuddyAllocator, "allocate"),
+    "segregated_fit": (SegregatedFitAllocator, "allocate"),
+}
+
+def bench_allocator(policy: str, ops: int, live_target: int, space_size: int, seed: int = 0):
+    """Return (mean ns per operation, fragmentation report, failed allocations)."""
+    rng = random.Random(seed)
+    cls, method = POLICIES[policy]
+    a = cls(space_size)
+    alloc = getattr(a, method)
+    # pre-draw sizes and victim picks so the timed loop only measures the allocator
+    sizes = [rng.randint(1, 64) * 64 for _ in range(ops)]
+    picks = [rng.random() for _ in range(ops)]
+    live = []
+    failed = 0
+    start = time.perf_counter_ns()
+    for size, pick in zip(sizes, picks):
+        # free more often once the pool is above its target size
+        if live and pick < len(live) / (2 * live_target):
+            i = int(pick * len(live)) % len(live)
+            live[i], live[-1] = live[-1], live[i]
+            a.free_block(live.pop())
+        else:
+            base = alloc(size)
+            if base is None:
+                failed += 1
+            else:
+                live.append(base)
+    elapsed = time.perf_counter_ns() - start
+    return elapsed / ops, a.fragmentation(), failed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ops", type=int, default=100_000)
+    parser.add_argument("--live", type=int, default=2_000, help="target number of live blocks")
+    parser.add_argument("--space-bits", type=int, default=30)
+    args = parser.parse_args(argv)
+    print(f"{'policy':<16}{'ns/op':>10}{'internal':>10}{'external':>10}{'failed':>8}")
+    for policy in POLICIES:
+        ns, frag, failed = bench_allocator(policy, args.ops, args.live, 1 << args.space_bits)
+        print(f"{policy:<16}{ns:>10.0f}{frag['internal']:>10.3f}{frag['external']:>10.3f}{failed:>8}")
+
+if __name__ == "__main__":
+    main()
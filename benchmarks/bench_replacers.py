@@ -0,0 +1,51 @@
+"""
+Microbenchmark: per-operation cost of each replacer as frames_count grows.
+
+Fills every frame, then runs a fixed mix of touch (hit) and
+pick_victim + replace (fault) operations against random frames.
+The ns/op column should stay roughly flat across frame counts.
+
+Run from the repository root:
+python -m benchmarks.bench_replacers [--ops 200000] [--frames 1024 4096 ...]
+"""
+
+import argparse
+import random
+import time
+from Module_1_Paging_Engine.replacement_algorithms import REPLACERS
+DEFAULT_FRAMES = [1 << 10, 1 << 12, 1 << 14, 1 << 16, 1 << 18]
+
+def bench_replacer(cls, frames_count: int, ops: int, hit_ratio: float = 0.8, seed: int = 0) -> float:
+    """Return mean nanoseconds per operation."""
+    rng = random.Random(seed)
+    r = cls(frames_count)
+    # frame -> page it holds (ARC and CLOCK-Pro key their state by page)
+    pages = list(range(frames_count))
+    for f in range(frames_count):
+        r.add(f, f)
+    # pre-draw the workload so the timed loop only measures the replacer
+    plan = [rng.randrange(frames_count) if rng.random() < hit_ratio else -1 for _ in range(ops)]
+    next_page = frames_count
+    start = time.perf_counter_ns()
+    for frame in plan:
+        if frame >= 0:
+            r.touch(frame, pages[frame])
+        else:
+            victim, _ = r.pick_victim(next_page)
+            r.replace(victim, next_page)
+            pages[victim] = next_page
+            next_page += 1
+    return (time.perf_counter_ns() - start) / ops
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ops", type=int, default=200_000)
+    parser.add_argument("--frames", type=int, nargs="+", default=DEFAULT_FRAMES)
+    args = parser.parse_args(argv)
+    print(f"{'policy':<8}" + "".join(f"{f:>12}" for f in args.frames) + "   (ns/op)")
+    for name, cls in REPLACERS.items():
+        cells = [bench_replacer(cls, f, args.ops) for f in args.frames]
+        print(f"{name:<8}" + "".join(f"{c:>12.0f}" for c in cells))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""
+Benchmark suite: throughput and peak allocation of the simulator's hot paths, as JSON.
+
+Cases (each over a Zipf trace from Combined_Demo_Tool.trace_gen of --sizes accesses,
+4 pids whose segments hold 4x --frames pages):
+  segmentation        SegmentationEngine.seg_translate per access
+  segmentation_batch  SegmentationEngine.seg_translate_batch over the whole trace
+  paging              PagingEngine.handle_page_load_request (LRU)
+  replacer:<POLICY>   PhysicalMemory + replacer replay (miss_ratio.count_faults)
+  allocator           SimpleAllocator first_fit/free_block churn
+  tlb                 TLB lookup, insert on miss (--frames entries, 4-way)
+  sweep               analytics.sweep at a single frame count (its default 32 KB
+                      segments in a 1 MB space cap the trace at 32 pids x 8 pages)
+Every case runs in its own interpreter; events go to a NullSink. Cases that
+ignore the frame count run once per size. A case is set up afresh (untimed)
+for each run: one warm-up run under tracemalloc gives peak_alloc_kb, the
+memory the timed call itself allocates (fixtures excluded), then at least
+--repeats runs are timed with perf_counter, more (up to MAX_REPEATS) until
+MIN_SECONDS of timed work, so millisecond cases are not one noisy sample.
+accesses_per_sec uses the best run; seconds_median is reported alongside.
+
+With --baseline, results are compared against a stored report and the run
+exits 1 when accesses/sec drops, or peak_alloc_kb grows, by more than
+--threshold percent for any case present in both.
+
+Run from the repository root:
+python -m benchmarks.run_benchmarks [--sizes 1000 100000] [--frames 4 4096] [--cases paging tlb]
+    [--repeats 5] [--output bench.json] [--baseline bench.json] [--threshold 10]
+"""
+
+import argparse
+import functools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+import numpy as np
+from Module_1_Paging_Engine import event_bus
+from Module_1_Paging_Engine.replacement_algorithms import REPLACERS
+from Combined_Demo_Tool.trace_columnar import COLUMNS
+from Combined_Demo_Tool.trace_gen import generate_chunks, global_pages, write_csv
+
+DEFAULT_SIZES = [10 ** 3, 10 ** 4, 10 ** 5]
+DEFAULT_FRAMES = [4, 64, 4096]
+FULL_SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+FULL_FRAMES = [4, 64, 1024, 65536]
+PIDS = 4
+PAGE = 4096
+MIN_SECONDS = 0.5
+MAX_REPEATS = 200
+
+@functools.lru_cache(maxsize=1)
+def _trace(n: int, frames: int, seed: int) -> Dict[str, np.ndarray]:
+    """Zipf trace (trace_gen) whose pids' segments together hold 4x frames pages; shared, do not modify."""
+    chunks = list(generate_chunks(n, "zipf", pids=PIDS, segment_pages=_segment_pages(frames), seed=seed))
+    return {name: np.concatenate([c[name] for c in chunks]) for name, _ in COLUMNS}
+
+def _segment_pages(frames: int) -> int:
+    return max(1, 4 * frames // PIDS)
+
+def synthetic_pages(n: int, frames: int, seed: int = 0) -> np.ndarray:
+    return global_pages(_trace(n, frames, seed), _segment_pages(frames))
+
+def _segmented(n: int, frames: int, seed: int):
+    """Engine with every pid's segment 0 created, plus the trace's (pids, offsets) arrays."""
+    from Module_2_Segmentation_DemandPaging.segmentation_engine import SegmentationEngine
+    cols = _trace(n, frames, seed)
+    seg_bytes = _segment_pages(frames) * PAGE
+    se = SegmentationEngine(address_space_size=PIDS * seg_bytes)
+    for pid in range(1, PIDS + 1):
+        se.create_segment(pid, 0, seg_bytes)
+    return se, cols["pid"].astype(np.int64), cols["segment_offset"]
+
+def _setup_segmentation(n, frames, seed, tmp_dir):
+    se, pids, offsets = _segmented(n, frames, seed)
+    pids, offsets = pids.tolist(), offsets.tolist()
+    def run():
+        translate = se.seg_translate
+        for pid, off in zip(pids, offsets):
+            translate(pid, 0, off)
+    return run
+
+def _setup_segmentation_batch(n, frames, seed, tmp_dir):
+    se, pids, offsets = _segmented(n, frames, seed)
+    segs = np.zeros(n, dtype=np.int64)
+    return lambda: se.seg_translate_batch(pids, segs, offsets)
+
+def _setup_paging(n, frames, seed, tmp_dir):
+    from Module_1_Paging_Engine.paging_engine import PagingEngine
+    pages = synthetic_pages(n, frames, seed).tolist()
+    pe = PagingEngine(frames_count=frames, policy="LRU")
+    def run():
+        handle = pe.handle_page_load_request
+        for g in pages:
+            handle(0, g)
+    return run
+
+def _replacer_setup(policy: str):
+    def setup(n, frames, seed, tmp_dir):
+        from Module_1_Paging_Engine.miss_ratio import count_faults
+        pages = synthetic_pages(n, frames, seed).tolist()
+        return lambda: count_faults(pages, frames, policy)
+    return setup
+
+def _setup_allocator(n, frames, seed, tmp_dir):
+    from Module_2_Segmentation_DemandPaging.allocator import SimpleAllocator
+    rng = np.random.default_rng(seed)
+    sizes = (rng.integers(1, 65, n) * 64).tolist()
+    frees = (rng.random(n) < 0.5).tolist()
+    picks = rng.random(n).tolist()
+    def run():
+        a = SimpleAllocator(1 << 40)
+        live: List[int] = []
+        for size, free, pick in zip(sizes, frees, picks):
+            if free and live:
+                i = int(pick * len(live))
+                live[i], live[-1] = live[-1], live[i]
+                a.free_block(live.pop())
+            else:
+                base = a.first_fit(size)
+                if base is not None:
+                    live.append(base)
+    return run
+
+def _setup_tlb(n, frames, seed, tmp_dir):
+    from Module_1_Paging_Engine.tlb import TLB
+    pages = synthetic_pages(n, frames, seed).tolist()
+    ways = min(4, frames)
+    tlb = TLB(size=frames // ways * ways, associativity=ways)
+    def run():
+        lookup, insert = tlb.lookup, tlb.insert
+        for g in pages:
+            if lookup(0, g) is None:
+                insert(0, g, g)
+    return run
+
+def _setup_sweep(n, frames, seed, tmp_dir):
+    from Combined_Demo_Tool.analytics import sweep
+    trace = os.path.join(tmp_dir, "trace.csv")
+    write_csv(generate_chunks(n, "zipf", pids=32, segment_pages=8, seed=seed), trace)
+    out = os.path.join(tmp_dir, "analytics.csv")
+    return lambda: sweep(trace, frames_min=frames, frames_max=frames, out_csv=out)
+
+# name -> (setup(n, frames, seed, tmp_dir) returning the timed callable, depends on frames);
+# tmp_dir is a scratch directory removed after the case
+CASES: Dict[str, tuple] = {
+    "segmentation": (_setup_segmentation, False),
+    "segmentation_batch": (_setup_segmentation_batch, False),
+    "paging": (_setup_paging, True),
+    **{f"replacer:{name}": (_replacer_setup(name), True) for name in REPLACERS},
+    "allocator": (_setup_allocator, False),
+    "tlb": (_setup_tlb, True),
+    "sweep": (_setup_sweep, True),
+}
+
+def run_case(name: str, n: int, frames: int, seed: int = 0, repeats: int = 3) -> Dict:
+    """Run one case in this process (warm-up plus `repeats` timed runs); events are discarded."""
+    event_bus.BUS.set_sinks([event_bus.NullSink()])
+    setup, _ = CASES[name]
+    times = []
+    with tempfile.TemporaryDirectory(prefix="vm_bench_") as tmp_dir:
+        fn: Callable[[], object] = setup(n, frames, seed, tmp_dir)
+        tracemalloc.start()
+        try:
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        while len(times) < repeats or (sum(times) < MIN_SECONDS and len(times) < MAX_REPEATS):
+            fn = setup(n, frames, seed, tmp_dir)
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+    best = min(times)
+    return {"case": name, "accesses": n, "frames": frames, "repeats": len(times),
+            "seconds": best, "seconds_median": statistics.median(times),
+            "accesses_per_sec": n / best if best > 0 else float("inf"),
+            "peak_alloc_kb": peak // 1024}
+
+def run_isolated(name: str, n: int, frames: int, seed: int = 0, repeats: int = 3) -> Dict:
+    out = subprocess.run([sys.executable, "-m", "benchmarks.run_benchmarks", "--one", name, str(n), str(frames),
+                          "--seed", str(seed), "--repeats", str(repeats)], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def _key(r: Dict) -> tuple:
+    return r["case"], r["accesses"], r["frames"]
+
+def compare(results: List[Dict], baseline: List[Dict], threshold_pct: float) -> List[str]:
+    """Describe every case whose throughput or peak allocation regressed beyond threshold_pct."""
+    base = {_key(r): r for r in baseline}
+    limit = threshold_pct / 100.0
+    problems = []
+    for r in results:
+        b = base.get(_key(r))
+        if b is None:
+            continue
+        label = "{} n={} frames={}".format(*_key(r))
+        if r["accesses_per_sec"] < b["accesses_per_sec"] * (1 - limit):
+            problems.append(f"{label}: {r['accesses_per_sec']:.0f} accesses/s vs baseline {b['accesses_per_sec']:.0f}")
+        # reports written before peak_alloc_kb existed only carry throughput
+        if "peak_alloc_kb" in b and r["peak_alloc_kb"] > b["peak_alloc_kb"] * (1 + limit):
+            problems.append(f"{label}: peak allocation {r['peak_alloc_kb']} kB vs baseline {b['peak_alloc_kb']} kB")
+    return problems
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=None)
+    parser.add_argument("--frames", type=int, nargs="+", default=None)
+    parser.add_argument("--full", action="store_true", help="sizes 1e3..1e7 and frames 4..65536")
+    parser.add_argument("--cases", nargs="+", default=list(CASES), choices=list(CASES), metavar="CASE")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=3, help="minimum timed runs per case (best is reported)")
+    parser.add_argument("--output", help="write the JSON report here (default: stdout)")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed regression in percent")
+    parser.add_argument("--one", nargs=3, metavar=("CASE", "N", "FRAMES"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.one:
+        name, n, frames = args.one
+        print(json.dumps(run_case(name, int(n), int(frames), args.seed, args.repeats)))
+        return 0
+
+    sizes = args.sizes or (FULL_SIZES if args.full else DEFAULT_SIZES)
+    frame_counts = args.frames or (FULL_FRAMES if args.full else DEFAULT_FRAMES)
+    results = []
+    for name in args.cases:
+        uses_frames = CASES[name][1]
+        for n in sizes:
+            for frames in (frame_counts if uses_frames else frame_counts[:1]):
+                r = run_isolated(name, n, frames, args.seed, args.repeats)
+                results.append(r)
+                print(f"{name:<20}{n:>10}{frames:>8}{r['accesses_per_sec']:>14.0f}/s{r['peak_alloc_kb']:>10} kB",
+                      file=sys.stderr)
+    report = {"python": platform.python_version(), "machine": platform.machine(), "results": results}
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        problems = compare(results, baseline, args.threshold)
+        for p in problems:
+            print(f"REGRESSION {p}", file=sys.stderr)
+        return 1 if problems else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
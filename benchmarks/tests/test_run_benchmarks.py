@@ -0,0 +1,38 @@
+import os
+import tempfile
+from benchmarks import run_benchmarks
+from benchmarks.run_benchmarks import compare, run_case
+from Module_1_Paging_Engine.event_bus import BUS
+
+def _row(case, aps, kb=None, frames=4):
+    r = {"case": case, "accesses": 1000, "frames": frames, "accesses_per_sec": aps}
+    if kb is not None:
+        r["peak_alloc_kb"] = kb
+    return r
+
+def test_compare_flags_only_regressions_beyond_threshold():
+    baseline = [_row("paging", 1000.0, 100), _row("tlb", 1000.0, 100), _row("sweep", 1000.0)]
+    results = [
+        _row("paging", 950.0, 105),     # within 10%
+        _row("tlb", 850.0, 120),        # both regressed
+        _row("sweep", 2000.0, 10**6),   # old baseline without allocation data: throughput only
+        _row("allocator", 1.0, 10**6),  # not in the baseline
+        _row("paging", 1.0, 10**6, frames=64),
+    ]
+    problems = compare(results, baseline, 10.0)
+    assert len(problems) == 2
+    assert problems[0].startswith("tlb n=1000 frames=4: 850 accesses/s")
+    assert "peak allocation 120 kB vs baseline 100 kB" in problems[1]
+    assert compare(results, baseline, 50.0) == []
+
+def test_run_case_repeats_and_cleans_up(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    monkeypatch.setattr(run_benchmarks, "MIN_SECONDS", 0.0)
+    saved = list(BUS.sinks)
+    try:
+        r = run_case("sweep", 200, 4, repeats=2)
+    finally:
+        BUS.set_sinks(saved)
+    assert r["repeats"] == 2 and r["seconds"] <= r["seconds_median"]
+    assert r["peak_alloc_kb"] > 0
+    assert os.listdir(tmp_path) == []